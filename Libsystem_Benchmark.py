@@ -0,0 +1,417 @@
+import argparse
+import contextlib
+import itertools
+import json
+import multiprocessing
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource  # Windows에는 없음
+except ImportError:
+    resource = None
+
+from Libsystem_Main import (
+    DataManager, MyDate, SharedDates, get_user_home_path, DATA_FILE_NAMES,
+    BookRecord, ISBNRecord, AuthorRecord, IsbnAuthorRecord, PublisherRecord,
+)
+from Libsystem_SQLite import SQLiteDataManager
+from Libsystem_Generator import DatasetGenerator, make_isbn13
+
+
+""" ========== 시작 시간(데이터 파일 읽기) 측정 ========== """
+def benchmark_startup(dir_path: str, repeat: int=5) -> dict:
+    """_summary_
+    순차 읽기와 병렬 읽기(프로세스 풀)의 read_data_files 소요 시간(초) 비교
+    """
+    results = {}
+
+    for parallel in (False, True):
+        times = []
+        for _ in range(repeat):
+            bookData = DataManager(file_path=dir_path)
+
+            start = time.perf_counter()
+            done, message = bookData.read_data_files(verbose=False, parallel=parallel, use_manifest=False)
+            times.append(time.perf_counter() - start)
+
+            if not done:
+                raise RuntimeError(message)
+
+        results["parallel" if parallel else "sequential"] = {
+            "min": min(times),
+            "median": statistics.median(times),
+        }
+
+    return results
+
+
+""" ========== 대출/로그 파일 읽기 방식(일반, mmap) 비교 ========== """
+def measure_read(dir_path: str, use_mmap: bool) -> dict:
+    bookData = DataManager(file_path=dir_path)
+
+    start = time.perf_counter()
+    done, message = bookData.read_data_files(verbose=False, use_manifest=False, use_mmap=use_mmap)
+    elapsed = time.perf_counter() - start
+
+    if not done:
+        raise RuntimeError(message)
+
+    # 최대 메모리 사용량(RSS, KB 단위 - Linux 기준)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    return {"seconds": elapsed, "peak_rss_kb": peak_rss}
+
+
+def benchmark_mapped_read(dir_path: str) -> dict:
+    """_summary_
+    최대 메모리 사용량이 섞이지 않도록 방식마다 새 프로세스에서 read_data_files 실행
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+
+    for use_mmap in (False, True):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results["mmap" if use_mmap else "default"] = executor.submit(measure_read, dir_path, use_mmap).result()
+
+    return results
+
+
+""" ========== 문자열 intern, 날짜 공유 여부에 따른 메모리 비교 ========== """
+def measure_shared_values(dir_path: str, share_values: bool) -> dict:
+    bookData = DataManager(file_path=dir_path)
+    bookData.share_values = share_values
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    done, message = bookData.read_data_files(verbose=False, use_manifest=False)
+    elapsed = time.perf_counter() - start
+    traced_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if not done:
+        raise RuntimeError(message)
+
+    return {
+        "seconds": elapsed,
+        "traced_bytes": traced_bytes,
+        "peak_traced_bytes": peak_bytes,
+        "distinct_dates": len({id(book.register_date) for book in bookData.book_table} | {id(borrow.borrow_date) for borrow in bookData.borrow_table}),
+    }
+
+
+def benchmark_shared_values(dir_path: str) -> dict:
+    """_summary_
+    데이터를 읽은 뒤 남아있는 메모리(tracemalloc 기준)를 값 공유 사용/미사용으로 비교
+    앞 방식의 메모리가 섞이지 않도록 방식마다 새 프로세스에서 실행
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+
+    for share_values in (False, True):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results["shared" if share_values else "distinct"] = executor.submit(measure_shared_values, dir_path, share_values).result()
+
+    return results
+
+
+""" ========== 날짜 변환 처리량 ========== """
+# 이전 방식(split, map(int), assert와 예외 처리)의 날짜 변환 (비교용)
+def parse_date_legacy(text: str) -> MyDate:
+    try:
+        year, month, day = map(int, text.split("-"))
+
+        assert 1582 < year, "년도는 1582보다 큰 정수여야 합니다."
+        assert 1 <= month <= 12, "월은 1과 12사이의 정수여야 합니다."
+        assert MyDate.validate_day(year, month, day), "년도와 월에 대해 일이 올바른 범위를 벗어났습니다."
+
+        return MyDate(year, month, day)
+
+    except Exception:
+        return None
+
+
+def benchmark_date_parser(count: int) -> dict:
+    """_summary_
+    10년치 날짜 문자열을 반복하여 count번 변환하는 초당 처리량 비교
+    legacy: 이전 방식, from_str: 고정 폭 변환, shared: 고정 폭 변환 + 메모이제이션 (SharedDates)
+    잘못된 문자열은 count / 10번 변환
+    """
+    start_date = MyDate(2015, 1, 1)
+    texts = [str(start_date + days) for days in range(3650)]
+    invalid_texts = ["2024-13-01", "2023-02-29", "2024-1-5", "2024/01/01", "abcd-ef-gh"]
+    parsers = {
+        "legacy": parse_date_legacy,
+        "from_str": MyDate.from_str,
+        "shared": SharedDates().__getitem__,
+    }
+    results = {}
+
+    for name, parse in parsers.items():
+        start = time.perf_counter()
+        for text in itertools.islice(itertools.cycle(texts), count):
+            parse(text)
+        results[name] = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for text in itertools.islice(itertools.cycle(invalid_texts), count // 10):
+            parse(text)
+        results[f"{name}_invalid"] = (count // 10) / (time.perf_counter() - start)
+
+    return {"dates": count, "dates_per_second": results}
+
+
+""" ========== 저장소(데이터 파일, SQLite) 비교 ========== """
+def measure_storage(manager: DataManager, repeat: int) -> dict:
+    times = {"read": [], "fetch": [], "lookup": []}
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        done, message = manager.read_data_files(verbose=False, use_manifest=False)
+        times["read"].append(time.perf_counter() - start)
+
+        if not done:
+            raise RuntimeError(message)
+
+        start = time.perf_counter()
+        manager.fetch_data_file()
+        times["fetch"].append(time.perf_counter() - start)
+
+        # 모든 사용자, ISBN, 책을 한 번씩 검색
+        start = time.perf_counter()
+        for user in manager.user_table:
+            manager.search_user_by_phone_number(user.phone_number)
+        for isbn in manager.isbn_table:
+            manager.search_isbn_data(isbn.isbn)
+            manager.search_author_ids_by_isbn(isbn.isbn)
+        for book in manager.book_table:
+            manager.search_book_by_id(book.book_id, include_deleted=True)
+        times["lookup"].append(time.perf_counter() - start)
+
+    return {name: min(values) for name, values in times.items()}
+
+
+def benchmark_storage(dir_path: str, repeat: int=5) -> dict:
+    """_summary_
+    같은 데이터를 데이터 파일과 SQLite 저장소로 읽기, 저장, 검색하는 시간(초) 비교
+    원본 데이터가 바뀌지 않도록 임시 폴더에 복사해서 측정
+    """
+    results = {}
+
+    for storage in ("file", "sqlite"):
+        with tempfile.TemporaryDirectory() as temp_path:
+            shutil.copytree(os.path.join(dir_path, "data"), os.path.join(temp_path, "data"))
+            shutil.copy(os.path.join(dir_path, "Libsystem_Config.json"), temp_path)
+
+            if storage == "file":
+                manager = DataManager(file_path=temp_path)
+            else:
+                manager = SQLiteDataManager(file_path=temp_path)
+                # 첫 실행의 데이터 파일 가져오기는 측정에서 제외
+                manager.read_data_files(verbose=False)
+
+            results[storage] = measure_storage(manager, repeat)
+
+            if storage == "sqlite":
+                manager.storage.close()
+
+    return results
+
+
+""" ========== 대용량(책 수백만 권) 동작 확인 ========== """
+def benchmark_scale(dir_path: str, num_books: int, books_per_isbn: int=10) -> dict:
+    """_summary_
+    ISBN-13과 num_books권의 책 데이터를 임시 폴더에 저장 후 다시 읽고, 주요 동작의 소요 시간(초) 측정
+    """
+    results = {"books": num_books}
+
+    with tempfile.TemporaryDirectory() as temp_path:
+        shutil.copy(os.path.join(dir_path, "Libsystem_Config.json"), temp_path)
+
+        register_date = MyDate(2024, 1, 1)
+        manager = DataManager(file_path=temp_path)
+        manager.create_data_files()
+        manager.set_today(MyDate(2025, 1, 1))
+
+        isbns = [make_isbn13(i) for i in range((num_books + books_per_isbn - 1) // books_per_isbn)]
+        manager.publisher_table = [PublisherRecord(0, "출판사", False)]
+        manager.author_table = [AuthorRecord(1, "저자", False)]
+        manager.isbn_table = [ISBNRecord(isbn, f"책{i}", 0, 2000, register_date) for i, isbn in enumerate(isbns)]
+        manager.isbn_author_table = [IsbnAuthorRecord(isbn, 1) for isbn in isbns]
+        manager.book_table = [BookRecord(book_id, isbns[book_id // books_per_isbn], register_date, None, False) for book_id in range(num_books)]
+
+        start = time.perf_counter()
+        if not manager.fetch_data_file():
+            raise RuntimeError("데이터 파일 저장 실패")
+        results["fetch"] = time.perf_counter() - start
+        del manager
+
+        manager = DataManager(file_path=temp_path)
+        start = time.perf_counter()
+        done, message = manager.read_data_files(verbose=False, use_manifest=False)
+        results["read"] = time.perf_counter() - start
+
+        if not done:
+            raise RuntimeError(message)
+        if len(manager.book_table) != num_books or manager.get_static_id() != num_books:
+            raise RuntimeError("읽은 책 수가 올바르지 않습니다.")
+
+        manager.set_today(MyDate(2025, 1, 1))
+        last_book_id = num_books - 1
+        last_isbn = isbns[-1]
+
+        operations = {
+            "check_book_id_validate": lambda: manager.check_book_id_validate(str(last_book_id), 1),
+            "check_isbn_validate": lambda: manager.check_isbn_validate(str(last_isbn)),
+            "search_book_by_id": lambda: manager.search_book_by_id(last_book_id),
+            "search_isbn_data": lambda: manager.search_isbn_data(last_isbn),
+            "search_books_by_isbn": lambda: manager.search_books_by_isbn(last_isbn),
+            "print_book": lambda: manager.print_book(last_book_id, include_borrow=True),
+            "search_title_author_book": lambda: manager.search_title_author_book(f"책{len(isbns) - 1}"),
+            "increase_static_id": lambda: manager.increase_static_id(),
+        }
+        for name, operation in operations.items():
+            start = time.perf_counter()
+            if not operation():
+                raise RuntimeError(f"{name} 실패")
+            results[name] = time.perf_counter() - start
+
+    return results
+
+
+""" ========== DataManager 주요 동작 측정 (데이터 크기별) ========== """
+def time_operation(operation, repeat: int) -> float:
+    """_summary_
+    operation을 repeat번 실행한 소요 시간(초) 중 최솟값 (출력은 버림)
+    """
+    times = []
+    with open(os.devnull, "w", encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            operation()
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_suite(dir_path: str, sizes: list[int], repeat: int=5) -> dict:
+    """_summary_
+    책 수마다 생성기로 만든 데이터(대출 5배, 로그 15배)로 읽기, 저장, 검색, 전체 출력, 대출/반납, 연혁 조회, 인기 도서 조회, 파일별 검사 시간(초) 측정
+    입력을 받지 않는 메서드(search_content_book, process_borrow, process_return, print_history 등)를 직접 호출
+    """
+    results = {}
+
+    for num_books in sizes:
+        with tempfile.TemporaryDirectory() as temp_path:
+            shutil.copy(os.path.join(dir_path, "Libsystem_Config.json"), temp_path)
+            generator = DatasetGenerator(temp_path, books=num_books, loans=num_books * 5, logs=num_books * 15)
+            generator.generate()
+
+            manager = DataManager(file_path=temp_path)
+            done, message = manager.read_data_files(verbose=False, use_manifest=False)
+            if not done:
+                raise RuntimeError(message)
+            manager.set_today(MyDate.from_str(generator.last_date))
+
+            # 대출 중이 아닌 책, 제목 검색어, 연혁이 가장 긴 책
+            book_id = next(book.book_id for book in manager.book_table if not book.deleted and book.book_id not in manager.open_borrows)
+            keyword = manager.isbn_table[0].title.split()[-1]
+            history_book_id = manager.log_table[-1].book_id if manager.log_table[-1].book_id is not None else book_id
+            borrows = []
+
+            operations = {
+                "read_data_files": lambda: DataManager(file_path=temp_path).read_data_files(verbose=False, use_manifest=False),
+                "fetch_data_file": manager.fetch_data_file,
+                "search_content_book": lambda: manager.search_content_book(keyword),
+                "print_book_all": manager.print_book_all,
+                "process_borrow": lambda: borrows.append(manager.process_borrow(book_id, 0)),
+                "process_return": lambda: manager.process_return(borrows.pop()),
+                "print_history": lambda: manager.print_history(history_book_id),
+                "get_popular_books": lambda: manager.get_popular_books(30),
+            }
+            for table_name in DATA_FILE_NAMES:
+                operations[f"check_data_{table_name}_files"] = lambda table_name=table_name: getattr(manager, f"check_data_{table_name}_files")(temp_path)
+
+            size_results = {}
+            for name, operation in operations.items():
+                # 대출/반납은 번갈아 실행해야 하므로 한 번씩 번갈아 측정
+                if name == "process_borrow":
+                    borrow_times, return_times = [], []
+                    for _ in range(repeat):
+                        borrow_times.append(time_operation(operation, 1))
+                        return_times.append(time_operation(operations["process_return"], 1))
+                    size_results["process_borrow"] = min(borrow_times)
+                    size_results["process_return"] = min(return_times)
+                elif name != "process_return":
+                    size_results[name] = time_operation(operation, repeat)
+
+            results[str(num_books)] = size_results
+
+    return results
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """_summary_
+    기준 결과보다 threshold 비율 이상 느려진 항목 목록
+    """
+    regressions = []
+
+    for size, size_results in results.items():
+        for name, seconds in size_results.items():
+            base = baseline.get(size, dict()).get(name)
+            if base and seconds > base * (1 + threshold):
+                regressions.append(f"books={size} {name}: {base:.6f}s -> {seconds:.6f}s ({(seconds / base - 1) * 100:+.0f}%)")
+
+    return regressions
+
+
+""" ========== main ========== """
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Libsystem 성능 측정")
+    parser.add_argument("--path", default=get_user_home_path(), help="data 폴더와 Libsystem_Config.json이 있는 경로")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--scale", type=int, default=0, help="대용량 동작 확인에 사용할 책 수 (0이면 생략, 예: 10000000)")
+    parser.add_argument("--dates", type=int, default=0, help="날짜 변환 처리량 측정에 사용할 날짜 수 (0이면 생략, 예: 10000000)")
+    parser.add_argument("--sizes", default="", help="주요 동작을 측정할 책 수 목록 (쉼표로 구분, 예: 1000,5000,20000)")
+    parser.add_argument("--suite-only", action="store_true", help="주요 동작 측정만 실행")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON 파일 (주요 동작 측정 결과)")
+    parser.add_argument("--save-baseline", default=None, help="주요 동작 측정 결과를 기준 결과로 저장할 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.2, help="기준보다 이 비율 이상 느려지면 성능 저하로 표시")
+    args = parser.parse_args()
+
+    results = dict()
+    if not args.suite_only:
+        results["startup"] = benchmark_startup(args.path, args.repeat)
+        results["mapped_read"] = benchmark_mapped_read(args.path)
+        results["shared_values"] = benchmark_shared_values(args.path)
+        results["storage"] = benchmark_storage(args.path, args.repeat)
+        if args.scale > 0:
+            results["scale"] = benchmark_scale(args.path, args.scale)
+        if args.dates > 0:
+            results["date_parser"] = benchmark_date_parser(args.dates)
+
+    regressions = []
+    if args.sizes:
+        results["suite"] = benchmark_suite(args.path, [int(size) for size in args.sizes.split(",")], args.repeat)
+
+        if args.save_baseline:
+            with open(args.save_baseline, "w", encoding='utf-8') as f:
+                json.dump(results["suite"], f, indent=4)
+
+        if args.baseline:
+            with open(args.baseline, "r", encoding='utf-8') as f:
+                regressions = compare_with_baseline(results["suite"], json.load(f), args.threshold)
+            results["regressions"] = regressions
+
+    print(json.dumps(results, indent=4))
+
+    # 성능 저하가 있으면 종료 코드 1
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+import argparse
+import os
+import random
+from array import array
+from datetime import date
+from os.path import join as opj
+
+from Libsystem_Main import DataManager, DATA_FILE_NAMES, MANIFEST_FILE_NAME
+
+
+""" ========== 한국어 이름, 제목 재료 ========== """
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황", "안", "송", "류", "홍"]
+GIVEN_NAME_SYLLABLES = [
+    "민", "서", "지", "현", "준", "수", "영", "우", "진", "하", "윤", "은", "도", "예", "성",
+    "재", "호", "연", "경", "승", "희", "정", "태", "유", "원", "혜", "주", "동", "소", "다",
+]
+TITLE_ADJECTIVES = ["작은", "푸른", "오래된", "잃어버린", "따뜻한", "조용한", "새로운", "마지막", "비밀의", "하얀", "깊은", "먼"]
+TITLE_NOUNS = ["정원", "바다", "도시", "여행", "기억", "편지", "숲", "별", "시간", "노래", "집", "길", "섬", "계절", "밤", "강", "마을", "창문"]
+PUBLISHER_WORDS = ["한빛", "푸른", "새봄", "나무", "바람", "햇살", "열린", "다솜", "누리", "가람", "별빛", "마루"]
+PUBLISHER_SUFFIXES = ["출판사", "북스", "미디어", "출판", "문고"]
+
+
+def make_isbn13(number: int) -> int:
+    """_summary_
+    978 + 9자리 번호 + 체크 숫자로 ISBN-13 생성
+    """
+    digits = f"978{number:09d}"
+    check_digit = (10 - sum(int(digit) * (3 if i % 2 else 1) for i, digit in enumerate(digits)) % 10) % 10
+    return int(digits + str(check_digit))
+
+
+def make_person_name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_NAME_SYLLABLES) + rng.choice(GIVEN_NAME_SYLLABLES)
+
+
+def make_title(rng: random.Random) -> str:
+    form = rng.randrange(3)
+    if form == 0:
+        return f"{rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}"
+    if form == 1:
+        return f"{rng.choice(TITLE_NOUNS)}의 {rng.choice(TITLE_NOUNS)}"
+    return f"{rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}의 {rng.choice(TITLE_NOUNS)}"
+
+
+# 출판사 이름은 중복되지 않아야 함 (조합을 다 쓰면 번호를 붙임)
+def make_publisher_name(publisher_id: int) -> str:
+    combinations = len(PUBLISHER_WORDS) * len(PUBLISHER_SUFFIXES)
+    word = PUBLISHER_WORDS[publisher_id % len(PUBLISHER_WORDS)]
+    suffix = PUBLISHER_SUFFIXES[publisher_id // len(PUBLISHER_WORDS) % len(PUBLISHER_SUFFIXES)]
+    return f"{word}{suffix}" + (f" {publisher_id // combinations + 1}" if publisher_id >= combinations else "")
+
+
+# 사용자 ID마다 서로 다른 전화번호 (0 ~ 10^8-1 범위의 일대일 대응)
+def make_phone_number(user_id: int) -> str:
+    number = (user_id * 48271 + 12345) % 100000000
+    return f"010-{number // 10000:04d}-{number % 10000:04d}"
+
+
+""" ========== 데이터 생성 ========== """
+class DatasetGenerator(object):
+    """_summary_
+    하루 단위로 입고, 반납, 삭제, 대출, ISBN 수정을 시뮬레이션하여 서로 참조가 맞는 Libsystem_Data_*.txt 생성
+    대출/로그 파일은 만들어지는 대로 파일에 쓰므로 메모리 사용량은 책, 사용자 수에만 비례
+    """
+    def __init__(self, file_path: str, books: int, loans: int, logs: int=0, isbns: int=None, authors: int=None,
+                 publishers: int=None, users: int=None, start: date=date(2015, 1, 1), days: int=3650,
+                 borrow_days: int=7, max_borrow_count: int=3, overdue_rate: float=0.2, overdue_penalty_scale: float=1.0,
+                 delete_rate: float=0.01, initial_stock: float=0.3, seed: int=0):
+        self.file_path = file_path
+        self.books = books
+        self.loans = loans
+        self.logs = logs
+        self.isbns = min(books, isbns if isbns is not None else max(1, books // 3))
+        self.authors = authors if authors is not None else max(1, self.isbns // 2)
+        self.publishers = publishers if publishers is not None else max(1, self.isbns // 100)
+        self.users = users if users is not None else max(10, books // 5)
+        self.start = start.toordinal()
+        self.days = days
+        self.borrow_days = borrow_days
+        self.max_borrow_count = max_borrow_count
+        self.overdue_rate = overdue_rate
+        self.overdue_penalty_scale = overdue_penalty_scale
+        self.delete_rate = delete_rate
+        self.initial_books = int(books * initial_stock)
+        self.rng = random.Random(seed)
+
+        # 날짜 문자열 캐시 (시뮬레이션 기간 + 여유)
+        self.date_strs = [date.fromordinal(self.start + day).isoformat() for day in range(days + 400)]
+
+        # 생성 결과 개수
+        self.counts = {table_name: 0 for table_name in DATA_FILE_NAMES}
+
+    def date_str(self, day: int) -> str:
+        if day < len(self.date_strs):
+            return self.date_strs[day]
+        return date.fromordinal(self.start + day).isoformat()
+
+    # 책 고유번호 순서대로 입고 (initial_stock 비율만큼 첫날 입고, 나머지는 기간 동안 고르게)
+    def register_day(self, book_id: int) -> int:
+        if book_id < self.initial_books:
+            return 0
+        return 1 + (book_id - self.initial_books) * (self.days - 1) // max(1, self.books - self.initial_books)
+
+    # 같은 ISBN의 책(복본)은 연속된 고유번호
+    def isbn_index(self, book_id: int) -> int:
+        return book_id * self.isbns // self.books
+
+    def first_book_id(self, isbn_index: int) -> int:
+        return (isbn_index * self.books + self.isbns - 1) // self.isbns
+
+    def data_path(self, table_name: str) -> str:
+        return opj(self.file_path, "data", DATA_FILE_NAMES[table_name])
+
+    def generate(self) -> dict:
+        os.makedirs(opj(self.file_path, "data"), exist_ok=True)
+
+        # 이전 검사 결과는 새 데이터와 맞지 않으므로 삭제
+        if os.path.exists(opj(self.file_path, "data", MANIFEST_FILE_NAME)):
+            os.remove(opj(self.file_path, "data", MANIFEST_FILE_NAME))
+
+        self.write_publishers()
+        self.write_authors()
+        self.write_users()
+        self.write_isbns()
+        deleted_days = self.simulate()
+        self.write_books(deleted_days)
+
+        return self.counts
+
+    def write_publishers(self) -> None:
+        with open(self.data_path("publisher"), "w", encoding='utf-8') as f:
+            for publisher_id in range(self.publishers):
+                f.write(f"{publisher_id}/{make_publisher_name(publisher_id)}/0\n")
+        self.counts["publisher"] = self.publishers
+
+    def write_authors(self) -> None:
+        with open(self.data_path("author"), "w", encoding='utf-8') as f:
+            for author_id in range(1, self.authors + 1):
+                f.write(f"{author_id}/{make_person_name(self.rng)}/0\n")
+        self.counts["author"] = self.authors
+
+    def write_users(self) -> None:
+        with open(self.data_path("user"), "w", encoding='utf-8') as f:
+            for user_id in range(self.users):
+                f.write(f"{user_id}/{make_phone_number(user_id)}/{make_person_name(self.rng)}/0\n")
+        self.counts["user"] = self.users
+
+    # ISBN 등록일은 첫 복본의 입고일, 출판년도는 등록 년도 이전
+    def write_isbns(self) -> None:
+        with open(self.data_path("isbn"), "w", encoding='utf-8') as isbn_file, open(self.data_path("isbn_author"), "w", encoding='utf-8') as isbn_author_file:
+            for isbn_index in range(self.isbns):
+                isbn = make_isbn13(isbn_index)
+                register_day = self.register_day(self.first_book_id(isbn_index))
+                register_year = date.fromordinal(self.start + register_day).year
+                published_year = self.rng.randint(max(1583, register_year - 60), register_year)
+                isbn_file.write(f"{isbn}/{make_title(self.rng)}/{self.rng.randrange(self.publishers)}/{published_year}/{self.date_str(register_day)}\n")
+
+                # 공동 저자는 최대 3명
+                for author_id in sorted(self.rng.sample(range(1, self.authors + 1), min(self.authors, self.rng.choice((1, 1, 1, 2, 2, 3))))):
+                    isbn_author_file.write(f"{isbn}/{author_id}\n")
+                    self.counts["isbn_author"] += 1
+
+        self.counts["isbn"] = self.isbns
+
+    def write_books(self, deleted_days: dict) -> None:
+        with open(self.data_path("book"), "w", encoding='utf-8') as f:
+            f.write(f"{self.books}\n")
+            for book_id in range(self.books):
+                register_date = self.date_str(self.register_day(book_id))
+                isbn = make_isbn13(self.isbn_index(book_id))
+                if book_id in deleted_days:
+                    f.write(f"{book_id}/{isbn}/{register_date}/1/{self.date_str(deleted_days[book_id])}\n")
+                else:
+                    f.write(f"{book_id}/{isbn}/{register_date}/0/\n")
+        self.counts["book"] = self.books
+
+    # ========== 하루 단위 시뮬레이션 (대출, 로그, 연체 패널티) ========== #
+    def simulate(self) -> dict:
+        rng = self.rng
+        last_day = self.days - 1
+
+        # 대출 가능한 책 (위치 배열로 O(1) 삭제)
+        available = array("q")
+        available_pos = array("q", [-1]) * self.books
+        on_loan = bytearray(self.books)
+
+        # 사용자별 대출 중인 책 수, 연체 패널티 (종료일, 패널티 고유번호)
+        open_counts = bytearray(self.users)
+        penalty_end = array("q", [-1]) * self.users
+        penalty_id_of_user = array("q", [-1]) * self.users
+        penalties = []  # [사용자, 시작일, 종료일]
+
+        returns = {}  # 반납일 -> [(대출 고유번호, 책, 사용자, 반납 예정일)]
+        pending_deletes = {}  # 삭제일 -> [책]
+        deleted_days = {}
+        log_id = 0
+        borrow_id = 0
+        registered = 0
+
+        def add_available(book_id):
+            available_pos[book_id] = len(available)
+            available.append(book_id)
+
+        def remove_available(book_id):
+            pos = available_pos[book_id]
+            last = available.pop()
+            if last != book_id:
+                available[pos] = last
+                available_pos[last] = pos
+            available_pos[book_id] = -1
+
+        with open(self.data_path("borrow"), "w", encoding='utf-8') as borrow_file, open(self.data_path("log"), "w", encoding='utf-8') as log_file:
+            for day in range(self.days):
+                today = self.date_str(day)
+                log_lines = []
+                borrow_lines = []
+
+                # 1. 입고
+                while registered < self.books and self.register_day(registered) == day:
+                    book_id = registered
+                    add_available(book_id)
+                    log_lines.append(f"{log_id}/{make_isbn13(self.isbn_index(book_id))}/{book_id}//{today}/BOOK_REGISTER\n")
+                    log_id += 1
+                    registered += 1
+
+                    # 일부 책은 나중에 삭제
+                    if rng.random() < self.delete_rate:
+                        delete_day = rng.randint(day + 30, day + 30 + self.days)
+                        if delete_day <= last_day:
+                            pending_deletes.setdefault(delete_day, []).append(book_id)
+
+                # 2. 반납 (연체 시 반납일부터 연체일 x 배율만큼 패널티, 진행 중인 패널티가 있으면 연장)
+                for returned_id, book_id, user_id, due_day in returns.pop(day, []):
+                    log_lines.append(f"{log_id}/{make_isbn13(self.isbn_index(book_id))}/{book_id}/{returned_id}/{today}/BOOK_RETURN\n")
+                    log_id += 1
+                    on_loan[book_id] = 0
+                    open_counts[user_id] -= 1
+                    add_available(book_id)
+
+                    penalty_days = int((day - due_day) * self.overdue_penalty_scale)
+                    if day > due_day and penalty_days > 0:
+                        if penalty_end[user_id] >= day:
+                            penalty_end[user_id] += penalty_days
+                            penalties[penalty_id_of_user[user_id]][2] = penalty_end[user_id]
+                        else:
+                            penalty_end[user_id] = day + penalty_days - 1
+                            penalty_id_of_user[user_id] = len(penalties)
+                            penalties.append([user_id, day, penalty_end[user_id]])
+
+                # 3. 삭제 (대출 중인 책은 반납 다음 날로 미룸)
+                for book_id in pending_deletes.pop(day, []):
+                    if on_loan[book_id]:
+                        if day < last_day:
+                            pending_deletes.setdefault(day + 1, []).append(book_id)
+                        continue
+                    remove_available(book_id)
+                    deleted_days[book_id] = day
+                    log_lines.append(f"{log_id}/{make_isbn13(self.isbn_index(book_id))}/{book_id}//{today}/BOOK_DELETE\n")
+                    log_id += 1
+
+                # 4. 대출 (대출 한도를 넘었거나 패널티 중인 사용자는 건너뜀)
+                for _ in range(self.loans * (day + 1) // self.days - self.loans * day // self.days):
+                    if not available:
+                        break
+
+                    for _ in range(10):
+                        user_id = rng.randrange(self.users)
+                        if open_counts[user_id] < self.max_borrow_count and penalty_end[user_id] < day:
+                            break
+                    else:
+                        continue
+
+                    book_id = available[rng.randrange(len(available))]
+                    remove_available(book_id)
+                    on_loan[book_id] = 1
+                    open_counts[user_id] += 1
+
+                    due_day = day + self.borrow_days
+                    if rng.random() < self.overdue_rate:
+                        return_day = due_day + 1 + min(90, int(rng.expovariate(1 / 6)))
+                    else:
+                        return_day = day + rng.randint(0, self.borrow_days)
+
+                    # 마지막 날 이후에 반납될 대출은 반납되지 않은 상태로 남음
+                    if return_day <= last_day:
+                        returns.setdefault(return_day, []).append((borrow_id, book_id, user_id, due_day))
+                        actual_return_date = self.date_str(return_day)
+                    else:
+                        actual_return_date = ""
+
+                    borrow_lines.append(f"{borrow_id}/{book_id}/{user_id}/{today}/{self.date_str(due_day)}/{actual_return_date}/0\n")
+                    log_lines.append(f"{log_id}/{make_isbn13(self.isbn_index(book_id))}/{book_id}/{borrow_id}/{today}/BOOK_BORROW\n")
+                    log_id += 1
+                    borrow_id += 1
+
+                # 5. ISBN 수정 (그날까지의 목표 로그 수에 모자란 만큼)
+                for _ in range(self.logs * (day + 1) // self.days - log_id):
+                    if registered == 0:
+                        break
+                    log_lines.append(f"{log_id}/{make_isbn13(self.isbn_index(rng.randrange(registered)))}///{today}/ISBN_EDIT\n")
+                    log_id += 1
+
+                borrow_file.writelines(borrow_lines)
+                log_file.writelines(log_lines)
+
+        with open(self.data_path("overdue_penalty"), "w", encoding='utf-8') as f:
+            for penalty_id, (user_id, start_day, end_day) in enumerate(penalties):
+                f.write(f"{penalty_id}/{user_id}/{self.date_str(start_day)}/{self.date_str(end_day)}\n")
+
+        self.counts["borrow"] = borrow_id
+        self.counts["log"] = log_id
+        self.counts["overdue_penalty"] = len(penalties)
+        self.last_date = self.date_str(last_day)
+
+        return deleted_days
+
+
+""" ========== main ========== """
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Libsystem 대용량 테스트 데이터 생성")
+    parser.add_argument("--path", required=True, help="데이터를 만들 경로 (<path>/data에 Libsystem_Data_*.txt 생성, 기존 파일은 덮어씀)")
+    parser.add_argument("--books", type=int, default=1000000, help="책 수")
+    parser.add_argument("--loans", type=int, default=10000000, help="대출 수")
+    parser.add_argument("--logs", type=int, default=0, help="목표 로그 수 (입고/삭제/대출/반납 로그가 모자라면 ISBN 수정 로그로 채움)")
+    parser.add_argument("--isbns", type=int, default=None, help="ISBN 수 (기본값: 책 수 / 3)")
+    parser.add_argument("--users", type=int, default=None, help="사용자 수 (기본값: 책 수 / 5)")
+    parser.add_argument("--days", type=int, default=3650, help="시뮬레이션 기간(일)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--verify", action="store_true", help="생성 후 read_data_files로 검사")
+    args = parser.parse_args()
+
+    generator = DatasetGenerator(args.path, books=args.books, loans=args.loans, logs=args.logs, isbns=args.isbns,
+                                 users=args.users, days=args.days, seed=args.seed)
+    counts = generator.generate()
+
+    for table_name, count in counts.items():
+        print(f"{count} {table_name}")
+    print(f"마지막 날짜: {generator.last_date} (프로그램 실행 시 이 날짜 이후를 입력)")
+
+    if args.verify:
+        done, message = DataManager(file_path=args.path).read_data_files(verbose=False, use_manifest=False)
+        print("검사 통과" if done else f"ERROR: {message}")
+
+
+if __name__ == "__main__":
+    main()
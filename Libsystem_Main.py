@@ -3,12 +3,311 @@ from datetime import datetime
 import re
 import json
 import shutil
+import zlib
+import mmap
+import sys
+import time
+import bisect
+import heapq
+import itertools
+import math
+import argparse
+from abc import ABC, abstractmethod
+import cProfile
+import pstats
+import tracemalloc
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 
 opj = os.path.join
 
+# 데이터 파일 이름 (읽는 순서대로)
+DATA_FILE_NAMES = {
+    "publisher": "Libsystem_Data_Publisher.txt",
+    "isbn": "Libsystem_Data_Isbn.txt",
+    "book": "Libsystem_Data_Book.txt",
+    "author": "Libsystem_Data_Author.txt",
+    "isbn_author": "Libsystem_Data_IsbnAuthor.txt",
+    "user": "Libsystem_Data_User.txt",
+    "borrow": "Libsystem_Data_Borrow.txt",
+    "overdue_penalty": "Libsystem_Data_OverduePenalty.txt",
+    "log": "Libsystem_Data_Log.txt",
+}
+
+# 각 데이터 파일이 참조하는 데이터 파일 (참조 무결성 검사 대상)
+DATA_FILE_DEPENDENCIES = {
+    "publisher": [],
+    "isbn": ["publisher"],
+    "book": ["isbn"],
+    "author": [],
+    "isbn_author": ["isbn", "author"],
+    "user": [],
+    "borrow": ["book", "user"],
+    "overdue_penalty": ["user"],
+    "log": ["isbn", "book", "borrow"],
+}
+
+# 검사를 통과한 데이터 파일의 크기, 수정 시각, 해시를 저장하는 파일
+MANIFEST_FILE_NAME = "Libsystem_Data_Manifest.json"
+
+# mmap으로 읽을 수 있는 (크기가 커지는) 데이터 파일
+MAPPED_TABLE_NAMES = ["borrow", "log"]
+
+# 지연 로드할 수 있는 (연혁 조회에만 전체가 필요한) 데이터 파일
+HISTORY_TABLE_NAMES = ["borrow", "log"]
+
+# 데이터 로드 시 출력하는 테이블 이름
+DATA_TABLE_LABELS = {
+    "publisher": "Publisher",
+    "isbn": "ISBN",
+    "book": "Book",
+    "author": "Author",
+    "isbn_author": "ISBN - Author",
+    "user": "User",
+    "borrow": "Borrow",
+    "overdue_penalty": "Overdue Penalty",
+    "log": "Log",
+}
+
+# 고유번호(책, 대출, 사용자 등)의 최댓값 (64비트 부호 있는 정수)
+MAX_RECORD_ID = 2**63 - 1
+
+# 실행 시간 측정 결과를 저장하는 파일 (설정의 metrics가 1인 경우)
+METRICS_FILE_NAME = "Libsystem_Metrics.json"
+
+# 실행 시간 히스토그램 구간의 상한(ms), 마지막 구간은 상한 없음
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+# 프로파일링 결과를 저장하는 폴더 (data 폴더와 같은 경로, 실행마다 하위 폴더 생성)
+PROFILE_DIR_NAME = "profile"
+
+# 인기 도서 집계 기간(일), 0은 전체 기간
+POPULARITY_WINDOWS = (7, 30, 0)
+
+# 인기 도서/저자 조회 시 출력하는 순위 수
+POPULAR_TOP_K = 10
+
+# ISBN별로 미리 계산해두는 함께 대출한 책 추천 수
+RECOMMEND_TOP_N = 5
+
+# 검색 결과를 나누어 보여주는 기준 (출판사, 출판 연대, 저자)과 기준별 출력 수
+FACET_LABELS = {"publisher": "출판사", "decade": "출판 연대", "author": "저자"}
+FACET_TOP_K = 5
+
+# 조건 검색에 쓰는 제목 n-gram 길이 (한글 제목은 단어가 짧아 2글자)
+TITLE_NGRAM_SIZE = 2
+
+# 검색 결과가 없을 때 보여주는 비슷한 책 (저자 이름 최대 편집 거리, 제목 n-gram 최소 일치 비율, 저자/제목별 출력 수)
+FUZZY_MAX_DISTANCE = 2
+FUZZY_MIN_SIMILARITY = 0.5
+FUZZY_TOP_K = 5
+
+# 제목, 저자 이름 자동 완성 후보 수
+AUTOCOMPLETE_TOP_N = 10
+
+
+""" ========== ISBN 형식 ========== """
+# 기존 데이터의 두 자리 ISBN(00~99)과 13자리 ISBN-13(978, 979로 시작)을 모두 정수로 저장
+def is_valid_isbn(text: str) -> bool:
+    if not (text.isascii() and text.isdigit()):
+        return False
+    
+    if len(text) == 2:
+        return True
+    
+    if len(text) != 13 or text[:3] not in ("978", "979"):
+        return False
+    
+    # 체크 숫자 검사 (자리마다 1, 3을 번갈아 곱한 합이 10의 배수)
+    return sum(int(digit) * (3 if i % 2 else 1) for i, digit in enumerate(text)) % 10 == 0
+
+# 정수 ISBN을 파일/화면 형식으로 변환 (두 자리 ISBN은 앞에 0을 채움)
+def format_isbn(isbn: int) -> str:
+    return str(isbn).zfill(2)
+
+
+""" ========== 실행 시간 측정 (진단) ========== """
+# 현재 프로세스가 읽고 쓴 바이트 수 (Linux의 /proc/self/io 기준, 없는 운영체제에서는 None)
+def read_io_counters() -> tuple[int, int]:
+    try:
+        with open("/proc/self/io", "r") as f:
+            counters = dict(line.split(": ") for line in f.read().splitlines())
+        return (int(counters["rchar"]), int(counters["wchar"]))
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+class Metrics(object):
+    """_summary_
+    동작별 실행 횟수, 실행 시간 히스토그램, 읽고 쓴 바이트 수 기록
+    """
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.operations: dict[str, dict] = dict()
+        
+        # 측정 래퍼를 씌운 DataManager 메서드 이름
+        self.wrapped_names: list[str] = []
+
+    def record(self, name: str, seconds: float, io_bytes: tuple[int, int]=None) -> None:
+        stat = self.operations.setdefault(name, {
+            "count": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+            "read_bytes": 0,
+            "written_bytes": 0,
+        })
+        
+        elapsed_ms = seconds * 1000
+        stat["count"] += 1
+        stat["total_ms"] += elapsed_ms
+        stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+        stat["histogram"][bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        
+        if io_bytes is not None:
+            stat["read_bytes"] += io_bytes[0]
+            stat["written_bytes"] += io_bytes[1]
+
+    def measure(self, name: str, func, *args, **kwargs):
+        io_before = read_io_counters()
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            io_after = read_io_counters()
+            io_bytes = None
+            if io_before is not None and io_after is not None:
+                io_bytes = (io_after[0] - io_before[0], io_after[1] - io_before[1])
+            self.record(name, elapsed, io_bytes)
+
+    def wrap(self, name: str, func):
+        def timed(*args, **kwargs):
+            return self.measure(name, func, *args, **kwargs)
+        return timed
+
+    # 히스토그램에서 q 분위가 속한 구간의 상한(ms)
+    @staticmethod
+    def get_percentile_ms(stat: dict, q: float) -> str:
+        target = stat["count"] * q
+        cumulative = 0
+        for i, count in enumerate(stat["histogram"]):
+            cumulative += count
+            if cumulative >= target:
+                return f"<={LATENCY_BUCKETS_MS[i]}" if i < len(LATENCY_BUCKETS_MS) else f">{LATENCY_BUCKETS_MS[-1]}"
+        return "-"
+
+    def report(self) -> str:
+        lines = [f"<동작 / 횟수 / 평균(ms) / p50(ms) / p95(ms) / 최대(ms) / 읽기(B) / 쓰기(B)> ({self.started_at:%Y-%m-%d %H:%M:%S} 이후)"]
+        for name, stat in sorted(self.operations.items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(
+                f"{name} / {stat['count']} / {stat['total_ms'] / stat['count']:.2f} / "
+                f"{self.get_percentile_ms(stat, 0.5)} / {self.get_percentile_ms(stat, 0.95)} / {stat['max_ms']:.2f} / "
+                f"{stat['read_bytes']} / {stat['written_bytes']}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, file_path: str) -> None:
+        data = {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "ended_at": datetime.now().isoformat(timespec="seconds"),
+            "latency_buckets_ms": LATENCY_BUCKETS_MS,
+            "operations": self.operations,
+        }
+        with open(opj(file_path, METRICS_FILE_NAME), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+
+""" ========== 프로파일링 (진단) ========== """
+class Profiler(object):
+    """_summary_
+    --profile로 실행한 경우 명령마다 cProfile 결과(.prof)와 메모리 할당 상위 목록(_alloc.txt) 저장
+    종료 시 전체 세션의 cProfile 결과(session.prof)와 요약(session_summary.txt) 저장
+    cProfile은 실제 경과 시간 기준이므로 입력 대기 시간은 input 항목에 포함됨
+    """
+    def __init__(self, file_path: str, top_allocations: int=20):
+        self.output_path = opj(file_path, PROFILE_DIR_NAME, datetime.now().strftime("%Y%m%d_%H%M%S"))
+        os.makedirs(self.output_path, exist_ok=True)
+        
+        self.top_allocations = top_allocations
+        self.command_count = 0
+        self.session_stats: pstats.Stats = None
+        
+        tracemalloc.start()
+
+    def run(self, name: str, func, *args, **kwargs):
+        self.command_count += 1
+        file_name = f"{self.command_count:03d}_{name}"
+        
+        profile = cProfile.Profile()
+        tracemalloc.reset_peak()
+        snapshot_before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        
+        try:
+            return profile.runcall(func, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            snapshot_after = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            
+            profile.dump_stats(opj(self.output_path, f"{file_name}.prof"))
+            if self.session_stats is None:
+                self.session_stats = pstats.Stats(profile)
+            else:
+                self.session_stats.add(profile)
+            
+            self.write_allocations(opj(self.output_path, f"{file_name}_alloc.txt"), name, elapsed, current, peak, snapshot_before, snapshot_after)
+
+    def wrap(self, name: str, func):
+        def profiled(*args, **kwargs):
+            return self.run(name, func, *args, **kwargs)
+        return profiled
+
+    # 명령 실행 전후 스냅샷을 비교해 늘어난 메모리가 큰 순서대로 저장
+    def write_allocations(self, file_path: str, name: str, elapsed: float, current: int, peak: int, snapshot_before, snapshot_after) -> None:
+        trace_filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ]
+        differences = snapshot_after.filter_traces(trace_filters).compare_to(snapshot_before.filter_traces(trace_filters), "lineno")
+        
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(f"{name}: {elapsed * 1000:.2f} ms, 현재 메모리 {current} B, 최대 메모리 {peak} B\n")
+            f.write(f"<메모리 할당 상위 {self.top_allocations}개 (실행 전후 차이)>\n")
+            for difference in differences[:self.top_allocations]:
+                f.write(f"{difference}\n")
+
+    def close(self) -> None:
+        tracemalloc.stop()
+        
+        if self.session_stats is None:
+            return
+        
+        self.session_stats.dump_stats(opj(self.output_path, "session.prof"))
+        with open(opj(self.output_path, "session_summary.txt"), "w", encoding="utf-8") as f:
+            self.session_stats.stream = f
+            self.session_stats.sort_stats("cumulative").print_stats(40)
+        
+        print(f"프로파일링 결과를 저장했습니다: {self.output_path}")
+
 
 """ ========== 날짜 클래스 구현 ========== """
+# 평년 기준 각 달의 일수, 각 달 1일 전날까지의 일수 (인덱스 1 = 1월)
+DAYS_IN_MONTH = [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+DAYS_BEFORE_MONTH = [0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+
+# 1년 1월 1일부터 1583년 1월 1일 전날까지의 일수 (MyDate의 ordinal 기준점)
+DAYS_BEFORE_1583 = 1582 * 365 + 1582 // 4 - 1582 // 100 + 1582 // 400
+
+
 class MyDate(object):
+    """_summary_
+    변경할 수 없는 날짜 (dict의 키, set의 원소로 사용 가능)
+    생성 시 1583년 1월 1일부터의 일수(ordinal)를 한 번 계산하고, 비교와 해시는 ordinal로 수행
+    """
+    __slots__ = ("year", "month", "day", "ordinal")
+    
     def __init__(self, year, month, day):
         assert type(year) is int
         assert type(month) is int
@@ -18,29 +317,54 @@ class MyDate(object):
         assert 1 <= month <= 12, "월은 1과 12사이의 정수여야 합니다."
         assert self.validate_day(year, month, day), "년도와 월에 대해 일이 올바른 범위를 벗어났습니다."
         
-        self.year = year
-        self.month = month
-        self.day = day
+        object.__setattr__(self, "year", year)
+        object.__setattr__(self, "month", month)
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "ordinal", MyDate.days_before(year, month) + day - 1 - DAYS_BEFORE_1583)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("MyDate는 변경할 수 없습니다.")
+    
+    def __delattr__(self, name):
+        raise AttributeError("MyDate는 변경할 수 없습니다.")
+    
+    # pickle(프로세스 풀) 시 __setattr__을 거치지 않고 생성자로 복원
+    def __reduce__(self):
+        return (MyDate, (self.year, self.month, self.day))
+    
+    def __hash__(self):
+        return hash(self.ordinal)
 
     def __str__(self):
         return f"{self.year}-{str(self.month).zfill(2)}-{str(self.day).zfill(2)}"
 
     @classmethod
-    def from_str(self, text: str) -> object:
-        try:
-            year, month, day = map(int, text.split("-"))
-            
-            assert 1582 < year, "년도는 1582보다 큰 정수여야 합니다."
-            assert 1 <= month <= 12, "월은 1과 12사이의 정수여야 합니다."
-            assert self.validate_day(year, month, day), "년도와 월에 대해 일이 올바른 범위를 벗어났습니다."
-            
-            return MyDate(year, month, day)
-            
-        except Exception as e:
-            # print(e)
-            # print("텍스트 " + text +"을(를) 날짜로 변환할 수 없습니다.")
-
+    def from_str(cls, text: str) -> object:
+        """_summary_
+        고정 폭 'YYYY-MM-DD' 문자열을 MyDate로 변환 (예외 없이 검사, 올바르지 않으면 None)
+        """
+        if not text or len(text) != 10 or text[4] != "-" or text[7] != "-" or not text.isascii():
+            return None
+        
+        year_text, month_text, day_text = text[:4], text[5:7], text[8:]
+        if not (year_text.isdigit() and month_text.isdigit() and day_text.isdigit()):
             return None
+        
+        year, month, day = int(year_text), int(month_text), int(day_text)
+        if year <= 1582 or not cls.validate_day(year, month, day):
+            return None
+        
+        return cls.from_valid(year, month, day)
+    
+    # 이미 검사한 값으로 생성 (생성자의 검사 생략)
+    @classmethod
+    def from_valid(cls, year: int, month: int, day: int) -> object:
+        date = object.__new__(cls)
+        object.__setattr__(date, "year", year)
+        object.__setattr__(date, "month", month)
+        object.__setattr__(date, "day", day)
+        object.__setattr__(date, "ordinal", cls.days_before(year, month) + day - 1 - DAYS_BEFORE_1583)
+        return date
 
     @classmethod
     def is_leap_year(self, year):
@@ -50,26 +374,28 @@ class MyDate(object):
 
     @classmethod
     def validate_day(self, year, month, day):
-        # 각 달의 일수 (평년 기준)
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    
-        # 2월의 일수를 윤년 여부에 따라 업데이트
-        if self.is_leap_year(year):
-            days_in_month[1] = 29
-    
-        # month와 day의 유효성을 체크
+        # month와 day의 유효성을 체크 (2월의 일수는 윤년 여부에 따라 29일)
         if month < 1 or month > 12:
             return False
-        if day < 1 or day > days_in_month[month - 1]:
+        if day < 1 or day > DAYS_IN_MONTH[month] + (month == 2 and self.is_leap_year(year)):
             return False
     
         return True
     
+    # 1년 1월 1일부터 year년 month월 1일 전날까지의 일수 (그레고리력)
+    @classmethod
+    def days_before(cls, year, month):
+        y = year - 1
+        days = y * 365 + y // 4 - y // 100 + y // 400 + DAYS_BEFORE_MONTH[month]
+        if month > 2 and cls.is_leap_year(year):
+            days += 1
+        return days
+    
     # 연산자 구현
     def __eq__(self, other):
         if not isinstance(other, MyDate):
             return False
-        return (self.year, self.month, self.day) == (other.year, other.month, other.day)
+        return self.ordinal == other.ordinal
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -77,60 +403,49 @@ class MyDate(object):
     def __lt__(self, other):
         if not isinstance(other, MyDate):
             return False
-        return (self.year, self.month, self.day) < (other.year, other.month, other.day)
+        return self.ordinal < other.ordinal
 
     def __le__(self, other):
         if not isinstance(other, MyDate):
             return False
-        return (self.year, self.month, self.day) <= (other.year, other.month, other.day)
+        return self.ordinal <= other.ordinal
 
     def __gt__(self, other):
         if not isinstance(other, MyDate):
             return False
-        return (self.year, self.month, self.day) > (other.year, other.month, other.day)
+        return self.ordinal > other.ordinal
 
     def __ge__(self, other):
         if not isinstance(other, MyDate):
             return False
-        return (self.year, self.month, self.day) >= (other.year, other.month, other.day)
+        return self.ordinal >= other.ordinal
     
     def to_ordinal(self):
-        # 1583년 1월 1일을 기준으로 일수 계산
-        days = 0
-        for y in range(1583, self.year):
-            days += 366 if self.is_leap_year(y) else 365
-
-        days_in_month = [31, 29 if self.is_leap_year(self.year) else 28, 31, 30, 31, 30, 
-                         31, 31, 30, 31, 30, 31]
-        days += sum(days_in_month[:self.month - 1])
-        days += self.day - 1  # 1월 1일을 0으로 시작하기 위해 -1
-        
-        return days
+        # 1583년 1월 1일을 0으로 하는 일수 (생성 시 계산)
+        return self.ordinal
 
     @classmethod
     def from_ordinal(cls, days):
-        # 1583년 1월 1일을 기준으로 날짜 생성
-        year = 1583
-        while True:
-            days_in_year = 366 if cls.is_leap_year(year) else 365
-            if days < days_in_year:
-                break
-            days -= days_in_year
-            year += 1
-
-        days_in_month = [31, 29 if cls.is_leap_year(year) else 28, 31, 30, 31, 30, 
-                         31, 31, 30, 31, 30, 31]
-
-        month = 1
-        for dim in days_in_month:
-            if days < dim:
-                break
-            days -= dim
-            month += 1
-
-        day = days + 1  # 1월 1일부터 시작하기 위해 +1
-
-        return cls(year, month, day)
+        # 1583년 1월 1일을 기준으로 날짜 생성 (400년, 100년, 4년, 1년 주기로 나누어 계산)
+        n = days + DAYS_BEFORE_1583
+        n400, n = divmod(n, 146097)
+        n100, n = divmod(n, 36524)
+        n4, n = divmod(n, 1461)
+        n1, n = divmod(n, 365)
+        year = n400 * 400 + n100 * 100 + n4 * 4 + n1 + 1
+        
+        # 윤년의 마지막 날 (12월 31일)
+        if n1 == 4 or n100 == 4:
+            return cls.from_valid(year - 1, 12, 31)
+        
+        leap = cls.is_leap_year(year)
+        month = (n + 50) >> 5
+        preceding = DAYS_BEFORE_MONTH[month] + (month > 2 and leap)
+        if preceding > n:
+            month -= 1
+            preceding -= DAYS_IN_MONTH[month] + (month == 2 and leap)
+
+        return cls.from_valid(year, month, n - preceding + 1)
 
     def __add__(self, days):
         if not isinstance(days, int):
@@ -147,6 +462,18 @@ class MyDate(object):
         else:
             raise TypeError("빼기 연산은 정수 또는 MyDate 객체여야 합니다.")
 
+
+class SharedDates(dict):
+    """_summary_
+    날짜 문자열 -> MyDate (데이터 검사, 로드 한 번 동안 같은 날짜 문자열은 같은 MyDate 객체를 공유)
+    올바르지 않은 문자열(빈 문자열 포함)은 저장하지 않고 None 반환
+    """
+    def __missing__(self, text: str) -> MyDate:
+        date = MyDate.from_str(text)
+        if date is not None:
+            self[text] = date
+        return date
+
 """ ========== 데이터 테이블 구현 ========== """
 # Book
 class BookRecord(object):
@@ -158,7 +485,7 @@ class BookRecord(object):
         self.delete_date = delete_date
         
     def __str__(self):
-        return f"{self.book_id}/{str(self.isbn).zfill(2)}/{self.register_date}/{self.deleted}/{'' if self.delete_date is None else self.delete_date}"
+        return f"{self.book_id}/{format_isbn(self.isbn)}/{self.register_date}/{self.deleted}/{'' if self.delete_date is None else self.delete_date}"
 
 # ISBN
 class ISBNRecord(object):
@@ -170,7 +497,7 @@ class ISBNRecord(object):
         self.isbn_register_date = isbn_register_date
         
     def __str__(self):
-        return f"{str(self.isbn).zfill(2)}/{self.title}/{self.publisher_id}/{self.published_year}/{self.isbn_register_date}"
+        return f"{format_isbn(self.isbn)}/{self.title}/{self.publisher_id}/{self.published_year}/{self.isbn_register_date}"
         
 # Author
 class AuthorRecord(object):
@@ -189,7 +516,7 @@ class IsbnAuthorRecord(object):
         self.author_id = author_id
         
     def __str__(self):
-        return f"{str(self.isbn).zfill(2)}/{self.author_id}"
+        return f"{format_isbn(self.isbn)}/{self.author_id}"
         
 # Borrow
 class BorrowRecord(object):
@@ -247,12 +574,548 @@ class LogRecord(object):
         self.log_type: str = log_type
         
     def __str__(self):
-        return f"{self.log_id}/{str(self.isbn).zfill(2)}/{self.book_id}/{self.borrow_id}/{self.log_date}/{self.log_type}"
+        return f"{self.log_id}/{format_isbn(self.isbn)}/{self.book_id}/{self.borrow_id}/{self.log_date}/{self.log_type}"
+
+""" ========== mmap 레코드 구현 ========== """
+# mmap된 파일의 각 줄 (시작, 끝) 바이트 위치 (끝의 '\r'은 제외, 빈 줄 포함)
+def iter_mapped_lines(buffer) -> object:
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        
+        # Windows 줄바꿈(\r\n) 처리
+        line_end = end - 1 if end > start and buffer[end - 1] == 13 else end
+        yield (start, line_end)
+        
+        start = end + 1
+
+# 날짜 바이트를 MyDate로 변환 (같은 바이트는 dates에 저장한 결과를 사용, 올바르지 않은 날짜는 저장하지 않고 None)
+def mapped_date(dates: dict, field: bytes) -> object:
+    date = dates.get(field)
+    if date is None:
+        date = MyDate.from_str(field.decode("ascii", "replace"))
+        if date is not None:
+            dates[field] = date
+    return date
+
+class MappedRecord(ABC):
+    """_summary_
+    mmap된 데이터 파일의 한 줄(start ~ end 바이트)을 가리키는 레코드
+    필드에 처음 접근할 때 해당 필드만 디코딩하여 일반 속성으로 저장
+    필드 변환(convert_field)은 테이블마다 하위 클래스에서 구현
+    """
+    field_names: tuple = ()
+    
+    # 파일에서 읽은 뒤 필드 값을 바꾼 적이 있는지 (바꾸지 않았으면 저장할 때 원래 줄을 그대로 씀)
+    changed: bool = False
+    
+    def __init__(self, buffer: mmap.mmap, start: int, end: int):
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        
+    def __getattr__(self, name):
+        # 아직 디코딩하지 않은 필드에 접근할 때만 호출됨
+        if name not in self.field_names or self.__dict__.get("_buffer") is None:
+            raise AttributeError(name)
+        
+        # '/' 위치를 찾아 해당 필드의 바이트 범위 계산
+        buffer = self._buffer
+        start = self._start
+        for _ in range(self.field_names.index(name)):
+            start = buffer.find(b"/", start, self._end) + 1
+            
+        end = buffer.find(b"/", start, self._end)
+        if end == -1:
+            end = self._end
+            
+        value = self.convert_field(name, buffer[start:end].decode("utf-8"))
+        self.__dict__[name] = value
+        return value
+    
+    def __setattr__(self, name, value):
+        if name in self.field_names:
+            object.__setattr__(self, "changed", True)
+        object.__setattr__(self, name, value)
+    
+    @abstractmethod
+    def convert_field(self, name: str, text: str):
+        pass
+    
+    # 디코딩하지 않은 원래 줄 (줄바꿈 제외)
+    def raw_line(self) -> bytes:
+        return self._buffer[self._start:self._end]
+
+class MappedBorrowRecord(MappedRecord, BorrowRecord):
+    field_names = ("borrow_id", "book_id", "user_id", "borrow_date", "return_date", "actual_return_date", "deleted")
+    
+    def convert_field(self, name: str, text: str):
+        if name in ("borrow_id", "book_id", "user_id"):
+            return int(text)
+        if name == "deleted":
+            return bool(int(text))
+        return MyDate.from_str(text)
+
+class MappedLogRecord(MappedRecord, LogRecord):
+    field_names = ("log_id", "isbn", "book_id", "borrow_id", "log_date", "log_type")
+    
+    def convert_field(self, name: str, text: str):
+        if name in ("log_id", "isbn"):
+            return int(text)
+        if name in ("book_id", "borrow_id"):
+            return None if text == "" else int(text)
+        if name == "log_date":
+            return MyDate.from_str(text)
+        return sys.intern(text)
+
+""" ========== 인기 도서 집계 ========== """
+class BorrowPopularity(object):
+    """_summary_
+    집계 기간(최근 n일, 전체)별 ISBN, 저자의 대출 횟수와 상위 top_k개 목록
+    대출 로그가 추가될 때마다 더하고, 오늘 날짜가 바뀌면 기간을 벗어난 대출을 뺌
+    상위 목록은 횟수가 바뀐 항목만 보고 갱신하고, 목록 안의 항목이 줄어 밖의 항목과 순서가 바뀔 수 있을 때만 다시 계산함
+    """
+    def __init__(self, windows: tuple[int, ...]=POPULARITY_WINDOWS, top_k: int=POPULAR_TOP_K):
+        self.windows = windows
+        self.top_k = top_k
+        self.today_ordinal: int = None
+        
+        # 기간 -> {"isbn": ISBN -> 대출 횟수, "author": 저자 ID -> 대출 횟수}
+        self.counts: dict[int, dict[str, dict[int, int]]] = {days: {"isbn": dict(), "author": dict()} for days in windows}
+        
+        # 기간 -> 기간 안의 대출 (날짜 서수, ISBN, 저자 ID 목록), 날짜 순서 (전체 기간은 뺄 일이 없으므로 없음)
+        self.events: dict[int, deque] = {days: deque() for days in windows if days > 0}
+        
+        # (기간, 종류) -> 상위 top_k개 (번호, 대출 횟수), 횟수가 같으면 번호가 작은 순서 (None이면 다음 조회 때 다시 계산)
+        self.tops: dict[tuple[int, str], list[tuple[int, int]]] = {(days, kind): [] for days in windows for kind in ("isbn", "author")}
+
+    @staticmethod
+    def rank_key(item: tuple[int, int]) -> tuple[int, int]:
+        return (-item[1], item[0])
+
+    def change(self, days: int, kind: str, key: int, amount: int) -> None:
+        counts = self.counts[days][kind]
+        count = counts.get(key, 0) + amount
+        if count:
+            counts[key] = count
+        else:
+            del counts[key]
+        
+        top = self.tops[(days, kind)]
+        if top is None:
+            return
+        
+        in_top = any(item[0] == key for item in top)
+        
+        # 목록 밖의 항목이 줄면 목록은 그대로, 꽉 찬 목록 안의 항목이 줄면 밖의 항목이 앞설 수 있으므로 다시 계산
+        if amount < 0 and not in_top:
+            return
+        if amount < 0 and len(top) == self.top_k:
+            self.tops[(days, kind)] = None
+            return
+        
+        # 늘어난 항목 (또는 모든 항목이 들어있는 목록에서 줄어든 항목)만 다시 넣고 정렬
+        top = [item for item in top if item[0] != key]
+        if count:
+            top.append((key, count))
+            top.sort(key=self.rank_key)
+        self.tops[(days, kind)] = top[:self.top_k]
+
+    def add(self, date_ordinal: int, isbn: int, author_ids: tuple[int, ...]) -> None:
+        """_summary_
+        대출 한 건 추가 (날짜는 이전에 추가한 대출보다 빠르면 안 됨)
+        """
+        for days in self.windows:
+            # 이미 기간을 벗어난 대출
+            if days > 0 and self.today_ordinal is not None and date_ordinal <= self.today_ordinal - days:
+                continue
+            
+            self.change(days, "isbn", isbn, 1)
+            for author_id in author_ids:
+                self.change(days, "author", author_id, 1)
+            
+            if days > 0:
+                self.events[days].append((date_ordinal, isbn, author_ids))
+
+    def advance(self, today_ordinal: int) -> None:
+        """_summary_
+        오늘 날짜를 옮기고 기간을 벗어난 대출을 뺌 (날짜는 앞으로만 옮길 수 있음)
+        """
+        self.today_ordinal = today_ordinal
+        
+        for days, events in self.events.items():
+            while events and events[0][0] <= today_ordinal - days:
+                _, isbn, author_ids = events.popleft()
+                self.change(days, "isbn", isbn, -1)
+                for author_id in author_ids:
+                    self.change(days, "author", author_id, -1)
+
+    def top(self, days: int, kind: str, k: int) -> list[tuple[int, int]]:
+        """_summary_
+        대출 횟수 상위 k개 (ISBN 또는 저자 ID, 대출 횟수), 횟수가 같으면 번호가 작은 순서
+        """
+        if k > self.top_k:
+            return heapq.nsmallest(k, self.counts[days][kind].items(), key=self.rank_key)
+        
+        top = self.tops[(days, kind)]
+        if top is None:
+            top = self.tops[(days, kind)] = heapq.nsmallest(self.top_k, self.counts[days][kind].items(), key=self.rank_key)
+        return top[:k]
+
+
+""" ========== 함께 대출한 책 추천 ========== """
+class CoBorrowIndex(object):
+    """_summary_
+    같은 사용자가 함께 대출한 ISBN 쌍의 사용자 수(희소 행렬)와 ISBN별 상위 n개 추천 목록
+    횟수는 늘어나기만 하므로 추천 목록은 횟수가 바뀐 쌍만 보고 갱신함
+    """
+    def __init__(self, top_n: int=RECOMMEND_TOP_N):
+        self.top_n = top_n
+        
+        # 사용자 ID -> 대출한 적 있는 ISBN
+        self.isbns_by_user: dict[int, set[int]] = dict()
+        
+        # ISBN -> {함께 대출된 ISBN -> 두 책을 모두 대출한 사용자 수}
+        self.counts: dict[int, dict[int, int]] = dict()
+        
+        # ISBN -> 상위 n개 (ISBN, 사용자 수), 사용자 수가 같으면 ISBN이 작은 순서
+        self.top: dict[int, list[tuple[int, int]]] = dict()
+
+    @staticmethod
+    def rank_key(item: tuple[int, int]) -> tuple[int, int]:
+        return (-item[1], item[0])
+
+    def build(self, user_isbns) -> None:
+        """_summary_
+        (사용자 ID, ISBN) 목록으로 한 번에 계산 (쌍 세기는 Counter.update에 맡김)
+        """
+        for user_id, isbn in user_isbns:
+            self.isbns_by_user.setdefault(user_id, set()).add(isbn)
+        
+        pair_counts = Counter()
+        for isbns in self.isbns_by_user.values():
+            pair_counts.update(itertools.permutations(isbns, 2))
+        
+        for (isbn, other), count in pair_counts.items():
+            self.counts.setdefault(isbn, dict())[other] = count
+            
+        for isbn, others in self.counts.items():
+            self.top[isbn] = heapq.nsmallest(self.top_n, others.items(), key=self.rank_key)
+
+    def add(self, user_id: int, isbn: int) -> None:
+        """_summary_
+        대출 한 건 반영 (사용자가 이미 대출한 적 있는 ISBN이면 변화 없음)
+        """
+        isbns = self.isbns_by_user.setdefault(user_id, set())
+        if isbn in isbns:
+            return
+        
+        for other in isbns:
+            self.increase(isbn, other)
+            self.increase(other, isbn)
+        isbns.add(isbn)
+
+    def increase(self, isbn: int, other: int) -> None:
+        others = self.counts.setdefault(isbn, dict())
+        count = others.get(other, 0) + 1
+        others[other] = count
+        
+        # 다른 쌍의 횟수는 그대로이므로 바뀐 쌍만 다시 넣고 정렬해도 상위 n개가 유지됨
+        top = [item for item in self.top.get(isbn, []) if item[0] != other]
+        top.append((other, count))
+        top.sort(key=self.rank_key)
+        self.top[isbn] = top[:self.top_n]
+
+    def recommend(self, isbn: int) -> list[tuple[int, int]]:
+        return self.top.get(isbn, [])
+
+
+""" ========== 검색 결과 분류 (출판사, 출판 연대, 저자) ========== """
+# 고유번호 목록 -> 비트셋 (비트 i = 고유번호 i), bytearray에 모아 한 번에 정수로 변환
+def bits_from_ids(ids) -> int:
+    ids = list(ids)
+    if not ids:
+        return 0
+    
+    buffer = bytearray(max(ids) // 8 + 1)
+    for i in ids:
+        buffer[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buffer, "little")
+
+
+# 비트셋 -> 고유번호 목록 (오름차순), 64비트 단위로 0인 구간을 건너뜀
+def ids_from_bits(bits: int) -> list[int]:
+    data = bits.to_bytes((bits.bit_length() + 63) // 64 * 8, "little")
+    if sys.byteorder == "little":
+        words = memoryview(data).cast("Q")
+    else:
+        words = [int.from_bytes(data[i:i + 8], "little") for i in range(0, len(data), 8)]
+    
+    ids = []
+    for index, word in enumerate(words):
+        while word:
+            low = word & -word
+            ids.append(index * 64 + low.bit_length() - 1)
+            word ^= low
+    return ids
+
+
+class CatalogFacets(object):
+    """_summary_
+    오늘 기준으로 보이는 책의 출판사, 출판 연대, 저자별 권수와 출판 연대별 책 비트셋
+    검색 결과의 연대별 권수는 결과 비트셋과 AND 후 bit_count로 셈
+    출판사, 저자는 종류가 많아 값마다 책 수 길이의 비트셋을 두면 메모리가 커지므로 결과의 ISBN별 권수로 셈
+    """
+    def __init__(self):
+        # ISBN -> (출판사 ID, 출판 연대, 저자 ID 목록)
+        self.isbn_values: dict[int, tuple[int, int, tuple[int, ...]]] = dict()
+        
+        # 기준 -> {값 -> 권수}
+        self.counts: dict[str, dict[int, int]] = {kind: dict() for kind in FACET_LABELS}
+        
+        # 출판 연대 -> 책 비트셋 (삭제된 책 포함, 검색 결과에는 보이는 책만 있으므로 AND하면 제외됨)
+        self.decade_bits: dict[int, int] = dict()
+
+    def build(self, isbn_values: dict, books) -> None:
+        """_summary_
+        ISBN별 분류 값과 (책 ID, ISBN, 보이는 책 여부) 목록으로 한 번에 계산
+        """
+        self.isbn_values = isbn_values
+        decade_ids: dict[int, list[int]] = dict()
+        
+        for book_id, isbn, live in books:
+            values = isbn_values[isbn]
+            decade_ids.setdefault(values[1], []).append(book_id)
+            if live:
+                self.increase(values, 1)
+                
+        self.decade_bits = {decade: bits_from_ids(ids) for decade, ids in decade_ids.items()}
+
+    def increase(self, values: tuple[int, int, tuple[int, ...]], amount: int) -> None:
+        publisher_id, decade, author_ids = values
+        for kind, keys in (("publisher", (publisher_id,)), ("decade", (decade,)), ("author", author_ids)):
+            counts = self.counts[kind]
+            for key in keys:
+                count = counts.get(key, 0) + amount
+                if count:
+                    counts[key] = count
+                else:
+                    del counts[key]
+
+    # 보이는 책 추가 (새로 등록한 책)
+    def add(self, book_id: int, isbn: int, values: tuple[int, int, tuple[int, ...]]) -> None:
+        values = self.isbn_values.setdefault(isbn, values)
+        self.decade_bits[values[1]] = self.decade_bits.get(values[1], 0) | (1 << book_id)
+        self.increase(values, 1)
+
+    # 보이지 않게 된 책 제외 (삭제, 삭제 날짜 경과)
+    def remove(self, isbn: int) -> None:
+        self.increase(self.isbn_values[isbn], -1)
+
+    @staticmethod
+    def ranked(counts: dict[int, int]) -> list[tuple[int, int]]:
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def count_all(self) -> dict[str, list[tuple[int, int]]]:
+        return {kind: self.ranked(counts) for kind, counts in self.counts.items()}
+
+    def count_results(self, books: list) -> dict[str, list[tuple[int, int]]]:
+        """_summary_
+        검색 결과(보이는 책 목록)의 기준별 (값, 권수), 권수가 많은 순서
+        """
+        result_bits = bits_from_ids(book.book_id for book in books)
+        decades = {decade: (bits & result_bits).bit_count() for decade, bits in self.decade_bits.items()}
+        
+        publishers: dict[int, int] = dict()
+        authors: dict[int, int] = dict()
+        for isbn, count in Counter(book.isbn for book in books).items():
+            publisher_id, _, author_ids = self.isbn_values[isbn]
+            publishers[publisher_id] = publishers.get(publisher_id, 0) + count
+            for author_id in author_ids:
+                authors[author_id] = authors.get(author_id, 0) + count
+        
+        return {
+            "publisher": self.ranked(publishers),
+            "decade": self.ranked({decade: count for decade, count in decades.items() if count}),
+            "author": self.ranked(authors),
+        }
+
+
+""" ========== 제목 n-gram 인덱스 ========== """
+class TitleNgramIndex(object):
+    """_summary_
+    제목의 n-gram -> ISBN 집합
+    검색어의 n-gram을 모두 가진 ISBN만 제목에 검색어가 포함되는지 직접 비교 (검색어가 n글자보다 짧으면 전체 비교)
+    """
+    def __init__(self, n: int=TITLE_NGRAM_SIZE):
+        self.n = n
+        self.titles: dict[int, str] = dict()
+        self.isbns_by_gram: dict[str, set[int]] = dict()
+
+    def grams(self, text: str) -> set[str]:
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+
+    def add(self, isbn: int, title: str) -> None:
+        self.titles[isbn] = title
+        for gram in self.grams(title):
+            self.isbns_by_gram.setdefault(gram, set()).add(isbn)
+
+    def remove(self, isbn: int) -> None:
+        for gram in self.grams(self.titles.pop(isbn)):
+            isbns = self.isbns_by_gram[gram]
+            isbns.discard(isbn)
+            if not isbns:
+                del self.isbns_by_gram[gram]
+
+    def similar(self, text: str, min_similarity: float) -> list[tuple[float, int]]:
+        """_summary_
+        text의 n-gram 중 제목에 있는 비율이 min_similarity 이상인 (비율, ISBN), 비율이 높은 순서
+        비율이 같으면 제목 n-gram과의 자카드 유사도가 높은(제목이 짧은) 순서
+        """
+        grams = self.grams(text)
+        if not grams:
+            return []
+        
+        # 최소 required개의 n-gram이 일치해야 하므로, 가장 드문 n-gram (len - required + 1)개 중 하나는 반드시 포함됨
+        required = max(1, math.ceil(min_similarity * len(grams)))
+        postings = sorted((self.isbns_by_gram.get(gram, set()) for gram in grams), key=len)
+        candidates = set().union(*postings[:len(grams) - required + 1])
+        
+        results = []
+        for isbn in candidates:
+            count = sum(isbn in posting for posting in postings)
+            if count < required:
+                continue
+            jaccard = count / (len(grams) + len(self.grams(self.titles[isbn])) - count)
+            results.append((count / len(grams), jaccard, isbn))
+            
+        results.sort(key=lambda item: (-item[0], -item[1], item[2]))
+        return [(similarity, isbn) for similarity, _, isbn in results]
+
+    def search(self, text: str) -> list[int]:
+        """_summary_
+        제목에 text가 포함된 ISBN 목록
+        """
+        grams = self.grams(text)
+        if grams:
+            candidate_sets = sorted((self.isbns_by_gram.get(gram, set()) for gram in grams), key=len)
+            candidates = candidate_sets[0].intersection(*candidate_sets[1:])
+        else:
+            candidates = self.titles
+        
+        return [isbn for isbn in candidates if text in self.titles[isbn]]
+
+
+""" ========== 비슷한 이름 검색 (편집 거리, BK-tree) ========== """
+# 두 문자열의 편집 거리 (삽입, 삭제, 교체 각 1)
+def edit_distance(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+        
+    return previous[-1]
+
+
+class BKTree(object):
+    """_summary_
+    편집 거리 기준 BK-tree (노드: [단어, {부모와의 거리 -> 자식 노드}])
+    찾는 단어와 노드의 거리가 d이면 삼각 부등식에 따라 거리 d - k ~ d + k인 자식만 내려감
+    """
+    def __init__(self):
+        self.root: list = None
+
+    def add(self, word: str) -> None:
+        if self.root is None:
+            self.root = [word, dict()]
+            return
+        
+        node = self.root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                return
+            
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, dict()]
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """_summary_
+        편집 거리가 max_distance 이하인 (거리, 단어), 거리가 가까운 순서
+        """
+        results = []
+        stack = [] if self.root is None else [self.root]
+        
+        while stack:
+            node_word, children = stack.pop()
+            distance = edit_distance(word, node_word)
+            if distance <= max_distance:
+                results.append((distance, node_word))
+            
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+                    
+        results.sort()
+        return results
+
+
+""" ========== 자동 완성 (정렬 배열) ========== """
+class PrefixIndex(object):
+    """_summary_
+    중복 없이 정렬한 문자열 배열 (같은 문자열은 개수만 셈)
+    접두어로 시작하는 문자열은 정렬 순서상 붙어 있으므로 bisect로 시작 위치를 찾고 n개만 읽음
+    """
+    def __init__(self, words=()):
+        self.counts: dict[str, int] = Counter(words)
+        self.words: list[str] = sorted(self.counts)
+
+    def add(self, word: str) -> None:
+        count = self.counts.get(word, 0)
+        if count == 0:
+            bisect.insort(self.words, word)
+        self.counts[word] = count + 1
+
+    def remove(self, word: str) -> None:
+        count = self.counts[word] - 1
+        if count:
+            self.counts[word] = count
+            return
+        
+        del self.counts[word]
+        del self.words[bisect.bisect_left(self.words, word)]
+
+    def complete(self, prefix: str, n: int) -> list[str]:
+        """_summary_
+        prefix로 시작하는 문자열 n개 (정렬 순서)
+        """
+        results = []
+        for i in range(bisect.bisect_left(self.words, prefix), len(self.words)):
+            if len(results) == n or not self.words[i].startswith(prefix):
+                break
+            results.append(self.words[i])
+        return results
+
 
 """ ========== 도서 관리 클래스 구현 ========== """
 class DataManager(object):
     def __init__(self, file_path: str):
         self.file_path = file_path
+        
+        # 지연 로드 중인 테이블 (테이블 이름 -> {"sep": 구분자, "size": 파일의 레코드 수})
+        self.deferred_tables: dict = dict()
+        
         self.book_table: list[BookRecord] = []
         self.isbn_table: list[ISBNRecord] = []
         self.author_table: list[AuthorRecord] = []
@@ -266,6 +1129,68 @@ class DataManager(object):
         self.config = dict()
         self.static_id = 0  # default is 0
 
+        # 현재 날짜 검사용 최댓값 (데이터 로드 및 변경 시 갱신)
+        self.latest_register_date: MyDate = None
+        self.latest_borrow_date: MyDate = None
+        self.latest_published_year: int = None
+        
+        # 반납되지 않은 대출 (책 ID -> 대출 레코드)
+        self.open_borrows: dict[int, BorrowRecord] = dict()
+        
+        # 오늘 기준으로 보이는 책 (책 ID -> 책 레코드, 고유번호 순서), 삭제 날짜가 오늘 이후인 책 (삭제 날짜 서수, 책 ID) 최소 힙
+        self.live_books: dict[int, BookRecord] = dict()
+        self.pending_deletes: list[tuple[int, int]] = []
+        
+        # 오늘 기준으로 보이는 책의 비트셋 (비트 i = 고유번호 i인 책, 조건 검색용)
+        self.live_bits: int = 0
+        
+        # 기간별 대출 횟수 (처음 조회할 때 로그에서 만들고, 이후 대출 로그가 추가될 때마다 갱신)
+        self.popularity: BorrowPopularity = None
+        
+        # 함께 대출한 책 (처음 조회할 때 대출 기록에서 만들고, 이후 대출할 때마다 갱신)
+        self.co_borrows: CoBorrowIndex = None
+        
+        # 출판사, 출판 연대, 저자별 권수 (처음 조회할 때 만들고, 이후 보이는 책이 바뀔 때마다 갱신, ISBN 정보가 바뀌면 다시 만듦)
+        self.facets: CatalogFacets = None
+        
+        # 이름, 전화번호 인덱스 (이름 -> 저자/사용자 목록, 전화번호 -> 사용자, 이름 -> 출판사)
+        self.authors_by_name: dict[str, list[AuthorRecord]] = dict()
+        self.users_by_name: dict[str, list[UserRecord]] = dict()
+        self.user_by_phone: dict[str, UserRecord] = dict()
+        self.publisher_by_name: dict[str, PublisherRecord] = dict()
+        
+        # ISBN -> ISBN 레코드
+        self.isbn_by_number: dict[int, ISBNRecord] = dict()
+        
+        # ISBN - 저자 관계 인덱스 (ISBN -> 저자 ID 목록, 저자 ID -> ISBN 목록)
+        self.authors_by_isbn: dict[int, list[int]] = dict()
+        self.isbns_by_author: dict[int, list[int]] = dict()
+        
+        # 범위 검색용 정렬 인덱스 ((출판년도, ISBN, ISBN 레코드), (등록날짜 서수, 책 ID, 책 레코드)), ISBN -> 책 ID 목록
+        self.isbns_by_year: list[tuple[int, int, ISBNRecord]] = []
+        self.books_by_register_date: list[tuple[int, int, BookRecord]] = []
+        self.book_ids_by_isbn: dict[int, list[int]] = dict()
+        
+        # 출판사 ID -> ISBN 목록, 제목 n-gram 인덱스 (처음 조건 검색할 때 만듦)
+        self.isbns_by_publisher: dict[int, list[int]] = dict()
+        self.title_ngrams: TitleNgramIndex = None
+        
+        # 저자 이름 BK-tree (처음 비슷한 저자를 찾을 때 만들고, 이후 저자가 추가될 때마다 갱신)
+        self.author_name_tree: BKTree = None
+        
+        # 제목, 저자 이름 자동 완성 (처음 호출할 때 만들고, 이후 책/저자 추가와 수정 시 갱신)
+        self.title_completions: PrefixIndex = None
+        self.author_completions: PrefixIndex = None
+        
+        # mmap으로 열어둔 데이터 파일 (테이블 이름 -> (파일 객체, mmap))
+        self.mapped_files: dict = dict()
+        
+        # 데이터 로드 시 반복되는 문자열(제목, 이름, 로그 종류)은 intern, 날짜는 SharedDates로 공유 (mmap 레코드의 날짜는 제외)
+        self.share_values = True
+        
+        # 실행 시간 측정 (enable_metrics를 호출한 경우에만 사용)
+        self.metrics: Metrics = None
+
         # Load configuration and ensure "cancel" key exists
         self.load_configuration()
 
@@ -274,256 +1199,514 @@ class DataManager(object):
             print("ERROR: 'cancel' 키가 설정에 없습니다. 기본값 'X'를 추가합니다.")
             self.config["cancel"] = "X"
 
+    # ========== 실행 시간 측정 ========== #
+    def enable_metrics(self) -> None:
+        """_summary_
+        파일 읽기/저장과 파일별 검사 메서드에 측정 래퍼를 씌움
+        호출하지 않으면 래퍼가 없으므로 측정 비용도 없음
+        """
+        self.metrics = Metrics()
+        
+        for name in ["read_data_files", "fetch_data_file"] + [f"check_data_{table_name}_files" for table_name in DATA_FILE_NAMES]:
+            setattr(self, name, self.metrics.wrap(name, getattr(self, name)))
+            self.metrics.wrapped_names.append(name)
+    
+    # 프로세스 풀로 넘길 때 측정 래퍼(지역 함수라 pickle 불가)는 제외
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        
+        if self.metrics is not None:
+            for name in self.metrics.wrapped_names:
+                state.pop(name, None)
+            state["metrics"] = None
+        
+        return state
+    
+    # ========== 지연 로드 테이블 (대출, 로그) ========== #
+    # 지연 로드 중에는 메모리에 반납되지 않은 대출과 실행 중 추가된 레코드만 있고, 처음 전체 테이블에 접근할 때 파일을 읽음
+    @property
+    def borrow_table(self) -> list[BorrowRecord]:
+        if "borrow" in self.deferred_tables:
+            self.load_deferred_table("borrow")
+        return self._borrow_table
+
+    @borrow_table.setter
+    def borrow_table(self, records: list[BorrowRecord]) -> None:
+        self._borrow_table = records
+
+    @property
+    def log_table(self) -> list[LogRecord]:
+        if "log" in self.deferred_tables:
+            self.load_deferred_table("log")
+        return self._log_table
+
+    @log_table.setter
+    def log_table(self, records: list[LogRecord]) -> None:
+        self._log_table = records
+
+    # 지연 로드 중인 테이블을 파일에서 읽어 메모리의 레코드와 합침
+    def load_deferred_table(self, table_name: str) -> None:
+        deferred = self.deferred_tables.pop(table_name)
+        _, _, records, _ = self.load_table_file(table_name, deferred["sep"], validate=False)
+
+        # 메모리에 있는 레코드(반납 처리된 대출 등)가 파일의 레코드보다 최신
+        id_name = "borrow_id" if table_name == "borrow" else "log_id"
+        in_memory = {getattr(record, id_name): record for record in getattr(self, f"_{table_name}_table")}
+        merged = [in_memory.pop(getattr(record, id_name), record) for record in records]
+        merged.extend(in_memory.values())
+
+        setattr(self, f"_{table_name}_table", merged)
+
+    # 테이블의 레코드 수 (다음에 할당할 고유번호, 지연 로드 중에도 파일을 읽지 않음)
+    def get_table_size(self, table_name: str) -> int:
+        if table_name in self.deferred_tables:
+            return self.deferred_tables[table_name]["size"]
+        return len(getattr(self, f"{table_name}_table"))
+
+    # 대출/로그 레코드 추가 (지연 로드 중이면 레코드 수만 갱신)
+    def append_history_record(self, table_name: str, record) -> None:
+        if table_name in self.deferred_tables:
+            self.deferred_tables[table_name]["size"] += 1
+        getattr(self, f"_{table_name}_table").append(record)
+
+        if table_name == "borrow" and record.actual_return_date is None:
+            self.open_borrows[record.book_id] = record
+
     # 오늘 날짜 설정
     def set_today(self, today: MyDate):
+        previous = self.today
         self.today = today
         
-    # 데이터 파일 읽기
-    def read_data_files(self, sep: str="/", verbose=True) -> tuple[bool, str]:
-
-        if verbose: print("="*10, "Start Reading Data Files", "="*10)
+        # 날짜가 앞으로 가면 삭제 날짜가 지난 책만 빼고, 처음 설정하거나 뒤로 가면 다시 구성
+        if previous is None or today < previous:
+            self.rebuild_live_books()
+            self.popularity = None
+        else:
+            self.advance_live_books()
+            if self.popularity is not None:
+                self.popularity.advance(today.ordinal)
+    
+    # ========== 오늘 기준으로 보이는 책 ========== #
+    def rebuild_live_books(self) -> None:
+        """_summary_
+        삭제되지 않았거나 삭제 날짜가 오늘 이후인 책을 고유번호 순서로 모음
+        (오늘 날짜가 정해지기 전에는 삭제된 책을 모두 제외)
+        """
+        self.live_books = dict()
+        self.pending_deletes = []
+        self.facets = None
         
+        for book in self.book_table:
+            if not book.deleted:
+                self.live_books[book.book_id] = book
+            elif self.today is not None and book.delete_date > self.today:
+                self.live_books[book.book_id] = book
+                self.pending_deletes.append((book.delete_date.ordinal, book.book_id))
+                
+        heapq.heapify(self.pending_deletes)
+        self.live_bits = bits_from_ids(self.live_books)
+    
+    # 삭제 날짜가 오늘이 되었거나 지난 책 제거
+    def advance_live_books(self) -> None:
+        while self.pending_deletes and self.pending_deletes[0][0] <= self.today.ordinal:
+            _, book_id = heapq.heappop(self.pending_deletes)
+            self.remove_live_book(book_id)
+    
+    # 새로 등록한 책 추가
+    def add_live_book(self, book: BookRecord) -> None:
+        self.live_books[book.book_id] = book
+        self.live_bits |= 1 << book.book_id
+        if self.facets is not None:
+            self.facets.add(book.book_id, book.isbn, self.get_facet_values(self.search_isbn_data(book.isbn)))
+    
+    # 삭제된 책 제외
+    def remove_live_book(self, book_id: int) -> None:
+        book = self.live_books.pop(book_id, None)
+        if book is None:
+            return
+        
+        self.live_bits &= ~(1 << book_id)
+        if self.facets is not None:
+            self.facets.remove(book.isbn)
+    
+    # 데이터 파일 생성 (없거나 비어있는 파일)
+    def create_data_files(self) -> None:
         # 경로에 "data" 폴더가 없으면 생성
         data_folder_path = opj(self.file_path, "data")
         if not os.path.exists(data_folder_path):
             os.makedirs(data_folder_path)
         
-        # ---------- 1. Publisher Data ----------
-         # 파일이 존재하지 않으면 생성
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_Publisher.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_Publisher.txt"), "w", encoding='utf-8') as f:
-                pass
-        
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_Publisher.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_publisher_files(self.file_path)
-        
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Publisher.txt"), opj(self.file_path, "data", f"Libsystem_Data_Publisher-{now}.bak"))
-            return (False, message)
-
-        with open(opj(self.file_path, "data", "Libsystem_Data_Publisher.txt"), "r",encoding='utf-8') as f:
-            for line in f:
-                publisher_id, name, deleted = line.strip().split(sep)
-                self.publisher_table.append(PublisherRecord(int(publisher_id), name, bool(int((deleted)))))
-
-        if verbose: print(f"{len(self.publisher_table)} Publisher Data Loaded")
-        
-        # ---------- 2. ISBN Data ----------
         # 파일이 존재하지 않으면 생성(아무 데이터 없음)
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_Isbn.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_Isbn.txt"), "w", encoding='utf-8') as f:
-                pass
-        
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_Isbn.txt 파일 생성)
+        for file_name in DATA_FILE_NAMES.values():
+            if not os.path.exists(opj(data_folder_path, file_name)):
+                with open(opj(data_folder_path, file_name), "w", encoding='utf-8') as f:
+                    pass
+        
+        # Book 파일이 비어있으면 첫 줄(고유번호) 작성
+        file_path = opj(data_folder_path, DATA_FILE_NAMES["book"])
+        if os.path.getsize(file_path) == 0:
+            with open(file_path, "w", encoding='utf-8') as wf:
+                wf.write("0\n")
+    
+    # 데이터 파일의 한 줄을 레코드로 변환
+    def parse_record_line(self, table_name: str, line: str, sep: str="/", dates: SharedDates=None):
+        fields = line.strip().split(sep)
+        to_date = (SharedDates() if dates is None else dates).__getitem__ if self.share_values else MyDate.from_str
+        to_text = sys.intern if self.share_values else str
+        
+        if table_name == "publisher":
+            publisher_id, name, deleted = fields
+            return PublisherRecord(int(publisher_id), to_text(name), bool(int((deleted))))
+            
+        elif table_name == "isbn":
+            isbn, title, publisher_id, published_year, isbn_register_date = fields
+            return ISBNRecord(int(isbn), to_text(title), int(publisher_id), int(published_year), to_date(isbn_register_date))
+            
+        elif table_name == "book":
+            book_id, isbn, register_date, deleted, delete_date = fields
+            return BookRecord(int(book_id), int(isbn), to_date(register_date), to_date(delete_date), bool(int(deleted)))
+            
+        elif table_name == "author":
+            author_id, name, deleted = fields
+            return AuthorRecord(int(author_id), to_text(name), bool(int(deleted)))
+            
+        elif table_name == "isbn_author":
+            isbn, author_id = fields
+            return IsbnAuthorRecord(int(isbn), int(author_id))
+            
+        elif table_name == "user":
+            user_id, phone_number, name, deleted = fields
+            return UserRecord(int(user_id), phone_number, to_text(name), bool(int(deleted)))
+            
+        elif table_name == "borrow":
+            borrow_id, book_id, user_id, borrow_date, return_date, actual_return_date, deleted = fields
+            return BorrowRecord(int(borrow_id), int(book_id), int(user_id), to_date(borrow_date), to_date(return_date), to_date(actual_return_date), bool(int(deleted)))
+            
+        elif table_name == "overdue_penalty":
+            penalty_id, user_id, penalty_start_date, penalty_end_date = fields
+            return OverduePenaltyRecord(int(penalty_id), int(user_id), to_date(penalty_start_date), to_date(penalty_end_date))
+            
+        elif table_name == "log":
+            log_id, isbn, book_id, borrow_id, log_date, log_type = fields
+            return LogRecord(int(log_id), int(isbn), None if book_id == "" else int(book_id), None if borrow_id == "" else int(borrow_id), to_date(log_date), to_text(log_type))
+    
+    # 데이터 파일 하나를 형식 검사 후 레코드 리스트로 파싱
+    def load_table_file(self, table_name: str, sep: str="/", validate: bool=True, dates: SharedDates=None) -> tuple[bool, str, list, int]:
+        """_summary_
+        테이블 하나의 파일 형식 검사 및 파싱 (다른 테이블을 참조하지 않으므로 프로세스 풀에서 동시에 실행 가능)
+        validate=False -> 지난 검사 이후 바뀌지 않은 파일이므로 형식 검사 생략
+        dates -> 같은 읽기 과정에서 공유하는 날짜 (없으면 이 파일에서만 공유)
+        반환값: (성공 여부, 오류 메세지, 레코드 리스트, Book 파일의 첫 줄 값)
+        """
+        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 파일 생성)
         # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_isbn_files(self.file_path)
+        if validate:
+            check_func = getattr(self, f"check_data_{table_name}_files")
+            passed, message = check_func(self.file_path, dates)
+            
+            if not passed:
+                return (False, message, [], 0)
         
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Isbn.txt"), opj(self.file_path, "data", f"Libsystem_Data_Isbn-{now}.bak"))
-            return (False, message)
-
-        with open(opj(self.file_path, "data", "Libsystem_Data_Isbn.txt"), "r",encoding='utf-8') as f:
+        if dates is None:
+            dates = SharedDates()
+        
+        records = []
+        header = 0
+        with open(opj(self.file_path, "data", DATA_FILE_NAMES[table_name]), "r", encoding='utf-8') as f:
+            # Book 파일의 첫 줄은 다음에 할당할 고유번호
+            if table_name == "book":
+                header = int(f.readline())
+            
             for line in f:
-                isbn, title, publisher_id, published_year, isbn_register_date = line.strip().split(sep)
-                self.isbn_table.append(ISBNRecord(int(isbn), title, int(publisher_id), int(published_year), MyDate.from_str(isbn_register_date)))
+                if line.strip() == "":
+                    continue
                 
-        if verbose: print(f"{len(self.isbn_table)} ISBN Data Loaded")
-        
-        # ---------- 3. Book Data ----------
-         # 파일이 존재하지 않으면 생성
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_Book.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_Book.txt"), "w", encoding='utf-8') as f:
-                f.write("0\n")
-
-        # 파일이 비어있으면 생성
-        file_path = opj(self.file_path, "data", "Libsystem_Data_Book.txt")
-        with open(file_path, "r", encoding='utf-8') as rf:
-            lines = rf.readlines()  # 파일의 모든 줄을 리스트로 읽어옵니다.
-            if len(lines) == 0:
-                # 파일이 비어있으면 기본 데이터를 작성
-                with open(file_path, "w", encoding='utf-8') as wf:
-                    wf.write("0\n")
-
+                records.append(self.parse_record_line(table_name, line, sep, dates))
         
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_Book.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_book_files(self.file_path)
+        return (True, "", records, header)
+    
+    # mmap으로 데이터 파일 읽기 (줄마다 문자열을 만들지 않고 '\n' 위치만 찾아 레코드 생성)
+    def load_mapped_table_file(self, table_name: str, validate: bool=True) -> tuple[bool, str, list, int]:
+        """_summary_
+        validate=True이면 레코드를 만들기 전에 mmap의 바이트로 형식 검사 (문자열로 디코딩하지 않음)
+        반환값: load_table_file과 같음
+        """
+        file_path = opj(self.file_path, "data", DATA_FILE_NAMES[table_name])
+        if os.path.getsize(file_path) == 0:
+            return (True, "", [], 0)
         
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Book.txt"), opj(self.file_path, "data", f"Libsystem_Data_Book-{now}.bak"))
-            return (False, message)
-
-        with open(opj(self.file_path, "data", "Libsystem_Data_Book.txt"), "r",encoding='utf-8') as f:
-            lines = f.readlines()
-            
-            self.static_id = int(lines[0])
-            
-            for line in lines[1:]:
-                book_id, isbn, register_date, deleted, delete_date = line.strip().split(sep)
-                self.book_table.append(BookRecord(int(book_id), int(isbn), MyDate.from_str(register_date), MyDate.from_str(delete_date), bool(int(deleted))))
-          
-        if verbose:      
-            print(f"{len(self.book_table)} Book Data Loaded")
-            print(f"max_book_id: {self.static_id}")
+        f = open(file_path, "rb")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
         
-        # ---------- 5. Author Data ----------
-
-        # 파일이 존재하지 않으면 생성(아무 데이터 없음)
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_Author.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_Author.txt"), "w", encoding='utf-8') as f:
-                 pass
+        if validate:
+            check_func = getattr(self, f"check_mapped_{table_name}_file")
+            passed, message = check_func(buffer)
             
+            if not passed:
+                buffer.close()
+                f.close()
+                return (False, message, [], 0)
         
-         # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_Author.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_author_files(self.file_path)
+        self.mapped_files[table_name] = (f, buffer)
         
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Author.txt"), opj(self.file_path, "data", f"Libsystem_Data_Author-{now}.bak"))
-            return (False, message)
+        record_class = MappedBorrowRecord if table_name == "borrow" else MappedLogRecord
+        records = [record_class(buffer, start, end) for start, end in iter_mapped_lines(buffer) if end > start]
             
-        with open(opj(self.file_path, "data", "Libsystem_Data_Author.txt"), "r",encoding='utf-8') as f:
+        return (True, "", records, 0)
+    
+    # mmap으로 열어둔 파일 닫기 (파일을 다시 쓰기 전에 호출)
+    def release_mapped_file(self, table_name: str) -> None:
+        if table_name not in self.mapped_files:
+            return
+        
+        # 파일 내용을 한 번만 복사해 레코드가 복사본을 가리키도록 함 (필드는 계속 처음 접근할 때 디코딩)
+        f, buffer = self.mapped_files.pop(table_name)
+        data = buffer[:]
+        for record in getattr(self, f"{table_name}_table"):
+            if isinstance(record, MappedRecord):
+                record._buffer = data
+                
+        buffer.close()
+        f.close()
+    
+    # 연혁 테이블 지연 로드 준비 (대출은 반납되지 않은 줄만 파싱하고, 나머지 줄은 레코드 수만 셈)
+    def defer_history_table(self, table_name: str, sep: str="/", dates: SharedDates=None) -> list:
+        records = []
+        size = 0
+        with open(opj(self.file_path, "data", DATA_FILE_NAMES[table_name]), "r", encoding='utf-8') as f:
             for line in f:
-                author_id, name, deleted = line.strip().split(sep)
-                self.author_table.append(AuthorRecord(int(author_id), name, bool(int(deleted))))
+                if line.strip() == "":
+                    continue
+                size += 1
                 
-        if verbose: print(f"{len(self.author_table)} Author Data Loaded")
-        
-        # ---------- 6. ISBN - Author Data ----------
-        # 파일이 존재하지 않으면 생성
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_IsbnAuthor.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_IsbnAuthor.txt"), "w", encoding='utf-8') as f:
-                 pass
-            
+                # 대출 파일의 끝에서 두 번째 필드는 실제 반납일 (비어있으면 반납되지 않은 대출)
+                if table_name == "borrow" and line.rstrip().rsplit(sep, 2)[1] == "":
+                    records.append(self.parse_record_line(table_name, line, sep, dates))
         
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_IsbnAuthor.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_isbn_author_files(self.file_path)
-        
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_IsbnAuthor.txt"), opj(self.file_path, "data", f"Libsystem_Data_IsbnAuthor-{now}.bak"))
-            return (False, message)
-
-        with open(opj(self.file_path, "data", "Libsystem_Data_IsbnAuthor.txt"), "r",encoding='utf-8') as f:
-            for line in f:
-                isbn, author_id = line.strip().split(sep)
-                self.isbn_author_table.append(IsbnAuthorRecord(int(isbn), int(author_id)))
+        self.deferred_tables[table_name] = {"sep": sep, "size": size}
+        return records
+    
+    # 파싱된 레코드를 메모리 테이블에 반영
+    def set_table_records(self, table_name: str, records: list, header: int=0) -> None:
+        setattr(self, f"{table_name}_table", records)
+        
+        if table_name == "book":
+            self.static_id = header
+            self.book_ids_by_isbn = dict()
+            for book in records:
+                self.update_latest_dates(register_date=book.register_date)
+                self.book_ids_by_isbn.setdefault(book.isbn, []).append(book.book_id)
+            self.books_by_register_date = sorted((book.register_date.ordinal, book.book_id, book) for book in records)
+            self.rebuild_live_books()
                 
-        if verbose: print(f"{len(self.isbn_author_table)} ISBN - Author Data Loaded")
-
-        # ---------- 7. User Data ----------
-        # 파일이 존재하지 않으면 생성
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_User.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_User.txt"), "w", encoding='utf-8') as f:
-                pass
-            
-        
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_User.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_user_files(self.file_path)
+        elif table_name == "isbn":
+            self.facets = None
+            for isbn in records:
+                self.update_latest_dates(published_year=isbn.published_year)
+            self.isbn_by_number = {isbn.isbn: isbn for isbn in records}
+            self.isbns_by_year = sorted((isbn.published_year, isbn.isbn, isbn) for isbn in records)
+            self.isbns_by_publisher = dict()
+            for isbn in records:
+                self.isbns_by_publisher.setdefault(isbn.publisher_id, []).append(isbn.isbn)
+            self.title_ngrams = None
+            self.title_completions = None
+                
+        elif table_name == "author":
+            self.author_name_tree = None
+            self.author_completions = None
+            self.authors_by_name = dict()
+            for author in records:
+                self.index_author(author)
+                
+        elif table_name == "user":
+            self.users_by_name = dict()
+            self.user_by_phone = dict()
+            for user in records:
+                self.index_user(user)
+                
+        elif table_name == "publisher":
+            self.publisher_by_name = dict()
+            for publisher in records:
+                self.index_publisher(publisher)
+                
+        elif table_name == "isbn_author":
+            self.facets = None
+            self.authors_by_isbn = dict()
+            self.isbns_by_author = dict()
+            for isbn_author in records:
+                self.index_isbn_author(isbn_author.isbn, isbn_author.author_id)
+                
+        elif table_name == "log":
+            self.popularity = None
+                
+        elif table_name == "borrow":
+            self.co_borrows = None
+            self.open_borrows = dict()
+            for borrow in records:
+                self.update_latest_dates(borrow_date=borrow.borrow_date)
+                if borrow.actual_return_date is None:
+                    self.open_borrows[borrow.book_id] = borrow
+        
+    # ========== 데이터 파일 지문(크기, 수정 시각, 해시) ========== #
+    def get_file_fingerprint(self, table_name: str, with_hash: bool=True) -> dict:
+        file_path = opj(self.file_path, "data", DATA_FILE_NAMES[table_name])
+        stat = os.stat(file_path)
+        fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "crc32": None}
+        
+        if with_hash:
+            crc = 0
+            with open(file_path, "rb") as f:
+                while chunk := f.read(1 << 20):
+                    crc = zlib.crc32(chunk, crc)
+            fingerprint["crc32"] = crc
+            
+        return fingerprint
+    
+    # 지난 검사 이후 바뀌지 않은 파일인지 확인
+    def is_file_unchanged(self, table_name: str, saved: dict) -> bool:
+        if saved is None:
+            return False
         
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_User.txt"), opj(self.file_path, "data", f"Libsystem_Data_User-{now}.bak"))
-            return (False, message)
-
-        with open(opj(self.file_path, "data", "Libsystem_Data_User.txt"), "r",encoding='utf-8') as f:
-            for line in f:
-                user_id, phone_number, name, deleted = line.strip().split(sep)
-                self.user_table.append(UserRecord(int(user_id), phone_number, name, bool(int(deleted))))
+        current = self.get_file_fingerprint(table_name, with_hash=False)
+        if current["size"] != saved["size"]:
+            return False
         
-        if verbose: print(f"{len(self.user_table)} User Data Loaded")
+        # 크기와 수정 시각이 같으면 해시 계산 생략
+        if current["mtime_ns"] == saved["mtime_ns"]:
+            return True
         
-        # ---------- 8. Borrow Data ----------
-        # 파일이 존재하지 않으면 생성
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_Borrow.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_Borrow.txt"), "w", encoding='utf-8') as f:
-                pass
+        return self.get_file_fingerprint(table_name)["crc32"] == saved["crc32"]
+    
+    # 지난 검사 때 저장한 데이터 파일 지문 읽기 (없거나 손상되었으면 빈 딕셔너리)
+    def load_manifest(self) -> dict:
+        try:
+            with open(opj(self.file_path, "data", MANIFEST_FILE_NAME), "r", encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return dict()
+    
+    # 검사를 생략해도 되는 테이블 목록 (파일과 참조하는 파일이 모두 바뀌지 않은 경우)
+    def get_trusted_tables(self, manifest: dict) -> set[str]:
+        trusted = set()
+        for table_name in DATA_FILE_NAMES:
+            if not all(dependency in trusted for dependency in DATA_FILE_DEPENDENCIES[table_name]):
+                continue
+            if self.is_file_unchanged(table_name, manifest.get(table_name)):
+                trusted.add(table_name)
+                
+        return trusted
+    
+    # 현재 데이터 파일의 지문 저장 (검사 통과 직후 또는 정상 종료 시)
+    def save_manifest(self) -> bool:
+        try:
+            manifest = {table_name: self.get_file_fingerprint(table_name) for table_name in DATA_FILE_NAMES}
             
-        
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_Borrow.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_borrow_files(self.file_path)
-        
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Borrow.txt"), opj(self.file_path, "data", f"Libsystem_Data_Borrow-{now}.bak"))
-            return (False, message)
-
-        with open(opj(self.file_path, "data", "Libsystem_Data_Borrow.txt"), "r",encoding='utf-8') as f:
-            for line in f:
-                borrow_id, book_id, user_id, borrow_date, return_date, actual_return_date, deleted = line.strip().split(sep)
-                self.borrow_table.append(BorrowRecord(int(borrow_id), int(book_id), int(user_id), MyDate.from_str(borrow_date), MyDate.from_str(return_date), MyDate.from_str(actual_return_date), bool(int(deleted))))
+            # 지연 로드 시 반납된 대출을 읽지 않아도 현재 날짜를 검사할 수 있도록 저장
+            if self.latest_borrow_date is not None:
+                manifest["latest_borrow_date"] = str(self.latest_borrow_date)
                 
-        if verbose: print(f"{len(self.borrow_table)} Borrow Data Loaded") 
+            with open(opj(self.file_path, "data", MANIFEST_FILE_NAME), "w", encoding='utf-8') as f:
+                json.dump(manifest, f, indent=4)
+            return True
         
-        # ---------- 9. Overdue Penalty Data ----------
-        # 파일이 존재하지 않으면 생성
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_OverduePenalty.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_OverduePenalty.txt"), "w", encoding='utf-8') as f:
-                pass
-            
+        except OSError:
+            return False
+    
+    # 데이터 파일 읽기
+    def read_data_files(self, sep: str="/", verbose=True, parallel=False, use_manifest=True, use_mmap=False, lazy_history=False) -> tuple[bool, str]:
+        """_summary_
+        1단계: 파일별 형식 검사 및 파싱 (parallel=True이면 프로세스 풀에서 모든 파일을 동시에 처리)
+        2단계: 테이블 간 참조 무결성 검사
+        use_manifest=True이면 지난 검사 이후 바뀌지 않은 파일(및 그 파일이 참조하는 파일)은 검사 생략
+        use_mmap=True이면 대출/로그 파일을 mmap으로 읽고 필드는 처음 접근할 때 디코딩
+        lazy_history=True이면 검사를 생략한 대출/로그 파일은 반납되지 않은 대출만 읽고, 나머지는 처음 접근할 때 읽음
+        """
+        if verbose: print("="*10, "Start Reading Data Files", "="*10)
         
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_OverduePenalty.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_overdue_penalty_files(self.file_path)
+        self.create_data_files()
+        manifest = self.load_manifest() if use_manifest else dict()
+        trusted_tables = self.get_trusted_tables(manifest) if use_manifest else set()
+        
+        # 지연 로드할 테이블 (바뀌지 않아 검사와 참조 검사가 모두 생략되는 경우만)
+        deferred_tables = {table_name for table_name in HISTORY_TABLE_NAMES if table_name in trusted_tables} if lazy_history else set()
+        eager_tables = [table_name for table_name in DATA_FILE_NAMES if table_name not in deferred_tables]
+        
+        # mmap으로 읽을 테이블 (검사도 mmap의 바이트로 하므로 프로세스 풀에 넘기지 않음)
+        mapped_tables = {table_name for table_name in MAPPED_TABLE_NAMES if table_name in eager_tables} if use_mmap else set()
+        
+        # 이번 읽기 동안만 같은 날짜 문자열의 MyDate를 공유 (프로세스 풀에서는 파일마다 따로 공유)
+        dates = SharedDates()
+        
+        # ---------- 1. 형식 검사 및 파싱 ----------
+        if parallel:
+            # 아직 테이블이 비어있으므로 self를 작업 프로세스로 넘기는 비용은 작음
+            with ProcessPoolExecutor(max_workers=min(len(DATA_FILE_NAMES), os.cpu_count() or 1)) as executor:
+                futures = {table_name: executor.submit(self.load_table_file, table_name, sep, table_name not in trusted_tables) for table_name in eager_tables if table_name not in mapped_tables}
+                results = {table_name: future.result() for table_name, future in futures.items()}
+        
+        for table_name in DATA_FILE_NAMES:
+            if table_name in deferred_tables:
+                passed, message, records, header = (True, "", self.defer_history_table(table_name, sep, dates), 0)
+            elif table_name in mapped_tables:
+                passed, message, records, header = self.load_mapped_table_file(table_name, table_name not in trusted_tables)
+            elif parallel:
+                passed, message, records, header = results[table_name]
+            else:
+                passed, message, records, header = self.load_table_file(table_name, sep, table_name not in trusted_tables, dates)
+            
+            if not passed:
+                return (False, message)
+            
+            self.set_table_records(table_name, records, header)
+            
+            if verbose:
+                print(f"{self.get_table_size(table_name)} {DATA_TABLE_LABELS[table_name]} Data Loaded")
+                if table_name == "book":
+                    print(f"max_book_id: {self.static_id}")
         
-        if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_OverduePenalty.txt"), opj(self.file_path, "data", f"Libsystem_Data_OverduePenalty-{now}.bak"))
-            return (False, message)
-
-        with open(opj(self.file_path, "data", "Libsystem_Data_OverduePenalty.txt"), "r",encoding='utf-8') as f:
-            for line in f:
-                penalty_id, user_id, penalty_start_date, penalty_end_date = line.strip().split(sep)
-                self.overdue_penalty_table.append(OverduePenaltyRecord(int(penalty_id), int(user_id), MyDate.from_str(penalty_start_date), MyDate.from_str(penalty_end_date)))
-
-        if verbose: print(f"{len(self.overdue_penalty_table)} Overdue Penalty Data Loaded")
+        # 반납된 대출을 읽지 않았으므로 지난 실행에서 저장한 최근 대출일 반영
+        if "borrow" in deferred_tables and "latest_borrow_date" in manifest:
+            self.update_latest_dates(borrow_date=MyDate.from_str(manifest["latest_borrow_date"]))
         
-        # ---------- 10. Log Data ----------
-        # 파일이 존재하지 않으면 생성
-        if not os.path.exists(opj(self.file_path, "data", "Libsystem_Data_Log.txt")):
-            with open(opj(self.file_path, "data", "Libsystem_Data_Log.txt"), "w", encoding='utf-8') as f:
-                pass
-            
-        # 무결성 검사(데이터가 올바르지 않을경우 파일명 변경(Libsystem_Data_{테이블명}-yyyyMMdd_hhmmss.bak) 후 새 Libsystem_Data_Log.txt 파일 생성)
-        # yyyyMMdd-hhmmss는 컴퓨터 운영체제 시스템 시간을 기준으로 함
-        passed, message = self.check_data_log_files(self.file_path)
+        # ---------- 2. 참조 무결성 검사 ----------
+        passed, message = self.check_data_references(skip_tables=trusted_tables)
         
         if not passed:
-            # now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Log.txt"), opj(self.file_path, "data", f"Libsystem_Data_Log-{now}.bak"))
             return (False, message)
         
-        with open(opj(self.file_path, "data", "Libsystem_Data_Log.txt"), "r",encoding='utf-8') as f:
-            for line in f:
-                log_id, isbn, book_id, borrow_id, log_date, log_type = line.strip().split(sep)
-                self.log_table.append(LogRecord(int(log_id), int(isbn), None if book_id == "" else int(book_id), None if borrow_id == "" else int(borrow_id), MyDate.from_str(log_date), log_type))
-                
-        if verbose: print(f"{len(self.log_table)} Log Data Loaded")
-        if verbose: print("="*10, "End Reading Data Files", "="*10)
+        if use_manifest:
+            self.save_manifest()
+        
+        if verbose:
+            if trusted_tables:
+                print(f"{len(trusted_tables)} Unchanged Data Files Skipped Validation")
+            if deferred_tables:
+                print(f"{len(deferred_tables)} History Data Files Deferred")
+            print("="*10, "End Reading Data Files", "="*10)
             
         return (True, "")
-
+    
+    # ========== 값이 바뀐 레코드 표시 ========== #
+    # 파일 저장은 테이블 전체를 다시 쓰므로 아무것도 하지 않음 (SQLiteDataManager는 표시된 행만 저장)
+    def mark_dirty(self, table_name: str, record) -> None:
+        pass
+    
     # ========== 데이터 파일 메모리 -> 파일 동기화 (fetch) ========== #
     def fetch_data_file(self) -> bool:
         try:
+            # mmap으로 열린 파일은 덮어쓰기 전에 닫아야 함
+            self.release_mapped_file("borrow")
+            
             # 1. Book Data
             with open(opj(self.file_path, "data", "Libsystem_Data_Book.txt"), "w", encoding='utf-8') as f:
                 f.write(f"{len(self.book_table)}\n")
                 for book in self.book_table:
-                    f.write(f"{book.book_id}/{str(book.isbn).zfill(2)}/{book.register_date}/{int(book.deleted)}/{'' if book.delete_date is None else book.delete_date}\n")
+                    f.write(f"{book.book_id}/{format_isbn(book.isbn)}/{book.register_date}/{int(book.deleted)}/{'' if book.delete_date is None else book.delete_date}\n")
 
             # 2. ISBN Data
             with open(opj(self.file_path, "data", "Libsystem_Data_Isbn.txt"), "w", encoding='utf-8') as f:
                 for isbn in self.isbn_table:
-                    f.write(f"{str(isbn.isbn).zfill(2)}/{isbn.title}/{isbn.publisher_id}/{isbn.published_year}/{str(isbn.isbn_register_date)}\n")
+                    f.write(f"{format_isbn(isbn.isbn)}/{isbn.title}/{isbn.publisher_id}/{isbn.published_year}/{str(isbn.isbn_register_date)}\n")
                     
             # 3. Author Data
             with open(opj(self.file_path, "data", "Libsystem_Data_Author.txt"), "w", encoding='utf-8') as f:
@@ -533,22 +1716,29 @@ class DataManager(object):
             # 4. ISBN - Author Data
             with open(opj(self.file_path, "data", "Libsystem_Data_IsbnAuthor.txt"), "w", encoding='utf-8') as f:
                 for isbn_author in self.isbn_author_table:
-                    f.write(f"{str(isbn_author.isbn).zfill(2)}/{isbn_author.author_id}\n")
+                    f.write(f"{format_isbn(isbn_author.isbn)}/{isbn_author.author_id}\n")
                     
             # 5. Book Edit Log Data
             # with open(opj(self.file_path, "data", "Libsystem_Data_BookEditLog.txt"), "w", encoding='utf-8') as f:
             #     for log in self.book_edit_log_table:
-            #         f.write(f"{log.log_id}/{str(log.isbn).zfill(2)}/{str(log.edit_date)}\n")
+            #         f.write(f"{log.log_id}/{format_isbn(log.isbn)}/{str(log.edit_date)}\n")
             
             # 5. Log Data
             # with open(opj(self.file_path, "data", "Libsystem_Data_Log.txt"), "w", encoding='utf-8') as f:
             #     for log in self.log_table:
-            #         f.write(f"{log.log_id}/{str(log.isbn).zfill(2)}/{"" if log.book_id is None else log.book_id}/{"" if log.borrow_id is None else log.borrow_id}/{str(log.log_date)}/{log.log_type}\n")
+            #         f.write(f"{log.log_id}/{format_isbn(log.isbn)}/{"" if log.book_id is None else log.book_id}/{"" if log.borrow_id is None else log.borrow_id}/{str(log.log_date)}/{log.log_type}\n")
                     
             # 6. Borrow Data
-            with open(opj(self.file_path, "data", "Libsystem_Data_Borrow.txt"), "w", encoding='utf-8') as f:
-                for borrow in self.borrow_table:
-                    f.write(f"{borrow.borrow_id}/{borrow.book_id}/{borrow.user_id}/{borrow.borrow_date}/{borrow.return_date}/{'' if borrow.actual_return_date is None else borrow.actual_return_date}/{int(borrow.deleted)}\n")
+            if "borrow" in self.deferred_tables:
+                self.fetch_deferred_borrow_file()
+            else:
+                with open(opj(self.file_path, "data", "Libsystem_Data_Borrow.txt"), "wb") as f:
+                    for borrow in self.borrow_table:
+                        # 읽은 뒤 바뀌지 않은 mmap 레코드는 필드를 디코딩하지 않고 원래 줄을 그대로 씀
+                        if isinstance(borrow, MappedRecord) and not borrow.changed:
+                            f.write(borrow.raw_line() + b"\n")
+                        else:
+                            f.write(self.format_borrow_line(borrow).encode("utf-8"))
 
                     
             # 7. User Data
@@ -572,881 +1762,1020 @@ class DataManager(object):
             print("ERROR: 데이터 파일 저장에 실패했습니다.")
             return False
     
+    # 대출 레코드를 데이터 파일의 한 줄로 변환
+    def format_borrow_line(self, borrow: BorrowRecord) -> str:
+        return f"{borrow.borrow_id}/{borrow.book_id}/{borrow.user_id}/{borrow.borrow_date}/{borrow.return_date}/{'' if borrow.actual_return_date is None else borrow.actual_return_date}/{int(borrow.deleted)}\n"
+    
+    # 지연 로드 중인 대출 파일 저장 (메모리에 없는 줄은 파싱하지 않고 그대로 복사)
+    def fetch_deferred_borrow_file(self) -> None:
+        sep = self.deferred_tables["borrow"]["sep"]
+        file_path = opj(self.file_path, "data", DATA_FILE_NAMES["borrow"])
+        in_memory = {borrow.borrow_id: borrow for borrow in self._borrow_table}
+        
+        with open(file_path, "r", encoding='utf-8') as rf, open(file_path + ".tmp", "w", encoding='utf-8') as wf:
+            for line in rf:
+                if line.strip() == "":
+                    continue
+                
+                borrow = in_memory.pop(int(line.split(sep, 1)[0]), None)
+                wf.write(line.rstrip("\n") + "\n" if borrow is None else self.format_borrow_line(borrow))
+            
+            # 실행 중 새로 추가된 대출
+            for borrow in in_memory.values():
+                wf.write(self.format_borrow_line(borrow))
+                
+        os.replace(file_path + ".tmp", file_path)
+    
     # ========== 데이터 파일 무결성 검사 ========== #
     # 오류 발생 시 오류 발생한 줄과 오류 메세지 출력
-    def check_data_book_files(self,file_path: str) -> tuple[bool, str]:
+    # 파일을 한 줄씩 한 번만 읽으며 검사 (파일 전체를 메모리에 올리지 않음)
+    # 고유번호는 0(저자는 1)부터 1씩 증가해야 하므로, 기대값보다 작은 고유번호는 앞 줄과 중복된 것
+    def check_data_book_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
+        if dates is None:
+            dates = SharedDates()
+        
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
-        line_num = 1
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Book.txt"), opj(self.file_path, "data", f"Libsystem_Data_Book-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_Book-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
-
-        with open(opj(file_path, "data", "Libsystem_Data_Book.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-        first_line = lines[0].strip()
-        
-        # 첫 줄이 숫자인지 확인
-        if not first_line.isdigit() or int(first_line) > 99:
-            add_error(line_num, "첫 줄이 0에서 99 사이의 정수가 아닙니다.")
-            return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 첫 줄이 0에서 99 사이의 정수가 아닙니다.")
-        
+            return (False, self.add_error_backup("book", line_num, error_message))
 
-        first_line = int(first_line)
-        
-        # 구분자가 4개인지 확인
-        for line in lines[1:]:
-            line_num += 1
-            line = line.strip()
-            if line_num == 2 and line == "":
-                return (True, "")
-            if len(line.strip().split("/")) != 5:
-                add_error(line_num, "구분자가 4개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 4개가 아닙니다")
-            
-        line_num = 1
-            
-        # 모든 레코드의 앞 4개 항목 비어있지 않는 지 확인
-        for line in lines[1:]:
-            line_num += 1
-            book_id, isbn, register_date, deleted, delete_date = line.strip().split("/")
-            if book_id == "" or isbn == "" or register_date == "" or deleted == "":
-                add_error(line_num, "모든 레코드의 앞 4개 항목이 비어있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 모든 레코드의 앞 4개 항목이 비어있습니다.")
-        
-        line_num = 1
-            
-        # 고유번호 검사
-        for line in lines[1:]:
-            line_num += 1
-            book_id, isbn, register_date, deleted, delete_date = line.strip().split("/")
-            # 고유번호가 숫자인지 확인
-            if not book_id.isdigit() or int(book_id) >= first_line:
-                add_error(line_num, "고유번호가 0에서 첫 줄의 값 사이의 정수가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 고유번호가 0에서 첫 줄의 값 사이의 정수가 아닙니다.")
-            
-            # 고유번호 중복 검사
-            book_ids = [line.strip().split("/")[0] for line in lines]
-            if book_ids.count(book_id) > 1:
-                add_error(line_num, "고유번호가 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 고유번호가 중복됩니다.")
-            
-            # 고유번호는 0부터 1씩 증가해야 함
-            if int(book_id) != line_num - 2:
-                add_error(line_num, "책 고유번호는 0부터 1씩 증가해야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 책 고유번호는 0부터 1씩 증가해야 합니다.")
-            
-            # ISBN 검사(길이가 2이며, 정수로 변환 가능한지)
-            if len(isbn) != 2 or not isbn.isdigit():
-                add_error(line_num, "ISBN이 2자리 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - ISBN이 2자리 숫자가 아닙니다.")
-            
-            # 등록 날짜 검사
-            if not MyDate.from_str(register_date):
-                add_error(line_num, "등록 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 등록 날짜가 날짜 형식이 아닙니다.")
-            
-            # 삭제 여부 검사
-            if deleted not in ["0", "1"]:
-                add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 삭제 여부가 0 또는 1이 아닙니다.")
-            
-            # 삭제 날짜 검사(날짜 검사 및 삭제 여부가 1일 때만 검사)
-            if deleted == "1" and not MyDate.from_str(delete_date):
-                add_error(line_num, "삭제 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 삭제 날짜가 날짜 형식이 아닙니다.")
-            
-            if deleted == "1" and MyDate.from_str(delete_date) < MyDate.from_str(register_date):
-                add_error(line_num, "삭제 날짜가 등록 날짜보다 이전입니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 삭제 날짜가 등록 날짜보다 이전입니다.")
-            
-            # ISBN 참조 무결성 검사
-            isbn_found = False
-            for isbn_record in self.isbn_table:
-                if isbn_record.isbn == int(isbn):
-                    isbn_found = True
-                    break
+        with open(opj(file_path, "data", DATA_FILE_NAMES["book"]), "r", encoding='utf-8') as f:
+            line_num = 1
+            first_line = f.readline().strip()
+            
+            # 첫 줄이 숫자인지 확인
+            if not first_line.isdigit() or int(first_line) > MAX_RECORD_ID:
+                return add_error(line_num, f"첫 줄이 0에서 {MAX_RECORD_ID} 사이의 정수가 아닙니다.")
+            
+            first_line = int(first_line)
+            
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num == 2 and line == "":
+                    return (True, "")
+                
+                # 구분자가 4개인지 확인
+                fields = line.split("/")
+                if len(fields) != 5:
+                    return add_error(line_num, "구분자가 4개가 아닙니다")
+                
+                # 레코드의 앞 4개 항목 비어있지 않는 지 확인
+                book_id, isbn, register_date, deleted, delete_date = fields
+                if book_id == "" or isbn == "" or register_date == "" or deleted == "":
+                    return add_error(line_num, "모든 레코드의 앞 4개 항목이 비어있습니다.")
+                
+                # 고유번호가 숫자인지 확인
+                if not book_id.isdigit() or int(book_id) >= first_line:
+                    return add_error(line_num, "고유번호가 0에서 첫 줄의 값 사이의 정수가 아닙니다.")
                 
-            if not isbn_found:
-                add_error(line_num, "참조하는 ISBN이 ISBN 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 ISBN이 ISBN 데이터에 없습니다.")
+                # 고유번호 중복 검사
+                if int(book_id) < line_num - 2:
+                    return add_error(line_num, "고유번호가 중복됩니다.")
+                
+                # 고유번호는 0부터 1씩 증가해야 함
+                if int(book_id) != line_num - 2:
+                    return add_error(line_num, "책 고유번호는 0부터 1씩 증가해야 합니다.")
+                
+                # ISBN 검사(두 자리 숫자 또는 ISBN-13)
+                if not is_valid_isbn(isbn):
+                    return add_error(line_num, "ISBN이 2자리 숫자 또는 ISBN-13이 아닙니다.")
+                
+                # 등록 날짜 검사
+                register_date = dates[register_date]
+                if not register_date:
+                    return add_error(line_num, "등록 날짜가 날짜 형식이 아닙니다.")
+                
+                # 삭제 여부 검사
+                if deleted not in ["0", "1"]:
+                    return add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
+                
+                # 삭제 날짜 검사(날짜 검사 및 삭제 여부가 1일 때만 검사)
+                if deleted == "1":
+                    delete_date = dates[delete_date]
+                    if not delete_date:
+                        return add_error(line_num, "삭제 날짜가 날짜 형식이 아닙니다.")
+                    
+                    if delete_date < register_date:
+                        return add_error(line_num, "삭제 날짜가 등록 날짜보다 이전입니다.")
             
         return (True, "")
     
-    def check_data_isbn_files(self,file_path: str) -> tuple[bool, str]:
+    def check_data_isbn_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
+        if dates is None:
+            dates = SharedDates()
+        
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Isbn.txt"), opj(self.file_path, "data", f"Libsystem_Data_Isbn-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_Isbn-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
+            return (False, self.add_error_backup("isbn", line_num, error_message))
 
-        with open(opj(file_path, "data", "Libsystem_Data_Isbn.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-            
         line_num = 0
+        isbns = set()
         
-        # 구분자가 4개인지 확인
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if line_num ==1 and line == "":
-                return (True, "")
-            
-            if len(line.strip().split("/")) != 5:
-                add_error(line_num, "구분자가 4개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 4개가 아닙니다")
-            
-        line_num = 0
-            
-        # 모든 레코드의 앞 5개 항목 비어있지 않는 지 확인
-        for line in lines:
-            line_num += 1
-            isbn, title, publisher_id, published_year, isbn_register_date = line.strip().split("/")
-            if isbn == "" or title == "" or publisher_id == "" or published_year == "" or isbn_register_date == "":
-                add_error(line_num, "모든 레코드의 앞 5개 항목이 비어있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 모든 레코드의 앞 5개 항목이 비어있습니다.")
-        
-        line_num = 0
-            
-        # ISBN 검사
-        for line in lines:
-            line_num += 1
-            isbn, title, publisher_id, published_year, isbn_register_date = line.strip().split("/")
-            # ISBN이 숫자인지 확인
-            if not isbn.isdigit() or int(isbn) > 99:
-                add_error(line_num, "ISBN이 0에서 99 사이의 정수가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - ISBN이 0에서 99 사이의 정수가 아닙니다.")
-            
-            # ISBN 중복 검사
-            isbns = [line.strip().split("/")[0] for line in lines]
-            if isbns.count(isbn) > 1:
-                add_error(line_num, "ISBN이 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - ISBN이 중복됩니다.")
-            
-            # 출판사 ID 검사
-            if not publisher_id.isdigit():
-                add_error(line_num, "출판사 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 출판사 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 책 제목에 '/'나 '\'가 포함되어 있는지 확인
-            if "/" in title or "\\" in title:
-                add_error(line_num, "책 제목에 '/'나 '\\'가 포함되어 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 책 제목에 '/'나 '\\'가 포함되어 있습니다.")
-            
-            # 출판년도 검사
-            if not published_year.isdigit():
-                add_error(line_num, "출판년도가 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 출판년도가 숫자가 아닙니다.")
-            
-            # 출판년도가 1583에서 9999 사이의 정수인지 확인
-            if int(published_year) < 1583 or int(published_year) > 9999:
-                add_error(line_num, "출판년도가 1583에서 9999 사이의 정수가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 출판년도가 1583에서 9999 사이의 정수가 아닙니다.")
-            
-            # ISBN 등록 날짜 검사
-            if not MyDate.from_str(isbn_register_date):
-                add_error(line_num, "ISBN 등록 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - ISBN 등록 날짜가 날짜 형식이 아닙니다.")
-            
-            # 등록날짜의 년도가 출판년도보다 크거나 같아야 함
-            if MyDate.from_str(isbn_register_date).year < int(published_year):
-                add_error(line_num, "ISBN 등록 날짜의 년도가 출판년도보다 작습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - ISBN 등록 날짜의 년도가 출판년도보다 작습니다.")
-            
-            # 참조 검사: Publisher ID가 출판사 테이블에 있는지 확인
-            publisher_found = False
-            for publisher in self.publisher_table:
-                if publisher.publisher_id == int(publisher_id):
-                    publisher_found = True
-                    break
+        with open(opj(file_path, "data", DATA_FILE_NAMES["isbn"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num ==1 and line == "":
+                    return (True, "")
+                
+                # 구분자가 4개인지 확인
+                fields = line.split("/")
+                if len(fields) != 5:
+                    return add_error(line_num, "구분자가 4개가 아닙니다")
+                
+                # 레코드의 앞 5개 항목 비어있지 않는 지 확인
+                isbn, title, publisher_id, published_year, isbn_register_date = fields
+                if isbn == "" or title == "" or publisher_id == "" or published_year == "" or isbn_register_date == "":
+                    return add_error(line_num, "모든 레코드의 앞 5개 항목이 비어있습니다.")
+                
+                # ISBN이 두 자리 숫자 또는 ISBN-13인지 확인
+                if not is_valid_isbn(isbn):
+                    return add_error(line_num, "ISBN이 2자리 숫자 또는 ISBN-13이 아닙니다.")
                 
-            if not publisher_found:
-                add_error(line_num, "참조하는 출판사 고유번호가 출판사 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 출판사 고유번호가 출판사 데이터에 없습니다.")
+                # ISBN 중복 검사
+                if isbn in isbns:
+                    return add_error(line_num, "ISBN이 중복됩니다.")
+                isbns.add(isbn)
+                
+                # 출판사 ID 검사
+                if not publisher_id.isdigit():
+                    return add_error(line_num, "출판사 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 책 제목에 '/'나 '\'가 포함되어 있는지 확인
+                if "/" in title or "\\" in title:
+                    return add_error(line_num, "책 제목에 '/'나 '\\'가 포함되어 있습니다.")
+                
+                # 출판년도 검사
+                if not published_year.isdigit():
+                    return add_error(line_num, "출판년도가 숫자가 아닙니다.")
+                
+                # 출판년도가 1583에서 9999 사이의 정수인지 확인
+                if int(published_year) < 1583 or int(published_year) > 9999:
+                    return add_error(line_num, "출판년도가 1583에서 9999 사이의 정수가 아닙니다.")
+                
+                # ISBN 등록 날짜 검사
+                isbn_register_date = dates[isbn_register_date]
+                if not isbn_register_date:
+                    return add_error(line_num, "ISBN 등록 날짜가 날짜 형식이 아닙니다.")
+                
+                # 등록날짜의 년도가 출판년도보다 크거나 같아야 함
+                if isbn_register_date.year < int(published_year):
+                    return add_error(line_num, "ISBN 등록 날짜의 년도가 출판년도보다 작습니다.")
             
         return (True, "")
 
-    def check_data_author_files(self,file_path: str) -> tuple[bool, str]:
+    def check_data_author_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Author.txt"), opj(self.file_path, "data", f"Libsystem_Data_Author-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_Author-{now}.bak"), "a",encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
+            return (False, self.add_error_backup("author", line_num, error_message))
 
-        with open(opj(file_path, "data", "Libsystem_Data_Author.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-            
         line_num = 0
         
-        # 구분자가 2개인지 확인
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if line_num ==1 and line == "":
-                return (True, "")
-            if len(line.strip().split("/")) != 3:
-                add_error(line_num, "구분자가 2개가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 2개가 아닙니다.")
-            
-        line_num = 0
-
-        # 모든 레코드의 앞 3개 항목 비어있지 않는 지 확인
-        for line in lines:
-            line_num += 1
-            author_id, name, deleted = line.strip().split("/")
-            if author_id == "" or name == "" or deleted == "":
-                add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 필수항목 중 비어있는 항목이 있습니다.")
-            
-        line_num = 0
-
-        # 저자 ID 검사
-        for line in lines:
-            line_num += 1
-            author_id, name, deleted = line.strip().split("/")
-            # 저자 ID가 숫자인지 확인
-            if not author_id.isdigit() or author_id == "0":
-                add_error(line_num, "저자 ID가 1 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 저자 ID가 1 이상의 숫자가 아닙니다.")
-            
-            # 저자 ID 중복 검사
-            author_ids = [line.strip().split("/")[0] for line in lines]
-            if author_ids.count(author_id) > 1:
-                add_error(line_num, "저자 ID가 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 저자 ID가 중복됩니다.")
-            
-            # 저자 식별번호는 1부터 1씩 증가해야 함
-            if int(author_id) != line_num:
-                add_error(line_num, "저자 식별번호는 1부터 1씩 증가해야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 저자 식별번호는 1부터 1씩 증가해야 합니다.")
-            
-            # 저자 이름에 '/'나 '\'가 포함되어 있는지 확인
-            if "/" in name or "\\" in name:
-                add_error(line_num, "저자 이름에 '/'나 '\\'가 포함되어 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 저자 이름에 '/'나 '\\'가 포함되어 있습니다.")
-            
-            # 삭제 여부 검사
-            if deleted not in ["0", "1"]:
-                add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 삭제 여부가 0 또는 1이 아닙니다.")
+        with open(opj(file_path, "data", DATA_FILE_NAMES["author"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num ==1 and line == "":
+                    return (True, "")
+                
+                # 구분자가 2개인지 확인
+                fields = line.split("/")
+                if len(fields) != 3:
+                    return add_error(line_num, "구분자가 2개가 아닙니다.")
+                
+                # 레코드의 앞 3개 항목 비어있지 않는 지 확인
+                author_id, name, deleted = fields
+                if author_id == "" or name == "" or deleted == "":
+                    return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+                
+                # 저자 ID가 숫자인지 확인
+                if not author_id.isdigit() or author_id == "0":
+                    return add_error(line_num, "저자 ID가 1 이상의 숫자가 아닙니다.")
+                
+                # 저자 ID 중복 검사
+                if int(author_id) < line_num:
+                    return add_error(line_num, "저자 ID가 중복됩니다.")
+                
+                # 저자 식별번호는 1부터 1씩 증가해야 함
+                if int(author_id) != line_num:
+                    return add_error(line_num, "저자 식별번호는 1부터 1씩 증가해야 합니다.")
+                
+                # 저자 이름에 '/'나 '\'가 포함되어 있는지 확인
+                if "/" in name or "\\" in name:
+                    return add_error(line_num, "저자 이름에 '/'나 '\\'가 포함되어 있습니다.")
+                
+                # 삭제 여부 검사
+                if deleted not in ["0", "1"]:
+                    return add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
             
         return (True, "")
 
-
-    def check_data_isbn_author_files(self,file_path: str) -> tuple[bool, str]:
+    def check_data_isbn_author_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_IsbnAuthor.txt"), opj(self.file_path, "data", f"Libsystem_Data_IsbnAuthor-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_IsbnAuthor-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
+            return (False, self.add_error_backup("isbn_author", line_num, error_message))
 
-        with open(opj(file_path, "data", "Libsystem_Data_IsbnAuthor.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-            
         line_num = 0
+        isbn_author_ids = set()
         
-        # 구분자가 1개인지 확인
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if line_num ==1 and line == "":
-                return (True, "")
-            
-            if len(line.strip().split("/")) != 2:
-                add_error(line_num, "구분자가 1개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 1개가 아닙니다")
-            
-        line_num = 0
-
-        # 모든 레코드의 앞 2개 항목 비어있지 않는 지 확인
-        for line in lines:
-            line_num += 1
-            isbn, author_id = line.strip().split("/")
-            if isbn == "" or author_id == "":
-                add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 필수항목 중 비어있는 항목이 있습니다.")
-            
-        line_num = 0
-
-        # ISBN 검사
-        for line in lines:
-            line_num += 1
-            isbn, author_id = line.strip().split("/")
-            # ISBN이 숫자인지 확인
-            if not isbn.isdigit() or int(isbn) > 99:
-                add_error(line_num, "ISBN이 0에서 99 사이의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - ISBN이 0에서 99 사이의 숫자가 아닙니다.")
-            
-            # 저자 ID 검사
-            if not author_id.isdigit() or int(author_id) < 1:
-                add_error(line_num, "저자 ID가 1 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 저자 ID가 1 이상의 숫자가 아닙니다.")
-            
-            # ISBN-저자 ID 중복 검사
-            isbn_author_ids = [line.strip().split("/") for line in lines]
-            if isbn_author_ids.count([isbn, author_id]) > 1:
-                add_error(line_num, "중복된 ISBN-저자 관계가 발견되었습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 중복된 ISBN-저자 관계가 발견되었습니다.")
-            
-            
-            # ISBN 참조 무결성 검사
-            isbn_found = False
-            for isbn_record in self.isbn_table:
-                if isbn_record.isbn == int(line.strip().split("/")[0]):
-                    isbn_found = True
-                    break
+        with open(opj(file_path, "data", DATA_FILE_NAMES["isbn_author"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num ==1 and line == "":
+                    return (True, "")
                 
-            if not isbn_found:
-                add_error(line_num, "참조하는 ISBN이 ISBN 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 ISBN이 ISBN 데이터에 없습니다.")
-            
-            # 저자 ID 참조 무결성 검사
-            author_id_found = False
-            for author_record in self.author_table:
-                if author_record.author_id == int(line.strip().split("/")[1]):
-                    author_id_found = True
-                    break
-            
-            if not author_id_found:
-                add_error(line_num, "참조하는 저자 식별번호가 저자 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 저자 식별번호가 저자 데이터에 없습니다.")
-        
+                # 구분자가 1개인지 확인
+                fields = line.split("/")
+                if len(fields) != 2:
+                    return add_error(line_num, "구분자가 1개가 아닙니다")
+                
+                # 레코드의 앞 2개 항목 비어있지 않는 지 확인
+                isbn, author_id = fields
+                if isbn == "" or author_id == "":
+                    return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+                
+                # ISBN이 두 자리 숫자 또는 ISBN-13인지 확인
+                if not is_valid_isbn(isbn):
+                    return add_error(line_num, "ISBN이 2자리 숫자 또는 ISBN-13이 아닙니다.")
+                
+                # 저자 ID 검사
+                if not author_id.isdigit() or int(author_id) < 1:
+                    return add_error(line_num, "저자 ID가 1 이상의 숫자가 아닙니다.")
+                
+                # ISBN-저자 ID 중복 검사
+                if (isbn, author_id) in isbn_author_ids:
+                    return add_error(line_num, "중복된 ISBN-저자 관계가 발견되었습니다.")
+                isbn_author_ids.add((isbn, author_id))
         
         return (True, "")
 
-    def check_data_borrow_files(self,file_path: str) -> tuple[bool, str]:
+    def check_data_borrow_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
+        if dates is None:
+            dates = SharedDates()
+        
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Borrow.txt"), opj(self.file_path, "data", f"Libsystem_Data_Borrow-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_Borrow-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
+            return (False, self.add_error_backup("borrow", line_num, error_message))
 
-        with open(opj(file_path, "data", "Libsystem_Data_Borrow.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-            
         line_num = 0
+        borrowing_book_ids = set()  # 반납되지 않은 대출의 책 ID
         
-        # 구분자가 6개인지 확인
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if line_num ==1 and line == "":
-                return (True, "")
-            if len(line.strip().split("/")) != 7:
-                add_error(line_num, "구분자가 6개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 6개가 아닙니다")
-            
-            # book_id 참조 무결성 검사
-            book_id_found = False
-            for book_record in self.book_table:
-                if book_record.book_id == int(line.strip().split("/")[1]):
-                    book_id_found = True
-                    break
+        with open(opj(file_path, "data", DATA_FILE_NAMES["borrow"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num ==1 and line == "":
+                    return (True, "")
                 
-            if not book_id_found:
-                add_error(line_num, "참조하는 책 고유번호가 책 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 책 고유번호가 책 데이터에 없습니다.")
-            
-            # user_id 참조 무결성 검사
-            user_id_found = False
-            for user_record in self.user_table:
-                if user_record.user_id == int(line.strip().split("/")[2]):
-                    user_id_found = True
-                    break
+                # 구분자가 6개인지 확인
+                fields = line.split("/")
+                if len(fields) != 7:
+                    return add_error(line_num, "구분자가 6개가 아닙니다")
                 
-            if not user_id_found:
-                add_error(line_num, "참조하는 사용자 고유번호가 사용자 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 사용자 고유번호가 사용자 데이터에 없습니다.")
-            
-        line_num = 0
-
-        # 모든 레코드의 앞 6개 항목 비어있지 않는 지 확인
-        for line in lines:
-            line_num += 1
-            borrow_id,book_id, user_id, borrow_date, return_date, actual_return_date, deleted = line.strip().split("/")
-            if borrow_id=="" or book_id == "" or user_id == "" or borrow_date == "" or return_date == "" or deleted == "":
-                add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 필수항목 중 비어있는 항목이 있습니다.")
-            
-        line_num = 0
-
-        for line in lines:
-            line_num += 1
-            borrow_id,book_id, user_id, borrow_date, return_date, actual_return_date, deleted = line.strip().split("/")
-            # 대출 ID가 숫자인지 확인
-            if not borrow_id.isdigit():
-                add_error(line_num, "대출 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 대출 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 대출 ID 중복 검사
-            borrow_ids = [line.strip().split("/")[0] for line in lines]
-            if borrow_ids.count(borrow_id) > 1:
-                add_error(line_num, "대출 ID가 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 대출 ID가 중복됩니다.")
-             
-            # 고유번호는 0부터 1씩 증가해야 함
-            if int(borrow_id) != line_num - 1:
-                add_error(line_num, "대출 고유번호는 0부터 1씩 증가해야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 대출 고유번호는 0부터 1씩 증가해야 합니다.")
-             
-            # 책 ID가 숫자인지 확인
-            if not book_id.isdigit():
-                add_error(line_num, "책 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 책 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 책 ID 중복 검사
-            book_ids = [line.strip().split("/")[1] for line in lines]
-            if book_ids.count(book_id) > 1:
-                add_error(line_num, "책 ID가 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 책 ID가 중복됩니다.")
-            
-            # 사용자 ID 검사
-            if not user_id.isdigit():
-                add_error(line_num, "사용자 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 사용자 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 대출 날짜 검사
-            if not MyDate.from_str(borrow_date):
-                add_error(line_num, "대출 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 대출 날짜가 날짜 형식이 아닙니다.")
-            
-            # 반납 날짜 검사
-            if not MyDate.from_str(return_date):
-                add_error(line_num, "반납 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 반납 날짜가 날짜 형식이 아닙니다.")
-            
-            # 실제 반납 날짜 검사(실제 반납 존재 시)
-            if actual_return_date != "" and not MyDate.from_str(actual_return_date):
-                add_error(line_num, "실제 반납 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 실제 반납 날짜가 날짜 형식이 아닙니다.")
-            
-            # 실제 반납 날짜가 대출 날짜 이후인지 확인(실제 반납 존재 시)
-            if actual_return_date != "" and MyDate.from_str(actual_return_date) < MyDate.from_str(borrow_date):
-                add_error(line_num, "실제 반납 날짜가 대출 날짜 이전입니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 실제 반납 날짜가 대출 날짜 이전입니다.")
-            
-            # 반납 날짜가 대출 날짜 이후인지 확인
-            if MyDate.from_str(return_date) < MyDate.from_str(borrow_date):
-                add_error(line_num, "반납 날짜가 대출 날짜 이전입니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 반납 날짜가 대출 날짜 이전입니다.")
-            
-            # 삭제 여부 검사
-            if deleted not in ["0", "1"]:
-                add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 삭제 여부가 0 또는 1이 아닙니다.")
+                # 레코드의 앞 6개 항목 비어있지 않는 지 확인
+                borrow_id,book_id, user_id, borrow_date, return_date, actual_return_date, deleted = fields
+                if borrow_id=="" or book_id == "" or user_id == "" or borrow_date == "" or return_date == "" or deleted == "":
+                    return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+                
+                # 대출 ID가 숫자인지 확인
+                if not borrow_id.isdigit():
+                    return add_error(line_num, "대출 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 대출 ID 중복 검사
+                if int(borrow_id) < line_num - 1:
+                    return add_error(line_num, "대출 ID가 중복됩니다.")
+                 
+                # 고유번호는 0부터 1씩 증가해야 함
+                if int(borrow_id) != line_num - 1:
+                    return add_error(line_num, "대출 고유번호는 0부터 1씩 증가해야 합니다.")
+                 
+                # 책 ID가 숫자인지 확인
+                if not book_id.isdigit():
+                    return add_error(line_num, "책 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 책 ID 중복 검사 (반납된 책은 다시 대출할 수 있으므로 반납되지 않은 대출끼리만 비교)
+                if actual_return_date == "":
+                    if book_id in borrowing_book_ids:
+                        return add_error(line_num, "반납되지 않은 대출의 책 ID가 중복됩니다.")
+                    borrowing_book_ids.add(book_id)
+                
+                # 사용자 ID 검사
+                if not user_id.isdigit():
+                    return add_error(line_num, "사용자 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 대출 날짜 검사
+                borrow_date = dates[borrow_date]
+                if not borrow_date:
+                    return add_error(line_num, "대출 날짜가 날짜 형식이 아닙니다.")
+                
+                # 반납 날짜 검사
+                return_date = dates[return_date]
+                if not return_date:
+                    return add_error(line_num, "반납 날짜가 날짜 형식이 아닙니다.")
+                
+                if actual_return_date != "":
+                    # 실제 반납 날짜 검사(실제 반납 존재 시)
+                    actual_return_date = dates[actual_return_date]
+                    if not actual_return_date:
+                        return add_error(line_num, "실제 반납 날짜가 날짜 형식이 아닙니다.")
+                    
+                    # 실제 반납 날짜가 대출 날짜 이후인지 확인(실제 반납 존재 시)
+                    if actual_return_date < borrow_date:
+                        return add_error(line_num, "실제 반납 날짜가 대출 날짜 이전입니다.")
+                
+                # 반납 날짜가 대출 날짜 이후인지 확인
+                if return_date < borrow_date:
+                    return add_error(line_num, "반납 날짜가 대출 날짜 이전입니다.")
+                
+                # 삭제 여부 검사
+                if deleted not in ["0", "1"]:
+                    return add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
             
         return (True, "")
 
-    def check_data_user_files(self,file_path: str) -> tuple[bool, str]:
+    def check_data_user_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_User.txt"), opj(self.file_path, "data", f"Libsystem_Data_User-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_User-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
+            return (False, self.add_error_backup("user", line_num, error_message))
 
-        with open(opj(file_path, "data", "Libsystem_Data_User.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-            
         line_num = 0
         
-        # 구분자가 3개인지 확인
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if line_num ==1 and line == "":
-                return (True, "")
-            if len(line.strip().split("/")) != 4:
-                add_error(line_num, "구분자가 3개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 3개가 아닙니다")
-            
-        line_num = 0
-
-        # 모든 레코드의 앞 4개 항목 비어있지 않는 지 확인
-        for line in lines:
-            line_num += 1
-            user_id, phone_number, name, deleted = line.strip().split("/")
-            if user_id == "" or phone_number == "" or name == "" or deleted == "":
-                add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 필수항목 중 비어있는 항목이 있습니다.")
-            
-        line_num = 0
-
-        # 사용자 ID 검사
-        for line in lines:
-            line_num += 1
-            user_id, phone_number, name, deleted = line.strip().split("/")
-            # 사용자 ID가 숫자인지 확인
-            if not user_id.isdigit():
-                add_error(line_num, "사용자 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 사용자 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 사용자 ID 중복 검사
-            user_ids = [line.strip().split("/")[0] for line in lines]
-            if user_ids.count(user_id) > 1:
-                add_error(line_num, "사용자 ID가 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 사용자 ID가 중복됩니다.")
-            
-            # 고유번호는 0부터 1씩 증가해야 함
-            if int(user_id) != line_num - 1:
-                add_error(line_num, "사용자 고유번호는 0부터 1씩 증가해야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 사용자 고유번호는 0부터 1씩 증가해야 합니다.")
-            
-            # 전화번호 검사(010-1234-5678 형식)
-            if not re.match(r"01[0-9]-[0-9]{4}-[0-9]{4}", phone_number):
-                add_error(line_num, "전화번호 형식이 잘못되었습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 전화번호 형식이 잘못되었습니다.")
-            
-            
-            # 이름에 '/'나 '\'가 포함되어 있는지 확인
-            if "/" in name or "\\" in name:
-                add_error(line_num, "이름에 '/'나 '\\'가 포함되어 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 이름에 '/'나 '\\'가 포함되어 있습니다.")
-            
-            # 삭제 여부 검사
-            if deleted not in ["0", "1"]:
-                add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 삭제 여부가 0 또는 1이 아닙니다.")
+        with open(opj(file_path, "data", DATA_FILE_NAMES["user"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num ==1 and line == "":
+                    return (True, "")
+                
+                # 구분자가 3개인지 확인
+                fields = line.split("/")
+                if len(fields) != 4:
+                    return add_error(line_num, "구분자가 3개가 아닙니다")
+                
+                # 레코드의 앞 4개 항목 비어있지 않는 지 확인
+                user_id, phone_number, name, deleted = fields
+                if user_id == "" or phone_number == "" or name == "" or deleted == "":
+                    return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+                
+                # 사용자 ID가 숫자인지 확인
+                if not user_id.isdigit():
+                    return add_error(line_num, "사용자 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 사용자 ID 중복 검사
+                if int(user_id) < line_num - 1:
+                    return add_error(line_num, "사용자 ID가 중복됩니다.")
+                
+                # 고유번호는 0부터 1씩 증가해야 함
+                if int(user_id) != line_num - 1:
+                    return add_error(line_num, "사용자 고유번호는 0부터 1씩 증가해야 합니다.")
+                
+                # 전화번호 검사(010-1234-5678 형식)
+                if not re.match(r"01[0-9]-[0-9]{4}-[0-9]{4}", phone_number):
+                    return add_error(line_num, "전화번호 형식이 잘못되었습니다.")
+                
+                # 이름에 '/'나 '\'가 포함되어 있는지 확인
+                if "/" in name or "\\" in name:
+                    return add_error(line_num, "이름에 '/'나 '\\'가 포함되어 있습니다.")
+                
+                # 삭제 여부 검사
+                if deleted not in ["0", "1"]:
+                    return add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
             
         return (True, "")
 
-    def check_data_publisher_files(self,file_path: str) -> tuple[bool, str]:
+    def check_data_publisher_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Publisher.txt"), opj(self.file_path, "data", f"Libsystem_Data_Publisher-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_Publisher-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
+            return (False, self.add_error_backup("publisher", line_num, error_message))
 
-        with open(opj(file_path, "data", "Libsystem_Data_Publisher.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-            
         line_num = 0
-
-        # 구분자가 2개인지 확인
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if line_num ==1 and line == "":
-                return (True, "")
-            if len(line.strip().split("/")) != 3:
-                add_error(line_num, "구분자가 2개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 2개가 아닙니다")
+        
+        with open(opj(file_path, "data", DATA_FILE_NAMES["publisher"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num ==1 and line == "":
+                    return (True, "")
+                
+                # 구분자가 2개인지 확인
+                fields = line.split("/")
+                if len(fields) != 3:
+                    return add_error(line_num, "구분자가 2개가 아닙니다")
+                
+                # 레코드의 앞 3개 항목 비어있지 않는 지 확인
+                publisher_id, name, deleted = fields
+                if publisher_id == "" or name == "" or deleted == "":
+                    return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+                
+                # 출판사 ID 검사
+                if not publisher_id.isdigit():
+                    return add_error(line_num, "출판사 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 출판사 ID 중복 검사
+                if int(publisher_id) < line_num - 1:
+                    return add_error(line_num, "출판사 ID가 중복됩니다.")
+                
+                # 고유번호는 0부터 1씩 증가해야 함
+                if int(publisher_id) != line_num - 1:
+                    return add_error(line_num, "출판사 고유번호는 0부터 1씩 증가해야 합니다.")
+                
+                # 이름에 '/'나 '\'가 포함되어 있는지 확인
+                if "/" in name or "\\" in name:
+                    return add_error(line_num, "출판사 이름에 '/'나 '\\'가 포함되어 있습니다.")
+                
+                # 삭제 여부 검사
+                if deleted not in ["0", "1"]:
+                    return add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
             
-        line_num = 0
+        return (True, "")
+    
+    def check_data_overdue_penalty_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
+        if dates is None:
+            dates = SharedDates()
+        
+        # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
+        def add_error(line_num, error_message):
+            return (False, self.add_error_backup("overdue_penalty", line_num, error_message))
 
-        # 모든 레코드의 앞 3개 항목 비어있지 않는 지 확인
-        for line in lines:
-            line_num += 1
-            publisher_id, name, deleted = line.strip().split("/")
-            if publisher_id == "" or name == "" or deleted == "":
-                add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 필수항목 중 비어있는 항목이 있습니다.")
-            
         line_num = 0
 
-        # 출판사 ID 검사
-        for line in lines:
-            line_num += 1
-            publisher_id, name, deleted = line.strip().split("/")
-            # 출판사 ID가 숫자인지 확인
-              # 출판사 ID 검사
-            if not publisher_id.isdigit():
-                add_error(line_num, "출판사 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 출판사 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 출판사 ID 중복 검사
-            publisher_ids = [line.strip().split("/")[0] for line in lines]
-            if publisher_ids.count(publisher_id) > 1:
-                add_error(line_num, "출판사 ID가 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 출판사 ID가 중복됩니다.")
-            
-            # 고유번호는 0부터 1씩 증가해야 함
-            if int(publisher_id) != line_num - 1:
-                add_error(line_num, "출판사 고유번호는 0부터 1씩 증가해야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 출판사 고유번호는 0부터 1씩 증가해야 합니다.")
-            
-            # 이름에 '/'나 '\'가 포함되어 있는지 확인
-            if "/" in name or "\\" in name:
-                add_error(line_num, "출판사 이름에 '/'나 '\\'가 포함되어 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 출판사 이름에 '/'나 '\\'가 포함되어 있습니다.")
-            
-            # 삭제 여부 검사
-            if deleted not in ["0", "1"]:
-                add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 삭제 여부가 0 또는 1이 아닙니다.")
+        with open(opj(file_path, "data", DATA_FILE_NAMES["overdue_penalty"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                if line_num ==1 and line == "":
+                    return (True, "")
+                
+                # 구분자가 3개인지 확인
+                fields = line.split("/")
+                if len(fields) != 4:
+                    return add_error(line_num, "구분자가 3개가 아닙니다")
+
+                # 레코드의 앞 4개 항목 비어있지 않는 지 확인
+                panalty_id, user_id, panalty_start_date, panalty_end_date = fields
+                if panalty_id == "" or user_id == "" or panalty_start_date == "" or panalty_end_date == "":
+                    return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+                
+                # 패널티 ID가 숫자인지 확인
+                if not panalty_id.isdigit():
+                    return add_error(line_num, "패널티 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 패널티 ID 중복 검사
+                if int(panalty_id) < line_num - 1:
+                    return add_error(line_num, "패널티 ID가 중복됩니다.")
+                
+                # 고유번호는 0부터 1씩 증가해야 함
+                if int(panalty_id) != line_num - 1:
+                    return add_error(line_num, "연체 패널티 고유번호는 0부터 1씩 증가해야 합니다.")
+                
+                # 사용자 ID가 숫자인지 확인
+                if not user_id.isdigit():
+                    return add_error(line_num, "사용자 ID가 0 이상의 숫자가 아닙니다.")
+                
+                # 패널티 시작 날짜 검사
+                panalty_start_date = dates[panalty_start_date]
+                if not panalty_start_date:
+                    return add_error(line_num, "패널티 시작 날짜가 날짜 형식이 아닙니다.")
+                
+                # 패널티 종료 날짜 검사
+                panalty_end_date = dates[panalty_end_date]
+                if not panalty_end_date:
+                    return add_error(line_num, "패널티 종료 날짜가 날짜 형식이 아닙니다.")
+                
+                # 패널티 종료 날짜가 패널티 시작 날짜 이후인지 확인
+                if panalty_end_date < panalty_start_date:
+                    return add_error(line_num, "패널티 종료 날짜가 패널티 시작 날짜 이전입니다.")
             
         return (True, "")
     
-    def check_data_overdue_penalty_files(self,file_path: str) -> tuple[bool, str]:
+    def check_data_log_files(self, file_path: str, dates: SharedDates=None) -> tuple[bool, str]:
+        if dates is None:
+            dates = SharedDates()
+        
         # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_OverduePenalty.txt"), opj(self.file_path, "data", f"Libsystem_Data_OverduePenalty-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_OverduePenalty-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
-
-        with open(opj(file_path, "data", "Libsystem_Data_OverduePenalty.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
+            return (False, self.add_error_backup("log", line_num, error_message))
 
         line_num = 0
-
-        # 모든 레코드의 앞 4개 항목 비어있지 않는 지 확인
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if line_num ==1 and line == "":
+        last_log_date = None
+        
+        # log_id / isbn / book_id / borrow_id / log_date / log_type
+        with open(opj(file_path, "data", DATA_FILE_NAMES["log"]), "r", encoding='utf-8') as f:
+            for line in f:
+                line_num += 1
+                line = line.strip()
+                
+                # 구분자가 5개인지 확인
+                fields = line.split("/")
+                if len(fields) != 6:
+                    return add_error(line_num, "구분자가 5개가 아닙니다")
+            
+                # log_id, isbn, log_date, log_type은 빈 값일 수 없음
+                log_id, isbn, book_id, borrow_id, log_date, log_type = fields
+                if log_id == "" or isbn == "" or log_date == "" or log_type == "":
+                    return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+                
+                # 자료형 검사
+                if not log_id.isdigit():
+                    return add_error(line_num, "로그 고유번호가 0 이상의 숫자가 아닙니다.")
+                
+                if not is_valid_isbn(isbn):
+                    return add_error(line_num, "ISBN이 2자리 숫자 또는 ISBN-13이 아닙니다.")
+                
+                # book_id, borrow_id는 정수
+                if book_id != "" and not book_id.isdigit():
+                    return add_error(line_num, "책 고유번호가 0 이상의 숫자가 아닙니다.")
+                
+                if borrow_id != "" and not borrow_id.isdigit():
+                    return add_error(line_num, "대출 고유번호가 0 이상의 숫자가 아닙니다.")
+                
+                # 고유번호는 0부터 1씩 증가해야 함
+                if int(log_id) != line_num - 1:
+                    return add_error(line_num, "로그 고유번호는 0부터 1씩 증가해야 합니다.")
+                
+                # log type 검사
+                if log_type not in ["BOOK_REGISTER", "ISBN_EDIT", "BOOK_BORROW", "BOOK_RETURN", "BOOK_DELETE"]:
+                    return add_error(line_num, "로그 타입이 올바른 값이 아닙니다.")
+                
+                # log date 검사
+                log_date = dates[log_date]
+                if not log_date:
+                    return add_error(line_num, "로그 날짜가 날짜 형식이 아닙니다.")
+                
+                # 고유번호는 날짜 오름차순으로 존재해야 함 (이전 날짜보다 크거나 같음)
+                if last_log_date is not None and log_date < last_log_date:
+                    return add_error(line_num, "로그 날짜는 오름차순으로 정렬되어야 합니다.")
+                
+                last_log_date = log_date
+                
+        return (True, "")
+    
+    # ========== mmap 데이터 파일 형식 검사 (check_data_*_files와 같은 검사를 바이트로 수행) ========== #
+    def check_mapped_borrow_file(self, buffer) -> tuple[bool, str]:
+        def add_error(line_num, error_message):
+            return (False, self.add_error_backup("borrow", line_num, error_message))
+        
+        borrowing_book_ids = set()  # 반납되지 않은 대출의 책 ID
+        dates = dict()
+        
+        for line_num, (start, end) in enumerate(iter_mapped_lines(buffer), start=1):
+            line = buffer[start:end].strip()
+            if line_num == 1 and line == b"":
                 return (True, "")
-            # 구분자가 3개인지 확인
-            if len(line.strip().split("/")) != 4:
-                add_error(line_num, "구분자가 3개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 3개가 아닙니다")
-
-            panalty_id, user_id, panalty_start_date, panalty_end_date = line.strip().split("/")
-            if panalty_id == "" or user_id == "" or panalty_start_date == "" or panalty_end_date == "":
-                add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 필수항목 중 비어있는 항목이 있습니다.")
-            
-            # 패널티 ID가 숫자인지 확인
-            if not panalty_id.isdigit():
-                add_error(line_num, "패널티 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 패널티 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 패널티 ID 중복 검사
-            panalty_ids = [line.strip().split("/")[0] for line in lines]
-            if panalty_ids.count(panalty_id) > 1:
-                add_error(line_num, "패널티 ID가 중복됩니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 패널티 ID가 중복됩니다.")
-            
-            # 고유번호는 0부터 1씩 증가해야 함
-            if int(panalty_id) != line_num - 1:
-                add_error(line_num, "연체 패널티 고유번호는 0부터 1씩 증가해야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 연체 패널티 고유번호는 0부터 1씩 증가해야 합니다.")
-            
-            # 사용자 ID가 숫자인지 확인
+            
+            fields = line.split(b"/")
+            if len(fields) != 7:
+                return add_error(line_num, "구분자가 6개가 아닙니다")
+            
+            borrow_id, book_id, user_id, borrow_date, return_date, actual_return_date, deleted = fields
+            if borrow_id == b"" or book_id == b"" or user_id == b"" or borrow_date == b"" or return_date == b"" or deleted == b"":
+                return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+            
+            if not borrow_id.isdigit():
+                return add_error(line_num, "대출 ID가 0 이상의 숫자가 아닙니다.")
+            
+            if int(borrow_id) < line_num - 1:
+                return add_error(line_num, "대출 ID가 중복됩니다.")
+            
+            if int(borrow_id) != line_num - 1:
+                return add_error(line_num, "대출 고유번호는 0부터 1씩 증가해야 합니다.")
+            
+            if not book_id.isdigit():
+                return add_error(line_num, "책 ID가 0 이상의 숫자가 아닙니다.")
+            
+            if actual_return_date == b"":
+                if book_id in borrowing_book_ids:
+                    return add_error(line_num, "반납되지 않은 대출의 책 ID가 중복됩니다.")
+                borrowing_book_ids.add(book_id)
+            
             if not user_id.isdigit():
-                add_error(line_num, "사용자 ID가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 사용자 ID가 0 이상의 숫자가 아닙니다.")
-            
-            # 패널티 시작 날짜 검사
-            if not MyDate.from_str(panalty_start_date):
-                add_error(line_num, "패널티 시작 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 패널티 시작 날짜가 날짜 형식이 아닙니다.")
-            
-            # 패널티 종료 날짜 검사
-            if not MyDate.from_str(panalty_end_date):
-                add_error(line_num, "패널티 종료 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 패널티 종료 날짜가 날짜 형식이 아닙니다.")
-            
-            # 패널티 종료 날짜가 패널티 시작 날짜 이후인지 확인
-            if MyDate.from_str(panalty_end_date) < MyDate.from_str(panalty_start_date):
-                add_error(line_num, "패널티 종료 날짜가 패널티 시작 날짜 이전입니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 패널티 종료 날짜가 패널티 시작 날짜 이전입니다.")
-            
-            # 사용자 고유번호 참조 무결성 검사
-            user_id_found = False
-            for user_record in self.user_table:
-                if user_record.user_id == int(user_id):
-                    user_id_found = True
-                    break
+                return add_error(line_num, "사용자 ID가 0 이상의 숫자가 아닙니다.")
+            
+            borrow_date = mapped_date(dates, borrow_date)
+            if not borrow_date:
+                return add_error(line_num, "대출 날짜가 날짜 형식이 아닙니다.")
+            
+            return_date = mapped_date(dates, return_date)
+            if not return_date:
+                return add_error(line_num, "반납 날짜가 날짜 형식이 아닙니다.")
+            
+            if actual_return_date != b"":
+                actual_return_date = mapped_date(dates, actual_return_date)
+                if not actual_return_date:
+                    return add_error(line_num, "실제 반납 날짜가 날짜 형식이 아닙니다.")
                 
-            if not user_id_found:
-                add_error(line_num, "참조하는 사용자 고유번호가 사용자 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 사용자 고유번호가 사용자 데이터에 없습니다.")
+                if actual_return_date < borrow_date:
+                    return add_error(line_num, "실제 반납 날짜가 대출 날짜 이전입니다.")
             
+            if return_date < borrow_date:
+                return add_error(line_num, "반납 날짜가 대출 날짜 이전입니다.")
+            
+            if deleted not in (b"0", b"1"):
+                return add_error(line_num, "삭제 여부가 0 또는 1이 아닙니다.")
+        
         return (True, "")
     
-    def check_data_log_files(self, file_path: str) -> tuple[bool, str]:
-        # 오류 발생한 줄과 오류 메세지 파일의 마지막 줄에 추가
+    def check_mapped_log_file(self, buffer) -> tuple[bool, str]:
         def add_error(line_num, error_message):
-            now = datetime.now().strftime("%Y%m%d_%H%M%S")
-            shutil.copy(opj(self.file_path, "data", "Libsystem_Data_Log.txt"), opj(self.file_path, "data", f"Libsystem_Data_Log-{now}.bak"))
-            with open(opj(file_path, "data", f"Libsystem_Data_Log-{now}.bak"), "a", encoding='utf-8') as f:
-                f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
-
-        with open(opj(file_path, "data", "Libsystem_Data_Log.txt"), "r", encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        line_num = 0
+            return (False, self.add_error_backup("log", line_num, error_message))
+        
         last_log_date = None
+        dates = dict()
+        valid_isbns = set()  # 이미 검사한 ISBN (같은 ISBN의 체크 숫자는 한 번만 계산)
+        log_types = (b"BOOK_REGISTER", b"ISBN_EDIT", b"BOOK_BORROW", b"BOOK_RETURN", b"BOOK_DELETE")
         
-        # log_id / isbn / book_id / borrow_id / log_date / log_type
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            
-            # 구분자가 5개인지 확인
-            if len(line.split("/")) != 6:
-                add_error(line_num, "구분자가 5개가 아닙니다")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 구분자가 5개가 아닙니다")
-        
-            # log_id, isbn, log_date, log_type은 빈 값일 수 없음
-            log_id, isbn, book_id, borrow_id, log_date, log_type = line.split("/")
-            if log_id == "" or isbn == "" or log_date == "" or log_type == "":
-                add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 필수항목 중 비어있는 항목이 있습니다.")
-            
-            # 자료형 검사
+        for line_num, (start, end) in enumerate(iter_mapped_lines(buffer), start=1):
+            fields = buffer[start:end].strip().split(b"/")
+            if len(fields) != 6:
+                return add_error(line_num, "구분자가 5개가 아닙니다")
+            
+            log_id, isbn, book_id, borrow_id, log_date, log_type = fields
+            if log_id == b"" or isbn == b"" or log_date == b"" or log_type == b"":
+                return add_error(line_num, "필수항목 중 비어있는 항목이 있습니다.")
+            
             if not log_id.isdigit():
-                add_error(line_num, "로그 고유번호가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 로그 고유번호가 0 이상의 숫자가 아닙니다.")
+                return add_error(line_num, "로그 고유번호가 0 이상의 숫자가 아닙니다.")
             
-            if not isbn.isdigit() or int(isbn) > 99 or len(isbn) != 2:
-                add_error(line_num, "ISBN이 00 이상, 99 이하의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - ISBN이 00 이상, 99 이하의 숫자가 아닙니다")
+            if isbn not in valid_isbns:
+                if not (isbn.isdigit() and is_valid_isbn(isbn.decode("ascii"))):
+                    return add_error(line_num, "ISBN이 2자리 숫자 또는 ISBN-13이 아닙니다.")
+                valid_isbns.add(isbn)
             
-            # book_id, borrow_id는 정수
-            if book_id != "" and not book_id.isdigit():
-                add_error(line_num, "책 고유번호가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 책 고유번호가 0 이상의 숫자가 아닙니다.")
+            if book_id != b"" and not book_id.isdigit():
+                return add_error(line_num, "책 고유번호가 0 이상의 숫자가 아닙니다.")
             
-            if borrow_id != "" and not borrow_id.isdigit():
-                add_error(line_num, "대출 고유번호가 0 이상의 숫자가 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 대출 고유번호가 0 이상의 숫자가 아닙니다.")
+            if borrow_id != b"" and not borrow_id.isdigit():
+                return add_error(line_num, "대출 고유번호가 0 이상의 숫자가 아닙니다.")
             
-            # 고유번호는 0부터 1씩 증가해야 함
             if int(log_id) != line_num - 1:
-                add_error(line_num, "로그 고유번호는 0부터 1씩 증가해야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 로그 고유번호는 0부터 1씩 증가해야 합니다.")
-            
-            # 참조하는 ISBN, Book ID, Borrow ID가 존재하는지 확인
-            isbn_found = False
-            for isbn_record in self.isbn_table:
-                if isbn_record.isbn == int(isbn):
-                    isbn_found = True
-                    break
-                
-            if not isbn_found:
-                add_error(line_num, "참조하는 ISBN이 ISBN 데이터에 없습니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 ISBN이 ISBN 데이터에 없습니다.")
+                return add_error(line_num, "로그 고유번호는 0부터 1씩 증가해야 합니다.")
+            
+            if log_type not in log_types:
+                return add_error(line_num, "로그 타입이 올바른 값이 아닙니다.")
+            
+            log_date = mapped_date(dates, log_date)
+            if not log_date:
+                return add_error(line_num, "로그 날짜가 날짜 형식이 아닙니다.")
             
-            if book_id != "":
-                book_id_found = False
-                for book_record in self.book_table:
-                    if book_record.book_id == int(book_id):
-                        book_id_found = True
-                        break
-                    
-                if not book_id_found:
-                    add_error(line_num, "참조하는 책 고유번호가 책 데이터에 없습니다.")
-                    return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 책 고유번호가 책 데이터에 없습니다.")
-                
-            if borrow_id != "":
-                borrow_id_found = False
-                for borrow_record in self.borrow_table:
-                    if borrow_record.borrow_id == int(borrow_id):
-                        borrow_id_found = True
-                        break
-                    
-                if not borrow_id_found:
-                    add_error(line_num, "참조하는 대출 고유번호가 대출 데이터에 없습니다.")
-                    return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 참조하는 대출 고유번호가 대출 데이터에 없습니다.")
-                
-            # log type 검사
-            if log_type not in ["BOOK_REGISTER", "ISBN_EDIT", "BOOK_BORROW", "BOOK_RETURN", "BOOK_DELETE"]:
-                add_error(line_num, "로그 타입이 올바른 값이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 로그 타입이 올바른 값이 아닙니다.")
-            
-            # log date 검사
-            if not MyDate.from_str(log_date):
-                add_error(line_num, "로그 날짜가 날짜 형식이 아닙니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 로그 날짜가 날짜 형식이 아닙니다.")
-            
-            # 고유번호는 날짜 오름차순으로 존재해야 함 (이전 날짜보다 크거나 같음)
-            log_date = MyDate.from_str(log_date)
             if last_log_date is not None and log_date < last_log_date:
-                add_error(line_num, "로그 날짜는 오름차순으로 정렬되어야 합니다.")
-                return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 로그 날짜는 오름차순으로 정렬되어야 합니다.")
+                return add_error(line_num, "로그 날짜는 오름차순으로 정렬되어야 합니다.")
             
             last_log_date = log_date
+        
+        return (True, "")
+    
+    # 오류 발생한 줄과 오류 메세지를 백업 파일의 마지막 줄에 추가
+    def add_error_backup(self, table_name: str, line_num: int, error_message: str) -> str:
+        file_name = DATA_FILE_NAMES[table_name]
+        backup_name = f"{file_name[:-len('.txt')]}-{datetime.now().strftime('%Y%m%d_%H%M%S')}.bak"
+        shutil.copy(opj(self.file_path, "data", file_name), opj(self.file_path, "data", backup_name))
+        with open(opj(self.file_path, "data", backup_name), "a", encoding='utf-8') as f:
+            f.write(f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}\n")
+            
+        return f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - {error_message}"
+    
+    # ========== 테이블 간 참조 무결성 검사 ========== #
+    # 모든 테이블을 읽은 뒤 한 번에 검사 (줄 번호는 각 데이터 파일 기준)
+    def check_data_references(self, skip_tables: set[str]=frozenset()) -> tuple[bool, str]:
+        publisher_ids = {publisher.publisher_id for publisher in self.publisher_table}
+        isbns = {isbn.isbn for isbn in self.isbn_table}
+        author_ids = {author.author_id for author in self.author_table}
+        user_ids = {user.user_id for user in self.user_table}
+        book_isbns = {book.book_id: book.isbn for book in self.book_table}
+        
+        # ISBN -> 출판사
+        if "isbn" not in skip_tables:
+            for line_num, isbn in enumerate(self.isbn_table, start=1):
+                if isbn.publisher_id not in publisher_ids:
+                    return (False, self.add_error_backup("isbn", line_num, "참조하는 출판사 고유번호가 출판사 데이터에 없습니다."))
+        
+        # 책 -> ISBN (첫 줄은 고유번호)
+        if "book" not in skip_tables:
+            for line_num, book in enumerate(self.book_table, start=2):
+                if book.isbn not in isbns:
+                    return (False, self.add_error_backup("book", line_num, "참조하는 ISBN이 ISBN 데이터에 없습니다."))
+        
+        # ISBN - 저자
+        if "isbn_author" not in skip_tables:
+            for line_num, isbn_author in enumerate(self.isbn_author_table, start=1):
+                if isbn_author.isbn not in isbns:
+                    return (False, self.add_error_backup("isbn_author", line_num, "참조하는 ISBN이 ISBN 데이터에 없습니다."))
+                if isbn_author.author_id not in author_ids:
+                    return (False, self.add_error_backup("isbn_author", line_num, "참조하는 저자 식별번호가 저자 데이터에 없습니다."))
+        
+        # 대출 -> 책, 사용자
+        if "borrow" not in skip_tables:
+            for line_num, borrow in enumerate(self.borrow_table, start=1):
+                if borrow.book_id not in book_isbns:
+                    return (False, self.add_error_backup("borrow", line_num, "참조하는 책 고유번호가 책 데이터에 없습니다."))
+                if borrow.user_id not in user_ids:
+                    return (False, self.add_error_backup("borrow", line_num, "참조하는 사용자 고유번호가 사용자 데이터에 없습니다."))
+        
+        # 연체 패널티 -> 사용자
+        if "overdue_penalty" not in skip_tables:
+            for line_num, penalty in enumerate(self.overdue_penalty_table, start=1):
+                if penalty.user_id not in user_ids:
+                    return (False, self.add_error_backup("overdue_penalty", line_num, "참조하는 사용자 고유번호가 사용자 데이터에 없습니다."))
+        
+        # 로그 -> ISBN, 책, 대출
+        if "log" not in skip_tables:
+            borrow_book_ids = {borrow.borrow_id: borrow.book_id for borrow in self.borrow_table}
+            for line_num, log in enumerate(self.log_table, start=1):
+                if log.isbn not in isbns:
+                    return (False, self.add_error_backup("log", line_num, "참조하는 ISBN이 ISBN 데이터에 없습니다."))
+                if log.book_id is not None and log.book_id not in book_isbns:
+                    return (False, self.add_error_backup("log", line_num, "참조하는 책 고유번호가 책 데이터에 없습니다."))
+                if log.borrow_id is not None and log.borrow_id not in borrow_book_ids:
+                    return (False, self.add_error_backup("log", line_num, "참조하는 대출 고유번호가 대출 데이터에 없습니다."))
+            
+                # book id와 ISBN 관계 검사
+                if log.book_id is not None and book_isbns[log.book_id] != log.isbn:
+                    return (False, self.add_error_backup("log", line_num, "책 고유번호에 대한 ISBN이 올바르지 않습니다."))
+            
+                # borrow id와 book id 관계 검사
+                if log.borrow_id is not None and borrow_book_ids[log.borrow_id] != log.book_id:
+                    return (False, self.add_error_backup("log", line_num, "대출 고유번호에 대한 책 고유번호가 올바르지 않습니다."))
+        
+        return (True, "")
+    
+    # ========== 이름, 전화번호 인덱스 (저자, 사용자, 출판사) ========== #
+    def index_author(self, author: AuthorRecord) -> None:
+        self.authors_by_name.setdefault(author.name, []).append(author)
+    
+    def index_user(self, user: UserRecord) -> None:
+        self.users_by_name.setdefault(user.name, []).append(user)
+        self.user_by_phone.setdefault(user.phone_number, user)
+    
+    def index_publisher(self, publisher: PublisherRecord) -> None:
+        self.publisher_by_name.setdefault(publisher.name, publisher)
+    
+    # 새 저자 추가 (저자 식별번호는 1부터 1씩 증가)
+    def add_author(self, name: str) -> AuthorRecord:
+        author = AuthorRecord(len(self.author_table) + 1, name, False)
+        self.author_table.append(author)
+        self.index_author(author)
+        if self.author_name_tree is not None:
+            self.author_name_tree.add(name)
+        if self.author_completions is not None:
+            self.author_completions.add(name)
+        return author
+    
+    def add_user(self, user: UserRecord) -> None:
+        self.user_table.append(user)
+        self.index_user(user)
+    
+    def add_publisher(self, publisher: PublisherRecord) -> None:
+        self.publisher_table.append(publisher)
+        self.index_publisher(publisher)
+    
+    # 이름이 같은 저자 수 (동명이인 구분용)
+    def count_homonyms(self, name: str) -> int:
+        return len(self.authors_by_name.get(name, ()))
+    
+    # ========== ISBN - 저자 관계 ========== #
+    def index_isbn_author(self, isbn: int, author_id: int) -> None:
+        self.authors_by_isbn.setdefault(isbn, []).append(author_id)
+        self.isbns_by_author.setdefault(author_id, []).append(isbn)
+    
+    # ISBN - 저자 관계 추가 (테이블과 인덱스 함께 갱신)
+    def add_isbn_author(self, isbn: int, author_id: int) -> None:
+        isbn_author = IsbnAuthorRecord(isbn, author_id)
+        self.isbn_author_table.append(isbn_author)
+        self.index_isbn_author(isbn, author_id)
+        self.mark_dirty("isbn_author", isbn_author)
+    
+    # ISBN의 저자를 모두 바꿈 (테이블과 인덱스 함께 갱신)
+    def replace_isbn_authors(self, isbn: int, author_ids: list[int]) -> None:
+        for author_id in self.authors_by_isbn.pop(isbn, []):
+            isbns = self.isbns_by_author[author_id]
+            isbns.remove(isbn)
+            if not isbns:
+                del self.isbns_by_author[author_id]
+        
+        # 리스트는 그대로 두고 해당 ISBN의 관계만 제거
+        isbn_author_table = self.isbn_author_table
+        for i in reversed(range(len(isbn_author_table))):
+            if isbn_author_table[i].isbn == isbn:
+                self.mark_dirty("isbn_author", isbn_author_table[i])
+                del isbn_author_table[i]
+        
+        for author_id in author_ids:
+            self.add_isbn_author(isbn, author_id)
+        
+        # 분류 값(저자)이 바뀌었으므로 다음 조회 때 다시 만듦
+        self.facets = None
+    
+    # ========== 책, ISBN 인덱스 (등록날짜, 출판년도, 출판사, 제목) ========== #
+    def index_book(self, book: BookRecord) -> None:
+        self.book_ids_by_isbn.setdefault(book.isbn, []).append(book.book_id)
+        bisect.insort(self.books_by_register_date, (book.register_date.ordinal, book.book_id, book))
+    
+    def index_isbn(self, isbn_data: ISBNRecord) -> None:
+        self.isbn_by_number[isbn_data.isbn] = isbn_data
+        bisect.insort(self.isbns_by_year, (isbn_data.published_year, isbn_data.isbn, isbn_data))
+        self.isbns_by_publisher.setdefault(isbn_data.publisher_id, []).append(isbn_data.isbn)
+        if self.title_ngrams is not None:
+            self.title_ngrams.add(isbn_data.isbn, isbn_data.title)
+        if self.title_completions is not None:
+            self.title_completions.add(isbn_data.title)
+    
+    # 수정된 ISBN(출판년도, 출판사, 제목)을 인덱스에서 옮김
+    def reindex_isbn(self, isbn_data: ISBNRecord, old_year: int, old_publisher_id: int, old_title: str) -> None:
+        i = bisect.bisect_left(self.isbns_by_year, (old_year, isbn_data.isbn))
+        del self.isbns_by_year[i]
+        
+        isbns = self.isbns_by_publisher[old_publisher_id]
+        isbns.remove(isbn_data.isbn)
+        if not isbns:
+            del self.isbns_by_publisher[old_publisher_id]
+        
+        if self.title_ngrams is not None:
+            self.title_ngrams.remove(isbn_data.isbn)
+        if self.title_completions is not None:
+            self.title_completions.remove(old_title)
+            
+        self.index_isbn(isbn_data)
+    
+    # ========== 출판사, 출판 연대, 저자별 분류 ========== #
+    def get_facet_values(self, isbn_data: ISBNRecord) -> tuple[int, int, tuple[int, ...]]:
+        return (isbn_data.publisher_id, isbn_data.published_year // 10 * 10, tuple(self.search_author_ids_by_isbn(isbn_data.isbn)))
+    
+    def get_facets(self) -> CatalogFacets:
+        """_summary_
+        분류별 권수 (처음 호출할 때 ISBN, 책 테이블을 한 번 훑어서 만듦)
+        """
+        if self.facets is None:
+            facets = CatalogFacets()
+            isbn_values = {isbn_data.isbn: self.get_facet_values(isbn_data) for isbn_data in self.isbn_table}
+            facets.build(isbn_values, ((book.book_id, book.isbn, book.book_id in self.live_books) for book in self.book_table))
+            self.facets = facets
+            
+        return self.facets
+    
+    def get_facet_counts(self, books: list[BookRecord]=None) -> dict[str, list[tuple[int, int]]]:
+        """_summary_
+        검색 결과(books, None이면 보이는 책 전체)의 출판사 ID, 출판 연대, 저자 ID별 권수 (권수가 많은 순서)
+        """
+        facets = self.get_facets()
+        return facets.count_all() if books is None else facets.count_results(books)
+    
+    def print_facets(self, books: list[BookRecord]=None) -> None:
+        for kind, ranked in self.get_facet_counts(books).items():
+            if not ranked:
+                continue
+            
+            names = []
+            for value, count in ranked[:FACET_TOP_K]:
+                if kind == "publisher":
+                    name = self.search_publisher_by_id(value).name
+                elif kind == "decade":
+                    name = f"{value}년대"
+                else:
+                    name = self.convert_author_ids_to_name_id([value])
+                names.append(f"{name} {count}권")
+                
+            more = f" 외 {len(ranked) - FACET_TOP_K}개" if len(ranked) > FACET_TOP_K else ""
+            print(f"<{FACET_LABELS[kind]}별> {' / '.join(names)}{more}")
+    
+    # ========== 조건 검색 (고유번호 비트셋) ========== #
+    def get_title_ngrams(self) -> TitleNgramIndex:
+        if self.title_ngrams is None:
+            title_ngrams = TitleNgramIndex()
+            for isbn_data in self.isbn_table:
+                title_ngrams.add(isbn_data.isbn, isbn_data.title)
+            self.title_ngrams = title_ngrams
+            
+        return self.title_ngrams
+    
+    # ISBN 목록 -> 그 ISBN을 가진 책의 비트셋
+    def get_isbn_bits(self, isbns) -> int:
+        return bits_from_ids(book_id for isbn in isbns for book_id in self.book_ids_by_isbn.get(isbn, []))
+    
+    # 제목에 text가 포함된 책
+    def get_title_bits(self, text: str) -> int:
+        return self.get_isbn_bits(self.get_title_ngrams().search(text))
+    
+    # 출판사 이름이 name인 책
+    def get_publisher_bits(self, name: str) -> int:
+        publisher = self.search_publisher_by_name(name)
+        if publisher is None:
+            return 0
+        return self.get_isbn_bits(self.isbns_by_publisher.get(publisher.publisher_id, []))
+    
+    # 대출 중인 책
+    def get_borrowed_bits(self) -> int:
+        return bits_from_ids(self.open_borrows)
+    
+    def query_books(self, title: str=None, publisher: str=None, available: bool=None, include_deleted: bool=False) -> list[BookRecord]:
+        """_summary_
+        조건을 모두 만족하는 책 (조건마다 고유번호 비트셋을 만들어 AND, 고유번호 순서)
+        title: 제목에 포함, publisher: 출판사 이름과 일치, available: True면 대출 가능, False면 대출 중
+        include_deleted: True면 삭제된 책 포함, False면 오늘 기준으로 보이는 책만
+        """
+        bits = (1 << len(self.book_table)) - 1 if include_deleted else self.live_bits
+        
+        if title is not None and bits:
+            bits &= self.get_title_bits(title)
+        if publisher is not None and bits:
+            bits &= self.get_publisher_bits(publisher)
+        if available is not None and bits:
+            bits = bits & ~self.get_borrowed_bits() if available else bits & self.get_borrowed_bits()
             
-            # book id와 ISBN 관계 검사
-            if book_id != "":
-                book_record = None
-                for book in self.book_table:
-                    if book.book_id == int(book_id):
-                        book_record = book
-                        break
-                
-                if book_record is None or book_record.isbn != int(isbn):
-                    add_error(line_num, "책 고유번호에 대한 ISBN이 올바르지 않습니다.")
-                    return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 책 고유번호에 대한 ISBN이 올바르지 않습니다.")
-                
-            # borrow id와 book id 관계 검사
-            if borrow_id != "":
-                borrow_record = None
-                for borrow in self.borrow_table:
-                    if borrow.borrow_id == int(borrow_id):
-                        borrow_record = borrow
-                        break
-                
-                if borrow_record is None or borrow_record.book_id != int(book_id):
-                    add_error(line_num, "대출 고유번호에 대한 책 고유번호가 올바르지 않습니다.")
-                    return (False, f"데이터 파일 무결성 검사에 실패했습니다. 오류 발생 위치 : {line_num}번째 줄 - 대출 고유번호에 대한 책 고유번호가 올바르지 않습니다.")
-                
-        return (True, "")
+        return [self.book_table[book_id] for book_id in ids_from_bits(bits)]
+    
+    # ========== 제목, 저자 이름 자동 완성 ========== #
+    def complete_titles(self, prefix: str, n: int=AUTOCOMPLETE_TOP_N) -> list[str]:
+        """_summary_
+        prefix로 시작하는 제목 n개 (가나다순, 같은 제목은 하나만)
+        """
+        if self.title_completions is None:
+            self.title_completions = PrefixIndex(isbn_data.title for isbn_data in self.isbn_table)
+        return self.title_completions.complete(prefix, n)
+    
+    def complete_author_names(self, prefix: str, n: int=AUTOCOMPLETE_TOP_N) -> list[str]:
+        """_summary_
+        prefix로 시작하는 저자 이름 n개 (가나다순, 동명이인은 하나만)
+        """
+        if self.author_completions is None:
+            self.author_completions = PrefixIndex(author.name for author in self.author_table)
+        return self.author_completions.complete(prefix, n)
+    
+    # ========== 비슷한 저자, 제목 검색 ========== #
+    def get_author_name_tree(self) -> BKTree:
+        if self.author_name_tree is None:
+            author_name_tree = BKTree()
+            for name in self.authors_by_name:
+                author_name_tree.add(name)
+            self.author_name_tree = author_name_tree
+            
+        return self.author_name_tree
+    
+    def search_similar_authors(self, name: str, max_distance: int=None) -> list[tuple[AuthorRecord, int]]:
+        """_summary_
+        이름의 편집 거리가 max_distance 이하인 저자와 거리 (거리, 식별번호 순서)
+        max_distance가 None이면 이름 길이에 따라 1 ~ FUZZY_MAX_DISTANCE (3글자마다 1)
+        """
+        if max_distance is None:
+            max_distance = max(1, min(FUZZY_MAX_DISTANCE, len(name) // 3))
+        
+        authors = []
+        for distance, similar_name in self.get_author_name_tree().search(name, max_distance):
+            for author in self.search_author_by_name(similar_name):
+                authors.append((author, distance))
+        return authors
+    
+    def search_similar_titles(self, text: str, min_similarity: float=FUZZY_MIN_SIMILARITY, limit: int=FUZZY_TOP_K) -> list[tuple[ISBNRecord, float]]:
+        """_summary_
+        검색어의 n-gram 중 min_similarity 비율 이상이 제목에 있는 ISBN과 그 비율 (비율이 높은 순서로 limit개)
+        """
+        return [(self.search_isbn_data(isbn), similarity) for similarity, isbn in self.get_title_ngrams().similar(text, min_similarity)[:limit]]
+    
+    def suggest_books(self, text: str) -> list[BookRecord]:
+        """_summary_
+        제목이 비슷한 ISBN(상위 FUZZY_TOP_K개)과 이름이 비슷한 저자(상위 FUZZY_TOP_K명)의 ISBN을 가진, 오늘 기준으로 보이는 책
+        """
+        isbns = [isbn_data.isbn for isbn_data, _ in self.search_similar_titles(text)]
+        for author, _ in self.search_similar_authors(text)[:FUZZY_TOP_K]:
+            isbns.extend(self.search_isbns_by_author_id(author.author_id))
+        
+        books = []
+        for isbn in dict.fromkeys(isbns):
+            for book_id in self.book_ids_by_isbn.get(isbn, []):
+                book = self.live_books.get(book_id)
+                if book is not None:
+                    books.append(book)
+        return books
     
     # =========== 책 레코드를 문자열로 반환 ========== #
     def print_book(self, book_id: int, include_borrow: bool=False):        
         # find book
-        book_data = None
-        for book in self.book_table:
-            if book.book_id == book_id:
-                book_data = book
-                break
+        book_data = self.search_book_by_id(book_id, include_deleted=True)
             
         if book_data is None:
             raise NotImplementedError("해당 고유번호를 가진 책이 존재하지 않습니다.")
         
         # find isbn
-        isbn_data = None
-        for isbn in self.isbn_table:
-            if isbn.isbn == book.isbn:
-                isbn_data = isbn
-                break
+        isbn_data = self.search_isbn_data(book_data.isbn)
             
-        # find author isbn relationship
-        author_isbn_data = []
-        for isbn_author in self.isbn_author_table:
-            if isbn_author.isbn == isbn_data.isbn:
-                author_isbn_data.append(isbn_author)
-        
-        author_data = []
-        for author in self.author_table:
-            for author_isbn in author_isbn_data:
-                if author.author_id == author_isbn.author_id:
-                    author_data.append(author)
+        # find authors (저자 식별번호 순)
+        author_data = [self.search_author_by_id(author_id) for author_id in sorted(self.search_author_ids_by_isbn(isbn_data.isbn))]
             
         # find publisher
-        publisher_data = None
-        for publisher in self.publisher_table:
-            if publisher.publisher_id == isbn_data.publisher_id:
-                publisher_data = publisher
-                break
+        publisher_data = self.search_publisher_by_id(isbn_data.publisher_id)
             
         # find borrow info
         borrow_data = None
         if include_borrow:
-            for borrow in self.borrow_table:
-                if borrow.book_id == book_id and borrow.actual_return_date is None: # 반납이 완료된 대출 정보는 제외:
-                    borrow_data = borrow
-                    break
+            borrow_data = self.open_borrows.get(book_id) # 반납이 완료된 대출 정보는 제외
         
         # find borrow user info
         user_data = None
         if include_borrow and borrow_data is not None:
-            for user in self.user_table:
-                if user.user_id == borrow_data.user_id:
-                    user_data = user
-                    break
+            user_data = self.search_user_by_id(borrow_data.user_id)
                 
         return_str = f"{book_id}/"
-        return_str += str(isbn_data.isbn).zfill(2) + "/"
+        return_str += format_isbn(isbn_data.isbn) + "/"
         return_str += f"{isbn_data.title}/"
         
         # 저자 없는 경우 
@@ -1490,9 +2819,10 @@ class DataManager(object):
     # =========== 전체 책 출력 ========== #
     def print_book_all(self):
         print(DataManager.get_header())
-        for book in self.book_table: # 삭제가 안되었거나 삭제되었지만 삭제 날짜가 오늘 이후인 경우 출력
-            if not book.deleted or (book.deleted and book.delete_date > self.today):
-                print(self.print_book(book.book_id, include_borrow=True))
+        for book in self.live_books.values(): # 삭제가 안되었거나 삭제되었지만 삭제 날짜가 오늘 이후인 책만 있음
+            print(self.print_book(book.book_id, include_borrow=True))
+        print()
+        self.print_facets()
 
     def load_configuration(self) -> None:
         config_dict = dict()
@@ -1549,12 +2879,12 @@ class DataManager(object):
                 {
                     "constant_name": "max_static_id",
                     "value_type": "int",
-                    "value": 99
+                    "value": MAX_RECORD_ID
                 },
                 {
                     "constant_name": "max_isbn",
                     "value_type": "int",
-                    "value": 99
+                    "value": 9799999999999
                 },
                 {
                     "constant_name": "max_borrow_count",
@@ -1565,6 +2895,31 @@ class DataManager(object):
                     "constant_name": "overdue_penalty_scale",
                     "value_type": "float",
                     "value": 1.0
+                },
+                {
+                    "constant_name": "parallel_load",
+                    "value_type": "int",
+                    "value": 0
+                },
+                {
+                    "constant_name": "mmap_load",
+                    "value_type": "int",
+                    "value": 0
+                },
+                {
+                    "constant_name": "lazy_load",
+                    "value_type": "int",
+                    "value": 0
+                },
+                {
+                    "constant_name": "storage",
+                    "value_type": "str",
+                    "value": "file"
+                },
+                {
+                    "constant_name": "metrics",
+                    "value_type": "int",
+                    "value": 0
                 }
             ]
         }
@@ -1573,10 +2928,15 @@ class DataManager(object):
         config_dict = {
             "borrow_date": 7,
             "cancel": "X",
-            "max_static_id": 99,
-            "max_isbn": 99,
+            "max_static_id": MAX_RECORD_ID,
+            "max_isbn": 9799999999999,
             "max_borrow_count": 3,
-            "overdue_penalty_scale": 1.0
+            "overdue_penalty_scale": 1.0,
+            "parallel_load": 0,
+            "mmap_load": 0,
+            "lazy_load": 0,
+            "storage": "file",
+            "metrics": 0
         }
         
         self.config = config_dict
@@ -1608,7 +2968,7 @@ class DataManager(object):
         if not book_id.isdigit():
             return False, "고유번호는 숫자여야 합니다."
         
-        # 5. 고유번호가 0에서 99 사이인지 확인
+        # 5. 고유번호가 0에서 max_static_id 사이인지 확인
         book_id_int = int(book_id)
         if book_id_int < 0 or book_id_int > self.config['max_static_id']:
             return False, f"고유번호는 0에서 {self.config['max_static_id']} 사이여야 합니다."
@@ -1667,9 +3027,9 @@ class DataManager(object):
         # ISBN이 공백인지 확인
         if not isbn.strip():  # 공백을 제거한 후 빈 문자열인지 확인
             return False, "책의 ISBN은 공백일 수 없습니다."
-        # ISBN이 두 자리 숫자(00~99)로 구성되어 있는지 확인
-        if len(isbn) != 2 or not isbn.isdigit():
-            return False, "ISBN은 두 자리 숫자여야 합니다."
+        # ISBN이 두 자리 숫자(00~99) 또는 ISBN-13(978, 979로 시작하는 13자리)인지 확인
+        if not is_valid_isbn(isbn):
+            return False, "ISBN은 두 자리 숫자 또는 체크 숫자가 올바른 13자리 ISBN-13이어야 합니다."
         return True, ""
 
     def check_phone_number_validate(self, phone_number):
@@ -1704,11 +3064,7 @@ class DataManager(object):
         return True, ""
 
     def check_borrow_delete(self, book_id):
-        for book in self.book_table:
-            for borrow in self.borrow_table:
-                if borrow.book_id == book_id and borrow.actual_return_date is None:
-                    return True
-        return False    
+        return book_id in self.open_borrows
     
     # 저자 식별번호로 이름 #식별번호 형태로 반환
     def convert_author_ids_to_name_id(self, author_ids: list[int]) -> str:
@@ -1722,7 +3078,7 @@ class DataManager(object):
             author = self.search_author_by_id(author_id)
             if author:
                 # 동명 이인 있는 경우 식별번호를 붙여줌
-                if len(self.search_author_by_name(author.name)) > 1:
+                if self.count_homonyms(author.name) > 1:
                     names.append(f"{author.name} #{author.author_id}")
                 else:
                     names.append(author.name)
@@ -1733,134 +3089,122 @@ class DataManager(object):
     # 고유번호로 검색
     def search_book_by_id(self, book_id, include_deleted: bool=False) -> BookRecord:
         """_summary_ 
-        책 고유번호로 책 인스턴스 반환
+        책 고유번호로 책 인스턴스 반환 (고유번호는 0부터 1씩 증가하므로 리스트 위치와 같음)
         """
-        if include_deleted:
-            for book in self.book_table:
-                if book.book_id == book_id:
-                    return book
-                
-        else:
-            for book in self.book_table:
-                if book.book_id == book_id and (not book.deleted or (book.deleted and book.delete_date > self.today)):
-                    return book
+        if not include_deleted:
+            return self.live_books.get(book_id)
+        
+        if not 0 <= book_id < len(self.book_table):
+            return None
 
-        return None
+        return self.book_table[book_id]
     
     # isbn 정보 검색 (제목, 저자, 출판사 등)
     def search_isbn_data(self, isbn) -> ISBNRecord:
         """_summary_
         ISBN으로 ISBN 인스턴스 반환
         """
-        for i in self.isbn_table:
-            if i.isbn == isbn:
-                return i
-            
-        return None
+        return self.isbn_by_number.get(isbn)
     
     # Book 테이블 내 isbn을 갖는 모든 책 검색
     def search_books_by_isbn(self, isbn) -> list[int]:
         """_summary_
         ISBN을 가지는 모든 책 인스턴스 반환
         """
+        return [self.book_table[book_id] for book_id in self.book_ids_by_isbn.get(isbn, [])]
+    
+    # 출판년도 범위로 ISBN 검색 (출판년도, ISBN 순서)
+    def search_isbns_by_published_year(self, start_year: int=None, end_year: int=None) -> list[ISBNRecord]:
+        """_summary_
+        start_year ~ end_year(양 끝 포함)에 출판된 ISBN 인스턴스 반환 (None이면 끝까지)
+        """
+        lo = 0 if start_year is None else bisect.bisect_left(self.isbns_by_year, (start_year,))
+        hi = len(self.isbns_by_year) if end_year is None else bisect.bisect_left(self.isbns_by_year, (end_year + 1,))
+        return [isbn_data for _, _, isbn_data in self.isbns_by_year[lo:hi]]
+    
+    # 출판년도 범위로 책 검색 (출판년도, ISBN, 고유번호 순서)
+    def search_books_by_published_year(self, start_year: int=None, end_year: int=None) -> list[BookRecord]:
+        """_summary_
+        start_year ~ end_year(양 끝 포함)에 출판된 책 중 오늘 기준으로 보이는 책 인스턴스 반환 (None이면 끝까지)
+        """
         books = []
-        for book in self.book_table:
-            if book.isbn == isbn:
-                books.append(book)
-                
+        for isbn_data in self.search_isbns_by_published_year(start_year, end_year):
+            for book_id in self.book_ids_by_isbn.get(isbn_data.isbn, []):
+                book = self.live_books.get(book_id)
+                if book is not None:
+                    books.append(book)
+                    
         return books
     
+    # 등록날짜 범위로 책 검색 (등록날짜, 고유번호 순서)
+    def search_books_by_register_date(self, start_date: MyDate=None, end_date: MyDate=None) -> list[BookRecord]:
+        """_summary_
+        start_date ~ end_date(양 끝 포함)에 등록된 책 중 오늘 기준으로 보이는 책 인스턴스 반환 (None이면 끝까지)
+        """
+        lo = 0 if start_date is None else bisect.bisect_left(self.books_by_register_date, (start_date.ordinal,))
+        hi = len(self.books_by_register_date) if end_date is None else bisect.bisect_left(self.books_by_register_date, (end_date.ordinal + 1,))
+        return [book for _, book_id, book in self.books_by_register_date[lo:hi] if book_id in self.live_books]
+    
     # Author ID로 검색
     def search_author_by_id(self, author_id) -> AuthorRecord:
         """_summary_
-        Author ID로 Author 인스턴스 반환
+        Author ID로 Author 인스턴스 반환 (식별번호는 1부터 1씩 증가)
         """
-        if author_id < 1:
+        if not 1 <= author_id <= len(self.author_table):
             return None
         
-        for author in self.author_table:
-            if author.author_id == author_id:
-                return author
-            
-        return None
+        return self.author_table[author_id - 1]
     
     def search_author_by_name(self, name) -> list[AuthorRecord]:
-        authors = []
-        for author in self.author_table:
-            if author.name == name:
-                authors.append(author)
-                
-        return authors
+        return list(self.authors_by_name.get(name, []))
     
     # Publisher ID로 검색
     def search_publisher_by_id(self, publisher_id) -> PublisherRecord:
         """_summary_
-        Publisher ID로 Publisher 인스턴스 반환
+        Publisher ID로 Publisher 인스턴스 반환 (고유번호는 0부터 1씩 증가)
         """
-        if publisher_id < 0:
+        if not 0 <= publisher_id < len(self.publisher_table):
             return None
         
-        for publisher in self.publisher_table:
-            if publisher.publisher_id == publisher_id:
-                return publisher
-            
-        return None
+        return self.publisher_table[publisher_id]
     
     # 저자가 작성한 책 ISBN 검색
     def search_isbns_by_author_id(self, author_id) -> list[int]:
         """_summary_
         저자 ID를 가지는 저자가 작성한 모든 책의 ISBN 반환
         """
-        isbns = []
-        for isbn_author in self.isbn_author_table:
-            if isbn_author.author_id == author_id:
-                isbns.append(isbn_author.isbn)
-                
-        return isbns
+        return list(self.isbns_by_author.get(author_id, []))
     
     # ISBN의 저자 모두 검색
     def search_author_ids_by_isbn(self, isbn) -> list[int]:
         """_summary_
         ISBN 책을 작성한 모든 저자 ID 반환
         """
-        author_ids = []
-        for isbn_author in self.isbn_author_table:
-            if isbn_author.isbn == isbn:
-                author_ids.append(isbn_author.author_id)
-                
-        return author_ids
+        return list(self.authors_by_isbn.get(isbn, []))
 
     # 전화번호로 유저 검색 (전화번호는 unique)
     def search_user_by_phone_number(self, phone_number) -> UserRecord:
         """_summary_
         전화번호로 유저 인스턴스 반환
         """
-        for user in self.user_table:
-            if user.phone_number == phone_number:
-                return user
+        return self.user_by_phone.get(phone_number)
             
     # 이름으로 유저 검색
     def search_users_by_name(self, name) -> list[UserRecord]:
         """_summary_
         이름으로 일치하는 모든 유저 인스턴스 반환
         """
-        users = []
-        for user in self.user_table:
-            if user.name == name:
-                users.append(user)
-                
-        return users
+        return list(self.users_by_name.get(name, []))
     
     # 유저 ID로 검색
     def search_user_by_id(self, user_id) -> UserRecord:
         """_summary_
-        User ID로 일치하는 유저 인스턴스 반환
+        User ID로 일치하는 유저 인스턴스 반환 (고유번호는 0부터 1씩 증가)
         """
-        for user in self.user_table:
-            if user.user_id == user_id:
-                return user
-            
-        return None
+        if user_id is None or not 0 <= user_id < len(self.user_table):
+            return None
+        
+        return self.user_table[user_id]
     
     # 대출중인 책 검색
     def search_borrowing_book_ids_by_user_id(self, user_id, overdue_only:bool=False) -> list[int]:
@@ -1871,8 +3215,8 @@ class DataManager(object):
         """
         book_ids = []
         
-        for borrow in self.borrow_table:
-            if borrow.user_id == user_id and borrow.actual_return_date is None:
+        for borrow in self.open_borrows.values():
+            if borrow.user_id == user_id:
                 # 대출중인 책 모두 검색 (연체중 포함)
                 if not overdue_only:
                     book_ids.append(borrow.book_id)
@@ -1890,11 +3234,8 @@ class DataManager(object):
         """_summary_
         해당 book id 책을 대출한 유저 ID 반환
         """
-        for borrow in self.borrow_table:
-            if borrow.book_id == book_id and borrow.actual_return_date is None:
-                return borrow.user_id
-            
-        return None
+        borrow = self.open_borrows.get(book_id)
+        return None if borrow is None else borrow.user_id
         
     # 연체 패널티 user id로 검색
     def search_overdue_penalty_by_user_id(self, user_id) -> bool:
@@ -1909,34 +3250,29 @@ class DataManager(object):
             
     def search_borrow_by_user_id(self, book_id, user_id) -> BorrowRecord:
         """_summary_
-        해당 유저가 해당 책을 대출한 대출 Borrow 인스턴스 반환
+        해당 유저가 해당 책을 대출중인 대출 Borrow 인스턴스 반환
         """
-        for borrow in self.borrow_table:
-            if borrow.book_id == book_id and borrow.user_id == user_id:
-                return borrow
+        borrow = self.open_borrows.get(book_id)
+        if borrow is not None and borrow.user_id == user_id:
+            return borrow
             
         return None
     
     def search_borrow_by_id(self, borrow_id) -> BorrowRecord:
         """_summary_
-        대출 ID로 대출 인스턴스 반환
+        대출 ID로 대출 인스턴스 반환 (고유번호는 0부터 1씩 증가)
         """
-        for borrow in self.borrow_table:
-            if borrow.borrow_id == borrow_id:
-                return borrow
-            
-        return None
+        if not 0 <= borrow_id < self.get_table_size("borrow"):
+            return None
+        
+        return self.borrow_table[borrow_id]
     
     # 출판사 이름으로 검색
     def search_publisher_by_name(self, name) -> PublisherRecord:
         """_summary_
         출판사 이름으로 출판사 인스턴스 반환 (출판사 이름은 unique함)
         """
-        for publisher in self.publisher_table:
-            if publisher.name == name:
-                return publisher
-            
-        return None
+        return self.publisher_by_name.get(name)
     
     # ========== 1. 추가 ========== #
     def add_book(self):
@@ -1989,7 +3325,7 @@ class DataManager(object):
                 publisher_id = publisher.publisher_id
                 
             # isbn 데이터
-            new_isbn = ISBNRecord(isbn, book_info[0], publisher_id, book_info[3], self.today)
+            new_isbn = ISBNRecord(isbn, book_info[0], publisher_id, int(book_info[3]), self.today)
 
             # book 데이터
             book_id = len(self.book_table)
@@ -2018,17 +3354,20 @@ class DataManager(object):
             
             if self.input_response("해당 책을 추가하시겠습니까?(Y/N): "):
                 if not publisher_flag:
-                    self.publisher_table.append(publisher)
+                    self.add_publisher(publisher)
                 
                 for author in book_info[1]:
                     if not isinstance(author, AuthorRecord):
-                        self.author_table.append(AuthorRecord(len(self.author_table) + 1, author, False))
-                        self.isbn_author_table.append(IsbnAuthorRecord(isbn, self.author_table[-1].author_id))
+                        self.add_isbn_author(isbn, self.add_author(author).author_id)
                     else:
-                        self.isbn_author_table.append(IsbnAuthorRecord(isbn, author.author_id))
+                        self.add_isbn_author(isbn, author.author_id)
 
                 self.isbn_table.append(new_isbn)
+                self.index_isbn(new_isbn)
                 self.book_table.append(new_book)    
+                self.add_live_book(new_book)
+                self.index_book(new_book)
+                self.update_latest_dates(register_date=new_book.register_date, published_year=new_isbn.published_year)
                 
                 # 책 등록 로그 추가
                 self.add_to_log(log_type="BOOK_REGISTER", isbn=new_isbn.isbn, book_id=new_book.book_id, borrow_id=None, log_date=self.today)
@@ -2072,6 +3411,9 @@ class DataManager(object):
             if self.input_response("해당 책을 추가하시겠습니까?(Y/N): "):
                 new_book = BookRecord(len(self.book_table), isbn, self.today, None, False)
                 self.book_table.append(new_book)
+                self.add_live_book(new_book)
+                self.index_book(new_book)
+                self.update_latest_dates(register_date=new_book.register_date)
                 
                 # 책 등록 로그 추가
                 self.add_to_log(log_type="BOOK_REGISTER", isbn=isbn, book_id=new_book.book_id, borrow_id=None, log_date=self.today)
@@ -2114,6 +3456,8 @@ class DataManager(object):
                 if self.book_table[i].book_id == del_book_id:
                     self.book_table[i].deleted = True
                     self.book_table[i].delete_date = self.today
+                    self.mark_dirty("book", self.book_table[i])
+                    self.remove_live_book(del_book_id)
                     
                     # 책 삭제 로그 추가
                     self.add_to_log(log_type="BOOK_DELETE", isbn=self.book_table[i].isbn, book_id=self.book_table[i].book_id, borrow_id=None, log_date=self.today)
@@ -2232,14 +3576,11 @@ class DataManager(object):
                 break
             
         # 출판사 수정
-        new_publisher_id = None
-        for publisher in self.publisher_table:
-            if publisher.name == new_publisher:  # 입력된 출판사가 이미 존재하면
-                new_publisher_id = publisher.publisher_id  # 해당 출판사의 ID 반영
-                new_publisher_data = None
-                break
-
-        if new_publisher_id is None:  # 입력된 출판사가 존재하지 않으면
+        new_publisher_data = None
+        publisher = self.search_publisher_by_name(new_publisher)
+        if publisher is not None:  # 입력된 출판사가 이미 존재하면
+            new_publisher_id = publisher.publisher_id  # 해당 출판사의 ID 반영
+        else:  # 입력된 출판사가 존재하지 않으면
             new_publisher_id = len(self.publisher_table)
             new_publisher_data = PublisherRecord(new_publisher_id, new_publisher, False)  # 새 출판사 데이터 추가
         
@@ -2255,26 +3596,35 @@ class DataManager(object):
             return False
 
         # 수정 반영
-        for isbn_data in self.isbn_table:
-            if isbn_data.isbn == isbn:
-                isbn_data.title = new_title
-                isbn_data.published_year = new_year
-                isbn_data.publisher_id = new_publisher_id
-                break
+        isbn_data = self.search_isbn_data(isbn)
+        old_year = isbn_data.published_year
+        old_publisher_id = isbn_data.publisher_id
+        old_title = isbn_data.title
+        isbn_data.title = new_title
+        isbn_data.published_year = int(new_year)
+        isbn_data.publisher_id = new_publisher_id
+        self.mark_dirty("isbn", isbn_data)
+        
+        self.reindex_isbn(isbn_data, old_year, old_publisher_id, old_title)
+        
+        # 분류 값(출판사, 출판 연대)이 바뀌었을 수 있으므로 다음 조회 때 다시 만듦
+        self.facets = None
+        
+        # 최신 출판년도였던 ISBN의 출판년도가 줄어든 경우에만 다시 계산
+        if old_year == self.latest_published_year and isbn_data.published_year < old_year:
+            self.latest_published_year = self.isbns_by_year[-1][0]
+        else:
+            self.update_latest_dates(published_year=isbn_data.published_year)
             
         # 출판사가 새로 추가된 경우에 테이블에 추가
         if new_publisher_data is not None:
-            self.publisher_table.append(new_publisher_data)
+            self.add_publisher(new_publisher_data)
             
         # 책 수정 로그 추가
         self.add_to_log(log_type="ISBN_EDIT", isbn=isbn, book_id=None, borrow_id=None, log_date=self.today)
 
-        # 저자 수정
-        # 기존 저자-ISBN 관계 삭제
-        self.isbn_author_table = [ia for ia in self.isbn_author_table if ia.isbn != isbn]
-        # 새 저자-ISBN 관계 추가
-        for name, number in valid_authors:
-            self.isbn_author_table.append(IsbnAuthorRecord(isbn, number))
+        # 저자 수정 (기존 저자-ISBN 관계를 새 관계로 교체)
+        self.replace_isbn_authors(isbn, [number for name, number in valid_authors])
 
         print("수정이 완료되었습니다.")
         self.fetch_data_file()
@@ -2318,8 +3668,7 @@ class DataManager(object):
                     matching_authors = self.search_author_by_name(author_entry)
                     if not matching_authors:  # 동일 이름의 저자가 없으면 새로 추가
                         print(f"[{author_entry}] 해당 이름의 저자가 없습니다. 새로 추가합니다.")
-                        new_author_id = len(self.author_table) + 1
-                        self.author_table.append(AuthorRecord(new_author_id, author_entry, False))
+                        new_author_id = self.add_author(author_entry).author_id
                         valid_authors.add((author_entry, new_author_id))
                         break
                     else:
@@ -2334,8 +3683,7 @@ class DataManager(object):
                         try:
                             choice = int(input("해당 저자의 번호를 입력해주세요: "))
                             if choice == 0:  # 새 동명이인 추가
-                                new_author_id = len(self.author_table) + 1
-                                self.author_table.append(AuthorRecord(new_author_id, author_entry, False))
+                                new_author_id = self.add_author(author_entry).author_id
                                 valid_authors.add((author_entry, new_author_id))
                                 break
                             elif 1 <= choice <= len(matching_authors):  # 선택된 저자를 추가
@@ -2362,12 +3710,22 @@ class DataManager(object):
             print("등록된 책이 존재하지 않습니다.")
             return False
         
+        print("@1950~1970: 출판년도 범위, @2024-11-01~2024-11-07: 등록날짜 범위")
+        print("?제목=반지;출판사=Collins Crime Club;대출가능(또는 대출중);삭제포함: 조건 검색")
+        print("반지*: 반지로 시작하는 제목, 저자 이름 자동 완성")
         search_book = input("검색할 책의 제목 또는 저자를 입력하세요: ").strip()
         
         if search_book == self.config["cancel"]:
             print("검색을 중단하며 메인 프롬프트로 돌아갑니다.")
             return False
         
+        # *로 끝나면 앞부분으로 시작하는 제목과 저자 이름을 보여주고 다시 입력받음
+        if len(search_book) > 1 and search_book.endswith("*"):
+            prefix = search_book[:-1]
+            print(f"<제목> {' / '.join(self.complete_titles(prefix)) or '-'}")
+            print(f"<저자> {' / '.join(self.complete_author_names(prefix)) or '-'}")
+            return self.search_book()
+        
         if len(search_book) == 0:
             self.print_book_all()
             return True
@@ -2380,49 +3738,29 @@ class DataManager(object):
         self.search_content_book(search_book)
     
     def search_content_book(self, search_book):
-        search_results = []
-        
-        for book in self.book_table:
-            # find isbn
-            isbn_data = None
-            for isbn in self.isbn_table:
-                if isbn.isbn == book.isbn:
-                    isbn_data = isbn
-                    
-                
-            # find author isbn relationship
-            author_isbn_data = None
-            for isbn_author in self.isbn_author_table:
-                if isbn_author.isbn == isbn_data.isbn:
-                    author_isbn_data = isbn_author
-                    
-                
-            author_data = None
-            for author in self.author_table:
-                if author.author_id == author_isbn_data.author_id:
-                    author_data = author
-                    
-
-            # 만약 #로 search_book이 시작하면 해당 작가 식별 번호 가진 책 검색
-            if search_book.startswith("#"):
-                # 제목에 포함되는지 확인 (첫 글자 # 포함)
-                if search_book in isbn_data.title and (not book.deleted or (book.deleted and book.delete_date > self.today)):
-                    search_results.append(book)
-                else:
-                    # # 문자 제외한 나머지 부분을 저자 식별번호와 완전 일치 비교
-                    author_id_str = search_book[1:].strip()
-                    if author_id_str == str(author_data.author_id) and (not book.deleted or (book.deleted and book.delete_date > self.today)):
-                        search_results.append(book)
-
-            else:
-                # 제목에 포함되는지 확인
-                if search_book in isbn_data.title and (not book.deleted or (book.deleted and book.delete_date > self.today)):
-                    search_results.append(book)
-                # 저자 이름에 포함되는지 확인 (중간에 #이 있어도 이름으로 비교)
-                elif search_book in author_data.name and (not book.deleted or (book.deleted and book.delete_date > self.today)):
-                    search_results.append(book)
+        # @로 시작하면 출판년도 또는 등록날짜 범위 검색, ?로 시작하면 조건 검색 (형식이 맞지 않으면 제목/저자 검색)
+        search_results = None
+        if search_book.startswith("@"):
+            search_results = self.search_range_book(search_book[1:])
+        elif search_book.startswith("?"):
+            search_results = self.search_query_book(search_book[1:])
+        if search_results is None:
+            search_results = self.search_title_author_book(search_book)
             
         if not search_results:
+            # 오타일 수 있으므로 이름이 비슷한 저자와 제목이나 저자 이름이 비슷한 책을 보여줌
+            similar_authors = self.search_similar_authors(search_book)[:FUZZY_TOP_K]
+            if similar_authors:
+                print(f"검색어와 비슷한 이름의 저자: {', '.join(self.convert_author_ids_to_name_id([author.author_id]) for author, _ in similar_authors)}")
+            
+            suggestions = self.suggest_books(search_book)
+            if suggestions:
+                print("검색어와 비슷한 제목 또는 저자의 책입니다.")
+                print(DataManager.get_header())
+                print()
+                for book in suggestions:
+                    print(self.print_book(book.book_id, include_borrow=True))
+                print()
         
             if self.input_response("해당 책이 존재하지 않습니다. 다시 검색하시겠습니까?(Y/N): "):
                 self.search_book()
@@ -2435,8 +3773,97 @@ class DataManager(object):
         for book in search_results:
             print(self.print_book(book.book_id, include_borrow=True))
         print()
+        self.print_facets(search_results)
+        print()
         return True
     
+    def search_range_book(self, search_range: str) -> list[BookRecord]:
+        """_summary_
+        출판년도(1950~1970) 또는 등록날짜(2024-11-01~2024-11-07) 범위의 책 반환
+        ~가 없으면 한 해(한 날짜), ~ 한쪽을 비우면 끝까지, 형식이 맞지 않으면 None
+        """
+        start, sep, end = search_range.partition("~")
+        bounds = [start.strip(), (end if sep else start).strip()]
+        if bounds == ["", ""]:
+            return None
+        
+        # 출판년도 (네 자리 숫자)
+        if all(bound == "" or (len(bound) == 4 and bound.isdigit()) for bound in bounds):
+            start_year, end_year = [int(bound) if bound else None for bound in bounds]
+            return self.search_books_by_published_year(start_year, end_year)
+        
+        # 등록날짜 (YYYY-MM-DD)
+        dates = [MyDate.from_str(bound) if bound else None for bound in bounds]
+        if all(date is not None or bound == "" for date, bound in zip(dates, bounds)):
+            return self.search_books_by_register_date(*dates)
+        
+        return None
+    
+    def search_query_book(self, query: str) -> list[BookRecord]:
+        """_summary_
+        ;로 구분한 조건(제목=..., 출판사=..., 대출가능, 대출중, 삭제포함)을 모두 만족하는 책 반환
+        형식이 맞지 않으면 None
+        """
+        conditions = dict()
+        for condition in query.split(";"):
+            key, sep, value = condition.partition("=")
+            key, value = key.strip(), value.strip()
+            
+            if not key and not sep:
+                continue
+            if sep and key in ("제목", "출판사") and value:
+                conditions["title" if key == "제목" else "publisher"] = value
+            elif not sep and key in ("대출가능", "대출중"):
+                conditions["available"] = key == "대출가능"
+            elif not sep and key == "삭제포함":
+                conditions["include_deleted"] = True
+            else:
+                return None
+        
+        if not conditions:
+            return None
+        return self.query_books(**conditions)
+    
+    def search_title_author_book(self, search_book: str) -> list[BookRecord]:
+        search_results = []
+        
+        # 같은 ISBN의 책은 결과가 같으므로 ISBN마다 한 번만 비교
+        matched_isbns = dict()
+        
+        for book in self.live_books.values(): # 삭제된 책은 이미 빠져 있음
+            matched = matched_isbns.get(book.isbn)
+            if matched is None:
+                matched = matched_isbns[book.isbn] = self.match_title_author(book.isbn, search_book)
+            
+            if matched:
+                search_results.append(book)
+                    
+        return search_results
+    
+    def match_title_author(self, isbn: int, search_book: str) -> bool:
+        # find isbn
+        isbn_data = self.search_isbn_data(isbn)
+            
+        # find authors
+        author_ids = self.search_author_ids_by_isbn(isbn_data.isbn)
+        
+        # 만약 #로 search_book이 시작하면 해당 작가 식별 번호 가진 책 검색
+        if search_book.startswith("#"):
+            # 제목에 포함되는지 확인 (첫 글자 # 포함)
+            if search_book in isbn_data.title:
+                return True
+            
+            # # 문자 제외한 나머지 부분을 저자 식별번호와 완전 일치 비교
+            author_id_str = search_book[1:].strip()
+            return any(author_id_str == str(author_id) for author_id in author_ids)
+        
+        # 제목에 포함되는지 확인
+        if search_book in isbn_data.title:
+            return True
+        
+        # 저자 이름에 포함되는지 확인 (중간에 #이 있어도 이름으로 비교)
+        return any(search_book in self.search_author_by_id(author_id).name for author_id in author_ids)
+    
     # ========== 5. 대출 ========== #
     def borrow_book(self):
         name = self.input_borrower_name()
@@ -2460,7 +3887,7 @@ class DataManager(object):
             # 새로운 사용자 생성
             borrower_id = len(self.user_table)
             borrower = UserRecord(borrower_id, phone, name, False)
-            self.user_table.append(borrower)
+            self.add_user(borrower)
         else:
             borrower_id = borrower.user_id
         
@@ -2508,7 +3935,6 @@ class DataManager(object):
 
         book_id = int(book_id)
         
-        book = self.search_book_by_id(book_id)
         print("책이 특정되었습니다.")
         print(self.get_header(contain_borrow_info=False))
         print()
@@ -2519,23 +3945,68 @@ class DataManager(object):
             return False
         
         if self.input_response("위 책을 대출할까요? (Y/N): "):
-            borrow_date = self.today
-            due_date = self.today + self.config["borrow_date"]
-            
-            borrow = BorrowRecord(len(self.borrow_table), book_id, borrower_id, borrow_date, due_date, None, False)
-            self.borrow_table.append(borrow)
-            
-            # 책 대출 로그 추가
-            self.add_to_log(log_type="BOOK_BORROW", isbn=book.isbn, book_id=book_id, borrow_id=borrow.borrow_id, log_date=self.today)
-            
-            print(f"대출이 완료되었습니다. 반납 예정일은 {due_date} 입니다.")
-            self.fetch_data_file()
+            borrow = self.process_borrow(book_id, borrower_id)
+            print(f"대출이 완료되었습니다. 반납 예정일은 {borrow.return_date} 입니다.")
+            self.print_recommendations(self.search_book_by_id(book_id).isbn)
             return True
         
         else:
             print("대출이 취소되었습니다. 메인 프롬프트로 돌아갑니다.")
             return False
 
+    def process_borrow(self, book_id: int, borrower_id: int) -> BorrowRecord:
+        """_summary_
+        입력 확인이 끝난 대출 처리 (대출 기록, 로그 추가 후 파일 저장)
+        """
+        book = self.search_book_by_id(book_id)
+        borrow_date = self.today
+        due_date = self.today + self.config["borrow_date"]
+        
+        borrow = BorrowRecord(self.get_table_size("borrow"), book_id, borrower_id, borrow_date, due_date, None, False)
+        self.append_history_record("borrow", borrow)
+        self.update_latest_dates(borrow_date=borrow.borrow_date)
+        
+        if self.co_borrows is not None:
+            self.co_borrows.add(borrower_id, book.isbn)
+        
+        # 책 대출 로그 추가
+        self.add_to_log(log_type="BOOK_BORROW", isbn=book.isbn, book_id=book_id, borrow_id=borrow.borrow_id, log_date=self.today)
+        
+        self.fetch_data_file()
+        return borrow
+    
+    def get_co_borrows(self) -> CoBorrowIndex:
+        """_summary_
+        함께 대출한 책 (처음 호출할 때 대출 기록을 한 번 훑어서 만듦)
+        """
+        if self.co_borrows is None:
+            co_borrows = CoBorrowIndex()
+            co_borrows.build((borrow.user_id, self.book_table[borrow.book_id].isbn) for borrow in self.borrow_table if not borrow.deleted)
+            self.co_borrows = co_borrows
+            
+        return self.co_borrows
+    
+    def get_recommendations(self, isbn: int) -> list[tuple[ISBNRecord, int]]:
+        """_summary_
+        ISBN 책을 대출한 사용자들이 함께 대출한 책 상위 RECOMMEND_TOP_N개와 함께 대출한 사용자 수
+        """
+        return [(self.search_isbn_data(other), count) for other, count in self.get_co_borrows().recommend(isbn)]
+    
+    def print_recommendations(self, isbn: int) -> bool:
+        recommendations = self.get_recommendations(isbn)
+        if not recommendations:
+            return False
+        
+        print("이 책을 대출한 사용자들이 함께 대출한 책입니다.")
+        print("<ISBN / 제목 / 저자 / 출판사 / 함께 대출한 사용자 수>")
+        print()
+        for isbn_data, count in recommendations:
+            author_name = self.convert_author_ids_to_name_id(self.search_author_ids_by_isbn(isbn_data.isbn))
+            publisher = self.search_publisher_by_id(isbn_data.publisher_id)
+            print(f"{format_isbn(isbn_data.isbn)}/{isbn_data.title}/{author_name}/{publisher.name}/{count}")
+        print()
+        return True
+
     # ========== 6. 반납 ========== #
     def return_book(self):
         # try:
@@ -2558,11 +4029,7 @@ class DataManager(object):
             return False
         
         # 대출 여부 확인
-        borrow_info = None
-        for borrow in self.borrow_table:
-            if borrow.book_id == rtn_book_id and borrow.actual_return_date is None:
-                borrow_info = borrow
-                break
+        borrow_info = self.open_borrows.get(rtn_book_id)
 
         if not borrow_info:
             print("ERROR: 현재 대출 중인 책이 아닙니다.")
@@ -2594,8 +4061,21 @@ class DataManager(object):
             print("반납을 취소했습니다. 메인 프롬프트로 돌아갑니다.")
             return False
         
-        # 반납 처리
+        self.process_return(borrow_info)
+        print("반납이 완료되었습니다. 메인 프롬프트로 돌아갑니다.")
+        return True
+            
+        # except Exception as e:
+        #     print(f"ERROR: 예상하지 못한 오류가 발생했습니다. {str(e)}")
+        #     return False
+            
+    def process_return(self, borrow_info: BorrowRecord) -> None:
+        """_summary_
+        입력 확인이 끝난 반납 처리 (반납일 기록, 연체 패널티 부여/연장, 로그 추가 후 파일 저장)
+        """
         borrow_info.actual_return_date = self.today
+        self.mark_dirty("borrow", borrow_info)
+        self.open_borrows.pop(borrow_info.book_id)
             
         # TODO: 연체 패널티 추가 
         overdue_days = 0
@@ -2611,34 +4091,28 @@ class DataManager(object):
             # 기존 페널티 확인 및 병합
             existing_penalty = None
             for penalty in self.overdue_penalty_table:
-                if penalty.user_id == borrower_id and penalty.penalty_end_date >= self.today:
+                if penalty.user_id == borrow_info.user_id and penalty.penalty_end_date >= self.today:
                     existing_penalty = penalty
                     break
 
             if existing_penalty:
                 # 기존 페널티 종료일에 새로운 페널티 일수를 추가하여 연장
                 existing_penalty.penalty_end_date = existing_penalty.penalty_end_date + penalty_days
+                self.mark_dirty("overdue_penalty", existing_penalty)
                 print(f"[페널티 연장] {penalty_start_date} ~ {existing_penalty.penalty_end_date}")
             else:
                 # 새로운 페널티 생성
                 penalty_id = len(self.overdue_penalty_table)
                 self.overdue_penalty_table.append(
                     OverduePenaltyRecord(
-                        penalty_id, borrower_id, penalty_start_date, penalty_end_date
+                        penalty_id, borrow_info.user_id, penalty_start_date, penalty_end_date
                     )
                 )
                 print(f"[새로운 페널티 부여] {penalty_start_date} ~ {penalty_end_date}")
                 
         # 책 반납 로그 추가
-        self.add_to_log(log_type="BOOK_RETURN", isbn=rtn_isbn.isbn, book_id=borrow_info.book_id, borrow_id=borrow_info.borrow_id, log_date=self.today)
-                
-        print("반납이 완료되었습니다. 메인 프롬프트로 돌아갑니다.")
+        self.add_to_log(log_type="BOOK_RETURN", isbn=self.search_book_by_id(borrow_info.book_id).isbn, book_id=borrow_info.book_id, borrow_id=borrow_info.borrow_id, log_date=self.today)
         self.fetch_data_file()
-        return True
-            
-        # except Exception as e:
-        #     print(f"ERROR: 예상하지 못한 오류가 발생했습니다. {str(e)}")
-        #     return False
             
     # ========== 7. 설정 ========== #
     def system_setting(self):
@@ -2699,8 +4173,12 @@ class DataManager(object):
         assert isbn is not None, "ISBN은 None일 수 없습니다."
         assert log_date is not None, "로그 날짜는 None일 수 없습니다."
 
-        new_log = LogRecord(len(self.log_table), isbn, book_id, borrow_id, log_date, log_type)
-        self.log_table.append(new_log)
+        new_log = LogRecord(self.get_table_size("log"), isbn, book_id, borrow_id, log_date, log_type)
+        self.append_history_record("log", new_log)
+        
+        if log_type == "BOOK_BORROW" and self.popularity is not None:
+            self.popularity.add(log_date.ordinal, isbn, tuple(self.search_author_ids_by_isbn(isbn)))
+        
         self.fetch_data_file()
         
         return True
@@ -2717,6 +4195,15 @@ class DataManager(object):
         
         history_book_id = int(history_book_id)
         
+        if not self.print_history(history_book_id):
+            return False
+        
+        print("메인 프롬프트로 돌아갑니다.")
+    
+    def print_history(self, history_book_id: int) -> bool:
+        """_summary_
+        책 하나의 정보와 연혁(ISBN 등록, 입고, 대출, 반납, 삭제) 출력
+        """
         # 고유번호에 해당하는 책 존재 여부 확인
         book_history = self.search_book_by_id(history_book_id, include_deleted=True)
         
@@ -2778,7 +4265,81 @@ class DataManager(object):
                     print(f"{log.log_date} 삭제")
                     continue
         
+        return True
+    
+    # ========== 10. 인기 도서 ========== #
+    def get_popularity(self) -> BorrowPopularity:
+        """_summary_
+        기간별 대출 횟수 (처음 호출할 때 대출 로그를 날짜순으로 한 번 훑어서 만듦)
+        """
+        if self.popularity is None:
+            popularity = BorrowPopularity()
+            popularity.advance(self.today.ordinal)
+            
+            borrow_logs = [log for log in self.log_table if log.log_type == "BOOK_BORROW"]
+            borrow_logs.sort(key=lambda log: log.log_date.ordinal)
+            for log in borrow_logs:
+                popularity.add(log.log_date.ordinal, log.isbn, tuple(self.search_author_ids_by_isbn(log.isbn)))
+                
+            self.popularity = popularity
+            
+        return self.popularity
+    
+    def get_popular_books(self, days: int=30, k: int=POPULAR_TOP_K) -> list[tuple[ISBNRecord, int]]:
+        """_summary_
+        최근 days일(0이면 전체 기간) 동안 대출 횟수 상위 k개 ISBN과 대출 횟수
+        """
+        assert days in POPULARITY_WINDOWS, f"집계 기간은 {POPULARITY_WINDOWS} 중 하나여야 합니다."
+        return [(self.search_isbn_data(isbn), count) for isbn, count in self.get_popularity().top(days, "isbn", k)]
+    
+    def get_popular_authors(self, days: int=30, k: int=POPULAR_TOP_K) -> list[tuple[AuthorRecord, int]]:
+        """_summary_
+        최근 days일(0이면 전체 기간) 동안 대출 횟수 상위 k명 저자와 대출 횟수
+        """
+        assert days in POPULARITY_WINDOWS, f"집계 기간은 {POPULARITY_WINDOWS} 중 하나여야 합니다."
+        return [(self.search_author_by_id(author_id), count) for author_id, count in self.get_popularity().top(days, "author", k)]
+    
+    def popular_books(self):
+        while True:
+            print("\n조회할 기간에 해당하는 번호를 입력하세요.")
+            for i, days in enumerate(POPULARITY_WINDOWS, start=1):
+                print(f"{i}. {'전체 기간' if days == 0 else f'최근 {days}일'}")
+            print("-"*20)
+            print("Libsystem >", end="")
+            option = input().strip()
+            
+            if option == self.config["cancel"]:
+                print("인기 도서 조회를 취소했습니다. 메인 프롬프트로 돌아갑니다.")
+                return False
+            
+            if not option.isdigit() or not 1 <= int(option) <= len(POPULARITY_WINDOWS):
+                print("원하는 기간에 해당하는 번호(숫자)만 입력해주세요.")
+                continue
+            
+            days = POPULARITY_WINDOWS[int(option) - 1]
+            break
+        
+        popular_books = self.get_popular_books(days)
+        if not popular_books:
+            print("해당 기간에 대출된 책이 없습니다. 메인 프롬프트로 돌아갑니다.")
+            return False
+        
+        print("<순위 / ISBN / 제목 / 저자 / 출판사 / 대출 횟수>")
+        print()
+        for rank, (isbn_data, count) in enumerate(popular_books, start=1):
+            author_name = self.convert_author_ids_to_name_id(self.search_author_ids_by_isbn(isbn_data.isbn))
+            publisher = self.search_publisher_by_id(isbn_data.publisher_id)
+            print(f"{rank}/{format_isbn(isbn_data.isbn)}/{isbn_data.title}/{author_name}/{publisher.name}/{count}")
+        print()
+        
+        print("<순위 / 저자 / 대출 횟수>")
+        print()
+        for rank, (author, count) in enumerate(self.get_popular_authors(days), start=1):
+            print(f"{rank}/{author.name} #{author.author_id}/{count}")
+        print()
+        
         print("메인 프롬프트로 돌아갑니다.")
+        return True
     
     # ========= 기타 Utility 함수 ========= #
     # 데이터 개수 검사
@@ -2799,22 +4360,29 @@ class DataManager(object):
         self.static_id += 1
         return True
     
+    # 날짜 검사용 최댓값 갱신
+    def update_latest_dates(self, register_date: MyDate=None, borrow_date: MyDate=None, published_year: int=None) -> None:
+        if register_date is not None and (self.latest_register_date is None or register_date > self.latest_register_date):
+            self.latest_register_date = register_date
+            
+        if borrow_date is not None and (self.latest_borrow_date is None or borrow_date > self.latest_borrow_date):
+            self.latest_borrow_date = borrow_date
+            
+        if published_year is not None and (self.latest_published_year is None or published_year > self.latest_published_year):
+            self.latest_published_year = published_year
+    
     # ========== 현재 날짜가 데이터 파일에 올바른지 검사 ========== #
     def check_today_by_data(self, today: MyDate) -> tuple[bool, str]:
-        for book in self.book_table:
-            # 등록 날짜가 현재 날짜보다 미래인 경우
-            if book.register_date > today:
-                return False, f"가장 최근에 저장된 책의 등록날짜 또는 대출날짜보다 과거의 날짜입니다."
+        # 등록 날짜가 현재 날짜보다 미래인 경우
+        if self.latest_register_date is not None and self.latest_register_date > today:
+            return False, f"가장 최근에 저장된 책의 등록날짜 또는 대출날짜보다 과거의 날짜입니다."
             
-            
-        for isbn_year in self.isbn_table:
-            if isbn_year.published_year > today.year:
-                return False, f"ISBN의 출판년도보다 과거의 날짜입니다."
+        if self.latest_published_year is not None and self.latest_published_year > today.year:
+            return False, f"ISBN의 출판년도보다 과거의 날짜입니다."
             
         # 대출 날짜와 비교   
-        for record in self.borrow_table:
-            if record.borrow_date is not None and record.borrow_date > today:
-                return False, f"가장 최근에 저장된 책의 등록날짜 또는 대출날짜보다 과거의 날짜입니다."
+        if self.latest_borrow_date is not None and self.latest_borrow_date > today:
+            return False, f"가장 최근에 저장된 책의 등록날짜 또는 대출날짜보다 과거의 날짜입니다."
             
         return (True, None)
 
@@ -3022,7 +4590,7 @@ class DataManager(object):
 
 
 """ ========== main prompt ========== """
-def main_prompt(bookData: DataManager) -> None:
+def main_prompt(bookData: DataManager, profiler: Profiler=None) -> None:
     slc = 0
     
     main_prompt_text = """1. 추가
@@ -3033,14 +4601,29 @@ def main_prompt(bookData: DataManager) -> None:
 6. 반납
 7. 설정
 8. 연혁(로그) 조회
-9. 종료\n"""
+9. 종료
+10. 인기 도서\n"""
+    
+    # 메뉴 번호 -> 동작
+    actions = {
+        1: bookData.add_book,
+        2: bookData.delete_book,
+        3: bookData.update_book,
+        4: bookData.search_book,
+        5: bookData.borrow_book,
+        6: bookData.return_book,
+        7: bookData.system_setting,  # 설정
+        8: bookData.history,  # 연혁(로그) 조회
+        10: bookData.popular_books,  # 인기 도서
+    }
     
     while slc != 9:
         print(main_prompt_text + "-"*20 + "\nLibsystem_Main > ", end="")
         
         try:
             slc = int(input())
-            assert 0 < slc < 10, "원하는 동작에 해당하는 번호(숫자)만 입력해주세요."
+            # 0은 메뉴에 없는 진단 메뉴 (실행 시간 측정 중에만 사용 가능)
+            assert 0 < slc < 11 or (slc == 0 and bookData.metrics is not None), "원하는 동작에 해당하는 번호(숫자)만 입력해주세요."
         except ValueError as e:
             print("원하는 동작에 해당하는 번호(숫자)만 입력해주세요.")
             continue
@@ -3051,31 +4634,22 @@ def main_prompt(bookData: DataManager) -> None:
             print("예상하지 못한 오류 발생.", e)
             break
         
-        if slc == 1:
-            bookData.add_book()
-            
-        if slc == 2:
-            bookData.delete_book()
-            
-        if slc == 3:
-            bookData.update_book()
+        if slc == 0:
+            print(bookData.metrics.report())
+            continue
         
-        if slc == 4:
-            bookData.search_book()
-            
-        if slc == 5:
-            bookData.borrow_book()
-            
-        if slc == 6:
-            bookData.return_book()
-    
-        # 설정
-        if slc == 7:
-            bookData.system_setting()
-            
-        # 연혁(로그) 조회
-        if slc == 8:
-            bookData.history()
+        action = actions.get(slc)
+        if action is None:
+            continue
+        
+        name = f"menu.{action.__name__}"
+        if profiler is not None:
+            action = profiler.wrap(name, action)
+        
+        if bookData.metrics is None:
+            action()
+        else:
+            bookData.metrics.measure(name, action)
     
 
     print("프로그램을 종료합니다.")
@@ -3128,6 +4702,10 @@ def get_user_home_path() -> str:
 
 """ ========== main ========== """
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Libsystem")
+    parser.add_argument("--profile", action="store_true", help="명령마다 cProfile, tracemalloc 결과를 data 폴더 옆 profile 폴더에 저장")
+    args = parser.parse_args()
+    
     try:
         dir_path = get_user_home_path()
         
@@ -3147,22 +4725,48 @@ def main() -> None:
     # config 불러오기
     bookData.load_configuration()
     
-    # 데이터 파일 읽기
-    done, message = bookData.read_data_files(verbose=True)
+    # 저장소 선택 (storage가 "sqlite"이면 데이터 파일 대신 SQLite 데이터베이스 사용)
+    if bookData.config.get("storage", "file") == "sqlite":
+        # 스크립트로 실행한 경우 Libsystem_SQLite가 이 파일을 다시 import하지 않도록 등록 (MyDate 등 클래스를 공유해야 함)
+        sys.modules.setdefault("Libsystem_Main", sys.modules[__name__])
+        from Libsystem_SQLite import SQLiteDataManager
+        bookData = SQLiteDataManager(file_path=dir_path)
+    
+    # 실행 시간 측정 (metrics가 1이면 메뉴 동작, 파일 읽기/저장, 파일별 검사 시간을 기록하고 종료 시 파일로 저장)
+    if bookData.config.get("metrics", 0):
+        bookData.enable_metrics()
+    
+    # 프로파일링 (--profile로 실행한 경우 데이터 파일 읽기, 메뉴 동작, 종료 시 저장을 각각 기록)
+    profiler = Profiler(dir_path) if args.profile else None
+    read_data_files = bookData.read_data_files if profiler is None else profiler.wrap("read_data_files", bookData.read_data_files)
+    fetch_data_file = bookData.fetch_data_file if profiler is None else profiler.wrap("fetch_data_file", bookData.fetch_data_file)
+    
+    # 데이터 파일 읽기 (parallel_load가 1이면 파일별 검사를 프로세스 풀에서 동시에 실행, mmap_load가 1이면 대출/로그 파일을 mmap으로 읽기)
+    done, message = read_data_files(verbose=True, parallel=bool(bookData.config.get("parallel_load", 0)), use_mmap=bool(bookData.config.get("mmap_load", 0)), lazy_history=bool(bookData.config.get("lazy_load", 0)))
     
     if not done:
         print("ERROR:", message)
         print("프로그램을 종료합니다.")
+        if profiler is not None:
+            profiler.close()
         return
-    
+
     # 현재 날짜 입력
     today = input_date(bookData)
     bookData.set_today(today)
     
-    main_prompt(bookData=bookData)
+    main_prompt(bookData=bookData, profiler=profiler)
     
     # 파일 저장 후 종료
-    bookData.fetch_data_file()
+    if fetch_data_file():
+        # 다음 실행 시 바뀌지 않은 파일의 검사를 생략할 수 있도록 지문 저장
+        bookData.save_manifest()
+    
+    if bookData.metrics is not None:
+        bookData.metrics.dump(dir_path)
+    
+    if profiler is not None:
+        profiler.close()
 
 
 if __name__ == "__main__":
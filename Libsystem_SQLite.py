@@ -0,0 +1,326 @@
+import argparse
+import os
+import sqlite3
+import sys
+from os.path import join as opj
+
+from Libsystem_Main import (
+    DataManager, MyDate, SharedDates, DATA_FILE_NAMES, DATA_TABLE_LABELS, format_isbn, get_user_home_path,
+    BookRecord, ISBNRecord, AuthorRecord, IsbnAuthorRecord, BorrowRecord,
+    UserRecord, PublisherRecord, OverduePenaltyRecord, LogRecord,
+)
+
+
+SQLITE_FILE_NAME = "Libsystem_Data.db"
+
+# 테이블 컬럼 (레코드 생성자의 인자 순서와 같음)
+TABLE_COLUMNS = {
+    "publisher": ("publisher_id", "name", "deleted"),
+    "isbn": ("isbn", "title", "publisher_id", "published_year", "isbn_register_date"),
+    "book": ("book_id", "isbn", "register_date", "delete_date", "deleted"),
+    "author": ("author_id", "name", "deleted"),
+    "isbn_author": ("isbn", "author_id"),
+    "user": ("user_id", "phone_number", "name", "deleted"),
+    "borrow": ("borrow_id", "book_id", "user_id", "borrow_date", "return_date", "actual_return_date", "deleted"),
+    "overdue_penalty": ("penalty_id", "user_id", "penalty_start_date", "penalty_end_date"),
+    "log": ("log_id", "isbn", "book_id", "borrow_id", "log_date", "log_type"),
+}
+
+RECORD_CLASSES = {
+    "publisher": PublisherRecord,
+    "isbn": ISBNRecord,
+    "book": BookRecord,
+    "author": AuthorRecord,
+    "isbn_author": IsbnAuthorRecord,
+    "user": UserRecord,
+    "borrow": BorrowRecord,
+    "overdue_penalty": OverduePenaltyRecord,
+    "log": LogRecord,
+}
+
+DATE_COLUMNS = {
+    "isbn_register_date", "register_date", "delete_date", "borrow_date", "return_date",
+    "actual_return_date", "penalty_start_date", "penalty_end_date", "log_date",
+}
+
+# 저장 후에도 값이 바뀔 수 있는 테이블의 키 컬럼 (나머지 테이블은 추가만 됨)
+KEY_COLUMNS = {
+    "book": "book_id",
+    "isbn": "isbn",
+    "borrow": "borrow_id",
+    "overdue_penalty": "penalty_id",
+    # ISBN - 저자 관계는 수정 시 행이 줄어들 수 있으므로 ISBN 단위로 지우고 다시 추가
+    "isbn_author": "isbn",
+}
+
+# pos는 메모리 테이블(리스트)에서의 순서 (검색은 메모리에서 하므로 키 컬럼 외의 인덱스는 두지 않음)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS publisher (pos INTEGER PRIMARY KEY, publisher_id INTEGER NOT NULL UNIQUE, name TEXT NOT NULL, deleted INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS isbn (pos INTEGER PRIMARY KEY, isbn INTEGER NOT NULL UNIQUE, title TEXT NOT NULL, publisher_id INTEGER NOT NULL REFERENCES publisher(publisher_id), published_year INTEGER NOT NULL, isbn_register_date TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS book (pos INTEGER PRIMARY KEY, book_id INTEGER NOT NULL UNIQUE, isbn INTEGER NOT NULL REFERENCES isbn(isbn), register_date TEXT NOT NULL, delete_date TEXT, deleted INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS author (pos INTEGER PRIMARY KEY, author_id INTEGER NOT NULL UNIQUE, name TEXT NOT NULL, deleted INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS isbn_author (pos INTEGER PRIMARY KEY, isbn INTEGER NOT NULL REFERENCES isbn(isbn), author_id INTEGER NOT NULL REFERENCES author(author_id));
+CREATE TABLE IF NOT EXISTS user (pos INTEGER PRIMARY KEY, user_id INTEGER NOT NULL UNIQUE, phone_number TEXT NOT NULL, name TEXT NOT NULL, deleted INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS borrow (pos INTEGER PRIMARY KEY, borrow_id INTEGER NOT NULL UNIQUE, book_id INTEGER NOT NULL REFERENCES book(book_id), user_id INTEGER NOT NULL REFERENCES user(user_id), borrow_date TEXT NOT NULL, return_date TEXT NOT NULL, actual_return_date TEXT, deleted INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS overdue_penalty (pos INTEGER PRIMARY KEY, penalty_id INTEGER NOT NULL UNIQUE, user_id INTEGER NOT NULL REFERENCES user(user_id), penalty_start_date TEXT NOT NULL, penalty_end_date TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS log (pos INTEGER PRIMARY KEY, log_id INTEGER NOT NULL UNIQUE, isbn INTEGER NOT NULL REFERENCES isbn(isbn), book_id INTEGER REFERENCES book(book_id), borrow_id INTEGER REFERENCES borrow(borrow_id), log_date TEXT NOT NULL, log_type TEXT NOT NULL);
+
+CREATE INDEX IF NOT EXISTS idx_isbn_author_isbn ON isbn_author(isbn);
+"""
+
+
+""" ========== 레코드 <-> 행 변환 ========== """
+def to_row(table_name: str, record) -> tuple:
+    row = []
+    for column in TABLE_COLUMNS[table_name]:
+        value = getattr(record, column)
+        if isinstance(value, MyDate):
+            value = str(value)
+        elif isinstance(value, bool):
+            value = int(value)
+        row.append(value)
+
+    return tuple(row)
+
+
+def to_record(table_name: str, row: tuple, dates: SharedDates):
+    values = []
+    for column, value in zip(TABLE_COLUMNS[table_name], row):
+        if column in DATE_COLUMNS:
+            value = None if value is None else dates[value]
+        elif column in ("title", "name", "log_type"):
+            value = sys.intern(value)
+        elif column == "deleted":
+            value = bool(value)
+        values.append(value)
+
+    return RECORD_CLASSES[table_name](*values)
+
+
+""" ========== SQLite 저장소 ========== """
+class SQLiteStorage(object):
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+        # 마지막 동기화 시점의 레코드 수 (테이블 이름 -> 레코드 수)
+        self.synced_sizes: dict = dict()
+
+        # 마지막 동기화 이후 값이 바뀐 행 (테이블 이름 -> {키: 레코드})
+        self.dirty_rows: dict = {table_name: dict() for table_name in KEY_COLUMNS}
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def is_empty(self) -> bool:
+        return self.connection.execute("SELECT value FROM meta WHERE key = 'static_id'").fetchone() is None
+
+    def insert_records(self, table_name: str, records: list, start: int=0) -> None:
+        columns = ("pos",) + TABLE_COLUMNS[table_name]
+        self.connection.executemany(
+            f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            ((pos, *to_row(table_name, record)) for pos, record in enumerate(records, start=start))
+        )
+
+    # 메모리 테이블 전체를 데이터베이스에 쓰기 (가져오기)
+    def write_tables(self, manager: DataManager) -> None:
+        with self.connection:
+            # 참조하는 테이블부터 삭제
+            for table_name in reversed(DATA_FILE_NAMES):
+                self.connection.execute(f"DELETE FROM {table_name}")
+
+            for table_name in DATA_FILE_NAMES:
+                self.insert_records(table_name, getattr(manager, f"{table_name}_table"))
+
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('static_id', ?)", (str(manager.static_id),))
+
+        self.mark_synced(manager)
+
+    # 데이터베이스의 모든 테이블을 메모리 테이블로 읽기
+    def load_tables(self, manager: DataManager) -> None:
+        static_id = int(self.connection.execute("SELECT value FROM meta WHERE key = 'static_id'").fetchone()[0])
+
+        # 읽는 동안만 같은 날짜 문자열의 MyDate를 공유
+        dates = SharedDates()
+
+        for table_name in DATA_FILE_NAMES:
+            cursor = self.connection.execute(f"SELECT {', '.join(TABLE_COLUMNS[table_name])} FROM {table_name} ORDER BY pos")
+            records = [to_record(table_name, row, dates) for row in cursor]
+            manager.set_table_records(table_name, records, static_id if table_name == "book" else 0)
+
+        self.mark_synced(manager)
+
+    def mark_synced(self, manager: DataManager) -> None:
+        for table_name in DATA_FILE_NAMES:
+            self.synced_sizes[table_name] = len(getattr(manager, f"{table_name}_table"))
+
+        for dirty_rows in self.dirty_rows.values():
+            dirty_rows.clear()
+
+    # 값이 바뀐 행 표시 (다음 동기화 때 해당 행만 UPDATE)
+    def mark_dirty(self, table_name: str, record) -> None:
+        self.dirty_rows[table_name][getattr(record, KEY_COLUMNS[table_name])] = record
+
+    # 마지막 동기화 이후 추가된 레코드만 쓰기 (ISBN - 저자 관계는 표시된 ISBN 단위로 씀)
+    def flush_appends(self, manager: DataManager) -> None:
+        for table_name in DATA_FILE_NAMES:
+            if table_name == "isbn_author":
+                continue
+
+            records = getattr(manager, f"{table_name}_table")
+            size = self.synced_sizes[table_name]
+            if len(records) == size:
+                continue
+
+            self.insert_records(table_name, records[size:], start=size)
+            self.synced_sizes[table_name] = len(records)
+
+    # 추가된 레코드와 값이 바뀌었다고 표시된 행만 데이터베이스에 반영
+    def sync(self, manager: DataManager) -> None:
+        with self.connection:
+            self.flush_appends(manager)
+
+            for table_name, dirty_rows in self.dirty_rows.items():
+                if not dirty_rows:
+                    continue
+
+                if table_name == "isbn_author":
+                    self.connection.executemany("DELETE FROM isbn_author WHERE isbn = ?", ((isbn,) for isbn in dirty_rows))
+                    self.connection.executemany(
+                        "INSERT INTO isbn_author (isbn, author_id) VALUES (?, ?)",
+                        ((isbn, author_id) for isbn in dirty_rows for author_id in manager.authors_by_isbn.get(isbn, ()))
+                    )
+                    dirty_rows.clear()
+                    continue
+
+                assignments = ", ".join(f"{column} = ?" for column in TABLE_COLUMNS[table_name])
+                self.connection.executemany(
+                    f"UPDATE {table_name} SET {assignments} WHERE {KEY_COLUMNS[table_name]} = ?",
+                    ((*to_row(table_name, record), key) for key, record in dirty_rows.items())
+                )
+                dirty_rows.clear()
+
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('static_id', ?)", (str(len(manager.book_table)),))
+
+
+""" ========== 데이터 파일 가져오기 / 내보내기 ========== """
+def import_data_files(file_path: str, storage: SQLiteStorage) -> tuple[bool, str]:
+    """_summary_
+    Libsystem_Data_*.txt 파일을 무결성 검사 후 데이터베이스로 가져오기 (기존 데이터베이스 내용은 삭제)
+    """
+    manager = DataManager(file_path=file_path)
+    passed, message = manager.read_data_files(verbose=False, use_manifest=False)
+
+    if not passed:
+        return (False, message)
+
+    storage.write_tables(manager)
+    return (True, "")
+
+
+def export_data_files(file_path: str, storage: SQLiteStorage) -> bool:
+    """_summary_
+    데이터베이스 내용을 Libsystem_Data_*.txt 파일로 내보내기
+    """
+    manager = DataManager(file_path=file_path)
+    manager.create_data_files()
+    storage.load_tables(manager)
+
+    if not manager.fetch_data_file():
+        return False
+
+    # fetch_data_file은 로그 파일을 쓰지 않으므로 따로 저장
+    with open(opj(file_path, "data", DATA_FILE_NAMES["log"]), "w", encoding='utf-8') as f:
+        for log in manager.log_table:
+            f.write(f"{log.log_id}/{format_isbn(log.isbn)}/{'' if log.book_id is None else log.book_id}/{'' if log.borrow_id is None else log.borrow_id}/{log.log_date}/{log.log_type}\n")
+
+    return True
+
+
+""" ========== SQLite 저장소를 사용하는 도서 관리 클래스 ========== """
+class SQLiteDataManager(DataManager):
+    """_summary_
+    메모리 테이블과 검색은 DataManager를 그대로 사용하고, 저장은 추가되거나 바뀐 행만 SQLite에 반영
+    """
+    def __init__(self, file_path: str, db_path: str=None):
+        super().__init__(file_path)
+
+        if db_path is None:
+            os.makedirs(opj(file_path, "data"), exist_ok=True)
+            db_path = opj(file_path, "data", SQLITE_FILE_NAME)
+
+        self.storage = SQLiteStorage(db_path)
+
+    # 데이터베이스 읽기 (비어있으면 데이터 파일에서 가져옴, 파일 읽기 옵션은 사용하지 않음)
+    def read_data_files(self, sep: str="/", verbose=True, **kwargs) -> tuple[bool, str]:
+        if verbose: print("="*10, "Start Reading Database", "="*10)
+
+        if self.storage.is_empty():
+            passed, message = import_data_files(self.file_path, self.storage)
+            if not passed:
+                return (False, message)
+
+            if verbose: print("Data Files Imported")
+
+        self.storage.load_tables(self)
+
+        if verbose:
+            for table_name in DATA_FILE_NAMES:
+                print(f"{self.get_table_size(table_name)} {DATA_TABLE_LABELS[table_name]} Data Loaded")
+            print("="*10, "End Reading Database", "="*10)
+
+        return (True, "")
+
+    # ========== 데이터 메모리 -> 데이터베이스 동기화 (fetch) ========== #
+    def fetch_data_file(self) -> bool:
+        try:
+            self.storage.sync(self)
+            return True
+
+        except sqlite3.Error as e:
+            print("ERROR: 데이터베이스 저장에 실패했습니다.", e)
+            return False
+
+    # 데이터 파일 지문은 사용하지 않음
+    def save_manifest(self) -> bool:
+        return True
+
+    def mark_dirty(self, table_name: str, record) -> None:
+        self.storage.mark_dirty(table_name, record)
+
+
+""" ========== main ========== """
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Libsystem SQLite 저장소 가져오기/내보내기")
+    parser.add_argument("command", choices=["import", "export"], help="import: 데이터 파일 -> 데이터베이스, export: 데이터베이스 -> 데이터 파일")
+    parser.add_argument("--path", default=get_user_home_path(), help="data 폴더와 Libsystem_Config.json이 있는 경로")
+    parser.add_argument("--db", default=None, help=f"데이터베이스 파일 경로 (기본값: <path>/data/{SQLITE_FILE_NAME})")
+    args = parser.parse_args()
+
+    db_path = args.db
+    if db_path is None:
+        os.makedirs(opj(args.path, "data"), exist_ok=True)
+        db_path = opj(args.path, "data", SQLITE_FILE_NAME)
+
+    storage = SQLiteStorage(db_path)
+
+    if args.command == "import":
+        passed, message = import_data_files(args.path, storage)
+        print("가져오기가 완료되었습니다." if passed else f"ERROR: {message}")
+
+    else:
+        if storage.is_empty():
+            print("ERROR: 데이터베이스가 비어있습니다.")
+        elif export_data_files(args.path, storage):
+            print("내보내기가 완료되었습니다.")
+
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from os.path import join as opj
+
+from Libsystem_Main import DataManager, MANIFEST_FILE_NAME
+
+
+REPO_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+# 저장소의 data 폴더와 설정 파일을 임시 폴더로 복사 (테스트가 원본 데이터 파일과 데이터베이스를 바꾸지 않도록)
+def copy_repo_data(temp_path: str) -> None:
+    shutil.copytree(opj(REPO_PATH, "data"), opj(temp_path, "data"), ignore=shutil.ignore_patterns("*.db*", "*.bak", MANIFEST_FILE_NAME))
+    shutil.copy(opj(REPO_PATH, "Libsystem_Config.json"), temp_path)
+
+
+""" ========== 저장소 데이터 복사본을 사용하는 테스트 ========== """
+class RepoDataTestCase(unittest.TestCase):
+    """_summary_
+    테스트마다 저장소의 데이터를 임시 폴더(self.temp_dir.name)로 복사하고 끝나면 삭제
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        copy_repo_data(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    # 데이터 파일을 읽은 DataManager (file_path가 없으면 임시 폴더, 나머지 인자는 read_data_files로 전달, 기본은 매니페스트 미사용)
+    def read_files(self, file_path: str=None, **kwargs) -> DataManager:
+        manager = DataManager(file_path=self.temp_dir.name if file_path is None else file_path)
+        kwargs.setdefault("use_manifest", False)
+        passed, message = manager.read_data_files(verbose=False, **kwargs)
+        self.assertTrue(passed, message)
+        return manager
+
+    # 프롬프트 입력을 answers 순서대로 넣어 실행
+    def answer(self, func, *answers):
+        with mock.patch("builtins.input", side_effect=answers), mock.patch("builtins.print"):
+            return func()
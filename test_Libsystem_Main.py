@@ -0,0 +1,586 @@
+import os
+import random
+import unittest
+import zlib
+from collections import Counter
+from unittest import mock
+from os.path import join as opj
+
+from Libsystem_Main import DataManager, MyDate, SharedDates, MappedRecord, BorrowPopularity, CoBorrowIndex, TitleNgramIndex, BKTree, PrefixIndex, bits_from_ids, ids_from_bits, edit_distance, DATA_FILE_NAMES, HISTORY_TABLE_NAMES, MANIFEST_FILE_NAME
+from Libsystem_TestSupport import RepoDataTestCase
+
+
+""" ========== 데이터 파일 지문 (크기, 수정 시각, CRC32) ========== """
+class ManifestTest(RepoDataTestCase):
+    def setUp(self):
+        super().setUp()
+        self.manager = DataManager(file_path=self.temp_dir.name)
+
+    def data_file(self, table_name: str) -> str:
+        return opj(self.temp_dir.name, "data", DATA_FILE_NAMES[table_name])
+
+    def test_unchanged_files_are_trusted(self):
+        self.assertTrue(self.manager.save_manifest())
+        self.assertEqual(self.manager.get_trusted_tables(self.manager.load_manifest()), set(DATA_FILE_NAMES))
+
+    def test_touched_file_with_same_content_is_trusted(self):
+        self.manager.save_manifest()
+        stat = os.stat(self.data_file("user"))
+        os.utime(self.data_file("user"), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertIn("user", self.manager.get_trusted_tables(self.manager.load_manifest()))
+
+    def test_same_size_edit_is_detected_by_crc(self):
+        self.manager.save_manifest()
+        path = self.data_file("isbn")
+        stat = os.stat(path)
+        with open(path, "rb") as f:
+            data = bytearray(f.read())
+        data[0] = ord("1") if data[0] != ord("1") else ord("2")
+        with open(path, "wb") as f:
+            f.write(data)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        trusted = self.manager.get_trusted_tables(self.manager.load_manifest())
+        self.assertNotIn("isbn", trusted)
+
+        # ISBN 파일을 참조하는 파일도 다시 검사해야 함
+        self.assertNotIn("book", trusted)
+        self.assertNotIn("isbn_author", trusted)
+        self.assertIn("user", trusted)
+
+    def test_size_change_is_detected(self):
+        self.manager.save_manifest()
+        with open(self.data_file("publisher"), "a", encoding="utf-8") as f:
+            f.write("\n")
+
+        self.assertNotIn("publisher", self.manager.get_trusted_tables(self.manager.load_manifest()))
+
+    def test_corrupted_manifest_trusts_nothing(self):
+        with open(opj(self.temp_dir.name, "data", MANIFEST_FILE_NAME), "w", encoding="utf-8") as f:
+            f.write("{")
+
+        self.assertEqual(self.manager.load_manifest(), dict())
+        self.assertEqual(self.manager.get_trusted_tables(dict()), set())
+
+    def test_crc_matches_zlib(self):
+        with open(self.data_file("log"), "rb") as f:
+            expected = zlib.crc32(f.read())
+
+        self.assertEqual(self.manager.get_file_fingerprint("log")["crc32"], expected)
+
+
+# 테이블별 레코드 문자열 목록 (파일에 저장되는 형태로 비교)
+def table_lines(manager: DataManager) -> dict[str, list[str]]:
+    return {table_name: [str(record) for record in getattr(manager, f"{table_name}_table")] for table_name in DATA_FILE_NAMES}
+
+
+""" ========== mmap / 연혁 지연 로드 ========== """
+class MappedLoadTest(RepoDataTestCase):
+    def data_file(self, table_name: str) -> str:
+        return opj(self.temp_dir.name, "data", DATA_FILE_NAMES[table_name])
+
+    def test_mmap_load_matches_text_load(self):
+        expected = table_lines(self.read_files())
+        manager = self.read_files(use_mmap=True)
+
+        self.assertIsInstance(manager.borrow_table[0], MappedRecord)
+        self.assertEqual(table_lines(manager), expected)
+
+    def test_mapped_records_survive_fetch(self):
+        expected_manager = self.read_files()
+        manager = self.read_files(use_mmap=True)
+
+        # 반납되지 않은 대출 하나만 반납 처리 (나머지 매핑 레코드는 디코딩하지 않은 채로 저장)
+        index = next(i for i, borrow in enumerate(expected_manager.borrow_table) if borrow.actual_return_date is None)
+        for target in (expected_manager, manager):
+            borrow = target.borrow_table[index]
+            borrow.actual_return_date = borrow.return_date
+        self.assertTrue(manager.borrow_table[index].changed)
+
+        self.assertTrue(manager.fetch_data_file())
+        expected = table_lines(expected_manager)
+        self.assertEqual(table_lines(manager), expected)
+        self.assertEqual(table_lines(self.read_files()), expected)
+        self.assertEqual(table_lines(self.read_files(use_mmap=True)), expected)
+
+    def test_lazy_history_load_matches_text_load(self):
+        expected = table_lines(self.read_files(use_manifest=True))
+
+        for use_mmap in (False, True):
+            with self.subTest(use_mmap=use_mmap):
+                manager = self.read_files(use_manifest=True, use_mmap=use_mmap, lazy_history=True)
+                self.assertEqual(set(manager.deferred_tables), set(HISTORY_TABLE_NAMES))
+                self.assertEqual(manager.get_table_size("borrow"), len(expected["borrow"]))
+
+                # 연혁 테이블을 읽기 전에 저장해도 파일 내용이 그대로 남아야 함
+                self.assertTrue(manager.fetch_data_file())
+                self.assertEqual(table_lines(manager), expected)
+                self.assertEqual(table_lines(self.read_files()), expected)
+
+    def test_malformed_mapped_line_reports_same_error(self):
+        with open(self.data_file("borrow"), "a", encoding="utf-8") as f:
+            f.write("4/0/1/2024-13-01/2024-12-10//0\n")
+
+        text_manager = DataManager(file_path=self.temp_dir.name)
+        mapped_manager = DataManager(file_path=self.temp_dir.name)
+        text_result = text_manager.read_data_files(verbose=False, use_manifest=False)
+        mapped_result = mapped_manager.read_data_files(verbose=False, use_manifest=False, use_mmap=True)
+
+        self.assertFalse(text_result[0])
+        self.assertEqual(mapped_result, text_result)
+        self.assertNotIn("borrow", mapped_manager.mapped_files)
+
+
+""" ========== 고정 폭 날짜 변환 ========== """
+class DateParserTest(unittest.TestCase):
+    def test_valid_dates(self):
+        for text, expected in (("2024-01-01", MyDate(2024, 1, 1)), ("1583-01-01", MyDate(1583, 1, 1)), ("2023-12-31", MyDate(2023, 12, 31))):
+            date = MyDate.from_str(text)
+            self.assertEqual(date, expected)
+            self.assertEqual(str(date), text)
+            self.assertEqual(date.ordinal, expected.ordinal)
+
+    def test_leap_year(self):
+        self.assertEqual(MyDate.from_str("2024-02-29"), MyDate(2024, 2, 29))
+        self.assertEqual(MyDate.from_str("2000-02-29"), MyDate(2000, 2, 29))
+        self.assertIsNone(MyDate.from_str("2023-02-29"))
+        self.assertIsNone(MyDate.from_str("1900-02-29"))
+
+    def test_out_of_range_values(self):
+        for text in ("2024-00-10", "2024-13-10", "2024-04-31", "2024-01-00", "2024-01-32", "1582-12-31"):
+            self.assertIsNone(MyDate.from_str(text), text)
+
+    def test_malformed_strings(self):
+        for text in ("", "2024-1-01", "2024/01/01", "2024-01-1 ", "20240101", "2024-01-011", "+024-01-01", "2024-0a-01", "２０２４-01-01", "2024-01-٠١"):
+            self.assertIsNone(MyDate.from_str(text), text)
+
+    def test_shared_dates_reuse_objects_and_skip_invalid(self):
+        dates = SharedDates()
+        self.assertIs(dates["2024-03-01"], dates["2024-03-01"])
+        self.assertIsNone(dates["2024-02-30"])
+        self.assertIsNone(dates[""])
+        self.assertEqual(list(dates), ["2024-03-01"])
+
+
+""" ========== 오늘 기준으로 보이는 책 ========== """
+class LiveBooksTest(RepoDataTestCase):
+    def assert_live_books(self, manager: DataManager):
+        # 삭제되지 않았거나 삭제 날짜가 오늘 이후인 책 (고유번호 순서)
+        expected = [book.book_id for book in manager.book_table if not book.deleted or book.delete_date > manager.today]
+        self.assertEqual(list(manager.live_books), expected, str(manager.today))
+        self.assertEqual(manager.live_bits, bits_from_ids(expected), str(manager.today))
+
+    def test_advancing_today_drops_books_on_their_delete_date(self):
+        manager = self.read_files()
+        delete_dates = sorted(book.delete_date for book in manager.book_table if book.deleted)
+        self.assertTrue(delete_dates)
+
+        # 모든 삭제 날짜 이전부터 하루씩 진행하고, 중간에 오늘 날짜로 책 하나를 삭제
+        manager.set_today(delete_dates[0] - 2)
+        self.assertEqual(len(manager.pending_deletes), len(delete_dates))
+        self.assert_live_books(manager)
+
+        deleted_book = None
+        while manager.today <= delete_dates[-1] + 2:
+            manager.set_today(manager.today + 1)
+            if deleted_book is None and manager.today > delete_dates[0]:
+                deleted_book = next(book for book in manager.book_table if not book.deleted and book.book_id not in manager.open_borrows)
+                with mock.patch("builtins.input", return_value="Y"), mock.patch("builtins.print"):
+                    self.assertTrue(manager.confirm_delete(deleted_book.book_id))
+                self.assertEqual(deleted_book.delete_date, manager.today)
+            self.assert_live_books(manager)
+
+        self.assertIsNotNone(deleted_book)
+        self.assertNotIn(deleted_book.book_id, manager.live_books)
+        self.assertEqual(manager.pending_deletes, [])
+
+    def test_moving_today_back_restores_deleted_books(self):
+        manager = self.read_files()
+        latest = max(book.delete_date for book in manager.book_table if book.deleted)
+
+        manager.set_today(latest + 1)
+        self.assert_live_books(manager)
+        manager.set_today(latest - 1)
+        self.assert_live_books(manager)
+        self.assertEqual(len(manager.pending_deletes), 1)
+
+
+""" ========== 기간별 대출 횟수 상위 목록 ========== """
+class BorrowPopularityTest(unittest.TestCase):
+    def test_top_matches_brute_force(self):
+        rng = random.Random(7)
+        popularity = BorrowPopularity(windows=(7, 30, 0), top_k=3)
+        borrows = []
+        
+        for today in range(200):
+            popularity.advance(today)
+            for _ in range(rng.randrange(3)):
+                isbn, author_ids = rng.randrange(8), tuple(rng.sample(range(5), rng.randrange(1, 3)))
+                popularity.add(today, isbn, author_ids)
+                borrows.append((today, isbn, author_ids))
+            
+            for days in popularity.windows:
+                in_window = [borrow for borrow in borrows if days == 0 or borrow[0] > today - days]
+                isbn_counts = Counter(isbn for _, isbn, _ in in_window)
+                author_counts = Counter(author_id for _, _, author_ids in in_window for author_id in author_ids)
+                
+                for kind, counts in (("isbn", isbn_counts), ("author", author_counts)):
+                    expected = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+                    for k in (1, 3, 5):
+                        self.assertEqual(popularity.top(days, kind, k), expected[:k], (today, days, kind, k))
+
+
+""" ========== 함께 대출한 책 추천 ========== """
+# 사용자별 대출 ISBN에서 직접 센 ISBN별 상위 top_n개 (사용자 수가 같으면 ISBN이 작은 순서)
+def brute_force_co_borrows(isbns_by_user: dict[int, set[int]], top_n: int) -> dict[int, list[tuple[int, int]]]:
+    counts = Counter((isbn, other) for isbns in isbns_by_user.values() for isbn in isbns for other in isbns if isbn != other)
+    top = dict()
+    for (isbn, other), count in counts.items():
+        top.setdefault(isbn, []).append((other, count))
+    return {isbn: sorted(items, key=lambda item: (-item[1], item[0]))[:top_n] for isbn, items in top.items()}
+
+
+class CoBorrowIndexTest(RepoDataTestCase):
+    def test_incremental_top_matches_brute_force(self):
+        rng = random.Random(11)
+        index = CoBorrowIndex(top_n=3)
+        user_isbns = []
+
+        for _ in range(400):
+            user_id, isbn = rng.randrange(12), rng.randrange(15)
+            index.add(user_id, isbn)
+            user_isbns.append((user_id, isbn))
+
+            expected = brute_force_co_borrows(index.isbns_by_user, 3)
+            self.assertEqual({isbn: top for isbn, top in index.top.items() if top}, expected)
+
+        built = CoBorrowIndex(top_n=3)
+        built.build(user_isbns)
+        self.assertEqual(built.top, {isbn: top for isbn, top in index.top.items() if top})
+
+    def test_process_borrow_updates_recommendations(self):
+        manager = self.read_files()
+        manager.set_today(max(borrow.borrow_date for borrow in manager.borrow_table))
+        co_borrows = manager.get_co_borrows()
+        rng = random.Random(3)
+
+        # 대출 가능한 책을 임의의 사용자가 대출하고 바로 반납
+        with mock.patch("builtins.print"):
+            for _ in range(30):
+                book = rng.choice([book for book in manager.live_books.values() if book.book_id not in manager.open_borrows])
+                borrow = manager.process_borrow(book.book_id, rng.choice(manager.user_table).user_id)
+                manager.process_return(borrow)
+
+                self.assertIs(manager.co_borrows, co_borrows)
+                for isbn_data in manager.isbn_table:
+                    expected = brute_force_co_borrows(co_borrows.isbns_by_user, co_borrows.top_n).get(isbn_data.isbn, [])
+                    self.assertEqual(co_borrows.recommend(isbn_data.isbn), expected)
+
+        # 저장된 대출 기록으로 다시 만든 추천 목록과 같아야 함
+        reloaded = self.read_files()
+        self.assertEqual(reloaded.get_co_borrows().top, co_borrows.top)
+
+
+""" ========== 출판년도, 등록날짜 범위 검색 ========== """
+class RangeSearchTest(RepoDataTestCase):
+    # 저자, 출판사, 제목은 그대로 두고 출판년도만 수정
+    def edit_year(self, manager: DataManager, isbn: int, year: int) -> None:
+        isbn_data = manager.search_isbn_data(isbn)
+        authors = " & ".join(f"{manager.search_author_by_id(author_id).name} #{author_id}" for author_id in manager.search_author_ids_by_isbn(isbn))
+        publisher = manager.search_publisher_by_id(isbn_data.publisher_id)
+        self.assertTrue(self.answer(manager.update_book, f"{isbn:02d}", isbn_data.title, authors, publisher.name, str(year), "Y"))
+        self.assertEqual(isbn_data.published_year, year)
+
+    def assert_ranges(self, manager: DataManager):
+        visible = [book for book in manager.book_table if book.book_id in manager.live_books]
+        years = sorted({isbn_data.published_year for isbn_data in manager.isbn_table})
+        year_bounds = [None, years[0] - 1, years[0], years[len(years) // 2], years[-1], years[-1] + 1]
+        dates = sorted({book.register_date for book in manager.book_table})
+        date_bounds = [None, dates[0] - 1, dates[0], dates[len(dates) // 2], dates[-1], dates[-1] + 1]
+
+        for start in year_bounds:
+            for end in year_bounds:
+                expected = sorted((book for book in visible if (start is None or manager.search_isbn_data(book.isbn).published_year >= start) and (end is None or manager.search_isbn_data(book.isbn).published_year <= end)),
+                                  key=lambda book: (manager.search_isbn_data(book.isbn).published_year, book.isbn, book.book_id))
+                self.assertEqual(manager.search_books_by_published_year(start, end), expected, (start, end))
+
+        for start in date_bounds:
+            for end in date_bounds:
+                expected = sorted((book for book in visible if (start is None or book.register_date >= start) and (end is None or book.register_date <= end)),
+                                  key=lambda book: (book.register_date, book.book_id))
+                self.assertEqual(manager.search_books_by_register_date(start, end), expected, (start, end))
+
+    def test_ranges_match_brute_force_after_edits(self):
+        manager = self.read_files()
+        manager.set_today(max(borrow.borrow_date for borrow in manager.borrow_table))
+        self.assert_ranges(manager)
+        rng = random.Random(5)
+        isbns = sorted({book.isbn for book in manager.book_table}) # update_book은 책이 있는 ISBN만 수정
+
+        # 출판년도 수정(같은 연도, 최신 연도 포함)과 같은 ISBN의 책 추가를 날짜를 바꿔가며 반복
+        for step in range(12):
+            isbn = rng.choice(isbns)
+            if step % 3 == 2:
+                self.assertTrue(self.answer(manager.add_book, f"{isbn:02d}", "Y"))
+            else:
+                self.edit_year(manager, isbn, rng.choice([1791, 1859, 1943, 1954, 2000, manager.today.year]))
+            manager.set_today(manager.today + rng.randrange(3))
+            self.assert_ranges(manager)
+
+        reloaded = self.read_files()
+        reloaded.set_today(manager.today)
+        self.assertEqual([str(book) for book in reloaded.search_books_by_published_year()], [str(book) for book in manager.search_books_by_published_year()])
+        self.assertEqual([str(book) for book in reloaded.search_books_by_register_date()], [str(book) for book in manager.search_books_by_register_date()])
+
+
+""" ========== 출판사, 출판 연대, 저자별 분류 ========== """
+class CatalogFacetsTest(RepoDataTestCase):
+    # 책 목록에서 직접 센 기준별 (값, 권수), 권수가 많은 순서
+    def brute_force_facets(self, manager: DataManager, books: list) -> dict[str, list[tuple[int, int]]]:
+        counts = {kind: Counter() for kind in ("publisher", "decade", "author")}
+        for book in books:
+            isbn_data = manager.search_isbn_data(book.isbn)
+            counts["publisher"][isbn_data.publisher_id] += 1
+            counts["decade"][isbn_data.published_year // 10 * 10] += 1
+            counts["author"].update(manager.search_author_ids_by_isbn(book.isbn))
+        return {kind: sorted(counter.items(), key=lambda item: (-item[1], item[0])) for kind, counter in counts.items()}
+
+    def assert_facets(self, manager: DataManager, rng: random.Random):
+        visible = list(manager.live_books.values())
+        self.assertEqual(manager.get_facet_counts(), self.brute_force_facets(manager, visible))
+        for _ in range(5):
+            books = sorted(rng.sample(visible, rng.randrange(len(visible) + 1)), key=lambda book: book.book_id)
+            self.assertEqual(manager.get_facet_counts(books), self.brute_force_facets(manager, books))
+
+    def test_counts_follow_add_delete_and_author_edits(self):
+        manager = self.read_files()
+        rng = random.Random(9)
+        delete_dates = sorted(book.delete_date for book in manager.book_table if book.deleted)
+
+        # 삭제 날짜가 지나지 않아 아직 보이는 책이 있는 날부터 시작
+        manager.set_today(delete_dates[0] - 1)
+        facets = manager.get_facets()
+        self.assert_facets(manager, rng)
+
+        # 책 추가, 삭제 날짜 경과, 오늘 삭제는 분류를 다시 만들지 않고 갱신
+        isbn = manager.book_table[0].isbn
+        self.assertTrue(self.answer(manager.add_book, f"{isbn:02d}", "Y"))
+        self.assertIs(manager.facets, facets)
+        self.assert_facets(manager, rng)
+
+        manager.set_today(delete_dates[-1])
+        self.assertIs(manager.facets, facets)
+        self.assert_facets(manager, rng)
+
+        book = next(book for book in manager.live_books.values() if book.book_id not in manager.open_borrows)
+        with mock.patch("builtins.input", return_value="Y"), mock.patch("builtins.print"):
+            self.assertTrue(manager.confirm_delete(book.book_id))
+        self.assertIs(manager.facets, facets)
+        self.assert_facets(manager, rng)
+
+        # 저자 수정은 분류를 다시 만듦 (저자 추가, 제거, 저자 없음)
+        for author_ids in ([2, 3], [3], []):
+            isbn = next(iter(manager.live_books.values())).isbn
+            manager.replace_isbn_authors(isbn, author_ids)
+            self.assertEqual(sorted(manager.search_author_ids_by_isbn(isbn)), author_ids)
+            self.assert_facets(manager, rng)
+
+        # update_book으로 출판년도와 저자를 함께 수정
+        isbn_data = manager.search_isbn_data(isbn)
+        publisher = manager.search_publisher_by_id(isbn_data.publisher_id)
+        self.assertTrue(self.answer(manager.update_book, f"{isbn:02d}", isbn_data.title, "톨킨 #3 & 생택쥐페리 #2", publisher.name, "2001", "Y"))
+        self.assertEqual(sorted(manager.search_author_ids_by_isbn(isbn)), [2, 3])
+        self.assert_facets(manager, rng)
+
+
+""" ========== 책 ID 비트셋 ========== """
+class BitsetTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(bits_from_ids([]), 0)
+        self.assertEqual(ids_from_bits(0), [])
+
+    def test_round_trip_across_word_boundaries(self):
+        for ids in ([0], [63], [64], [63, 64, 127, 128], [7, 8, 200, 10**6], list(range(0, 1000, 3))):
+            bits = bits_from_ids(ids)
+            self.assertEqual(bits, sum(1 << i for i in ids))
+            self.assertEqual(ids_from_bits(bits), sorted(ids))
+
+    def test_duplicates_and_generator(self):
+        self.assertEqual(ids_from_bits(bits_from_ids(i for i in (5, 1, 5, 70))), [1, 5, 70])
+
+    def test_random_sets(self):
+        rng = random.Random(3)
+        for _ in range(50):
+            ids = set(rng.sample(range(5000), rng.randrange(1, 100)))
+            self.assertEqual(ids_from_bits(bits_from_ids(ids)), sorted(ids))
+
+
+""" ========== 제목 n-gram 인덱스 ========== """
+class TitleNgramIndexTest(unittest.TestCase):
+    TITLES = {1: "파이썬 프로그래밍", 2: "자료구조와 알고리즘", 3: "파이썬 알고리즘", 4: "A", 5: "데이터베이스"}
+
+    def setUp(self):
+        self.index = TitleNgramIndex(n=2)
+        for isbn, title in self.TITLES.items():
+            self.index.add(isbn, title)
+
+    def brute_force(self, text: str) -> list[int]:
+        return sorted(isbn for isbn, title in self.index.titles.items() if text in title)
+
+    def test_search_matches_substring_scan(self):
+        for text in ("파이썬", "알고리즘", "썬 알", "구조와", "없는 제목", "베이스"):
+            self.assertEqual(sorted(self.index.search(text)), self.brute_force(text), text)
+
+    def test_query_shorter_than_n(self):
+        self.assertEqual(sorted(self.index.search("A")), [4])
+        self.assertEqual(sorted(self.index.search("알")), [2, 3])
+        self.assertEqual(sorted(self.index.search("")), sorted(self.TITLES))
+
+    def test_remove(self):
+        self.index.remove(3)
+        self.assertEqual(sorted(self.index.search("파이썬")), [1])
+        self.assertEqual(sorted(self.index.search("알고리즘")), [2])
+        self.assertTrue(all(3 not in isbns for isbns in self.index.isbns_by_gram.values()))
+        
+        # 다른 제목에 없는 n-gram은 인덱스에서 빠짐
+        self.index.remove(5)
+        self.assertEqual(self.index.search("데이터"), [])
+        self.assertNotIn("베이", self.index.isbns_by_gram)
+
+
+""" ========== 조건 검색 (비트셋 AND) ========== """
+class QueryBooksTest(RepoDataTestCase):
+    TITLES = [None, "", "도시", "왕", "반지의 제왕", "이야기", "없는 제목"]
+
+    # 책 테이블과 대출 테이블을 직접 훑어서 조건을 확인
+    def brute_force(self, manager: DataManager, title: str, publisher: str, available: bool, include_deleted: bool) -> list[int]:
+        borrowed = {borrow.book_id for borrow in manager.borrow_table if borrow.actual_return_date is None}
+        book_ids = []
+        for book in manager.book_table:
+            isbn_data = manager.search_isbn_data(book.isbn)
+            if not include_deleted and book.deleted and book.delete_date <= manager.today:
+                continue
+            if title is not None and title not in isbn_data.title:
+                continue
+            if publisher is not None and manager.search_publisher_by_id(isbn_data.publisher_id).name != publisher:
+                continue
+            if available is not None and (book.book_id not in borrowed) != available:
+                continue
+            book_ids.append(book.book_id)
+        return book_ids
+
+    def assert_queries(self, manager: DataManager):
+        publishers = [None, "없는 출판사"] + [publisher.name for publisher in manager.publisher_table]
+        for title in self.TITLES:
+            for publisher in publishers:
+                for available in (None, True, False):
+                    for include_deleted in (False, True):
+                        books = manager.query_books(title=title, publisher=publisher, available=available, include_deleted=include_deleted)
+                        expected = self.brute_force(manager, title, publisher, available, include_deleted)
+                        self.assertEqual([book.book_id for book in books], expected, (title, publisher, available, include_deleted))
+
+    def test_query_matches_brute_force_after_changes(self):
+        manager = self.read_files()
+        delete_dates = sorted(book.delete_date for book in manager.book_table if book.deleted)
+        manager.set_today(delete_dates[0] - 1)
+        self.assert_queries(manager)
+
+        # 책 추가
+        isbn = manager.book_table[0].isbn
+        self.assertTrue(self.answer(manager.add_book, f"{isbn:02d}", "Y"))
+        self.assert_queries(manager)
+
+        # 대출, 반납
+        book = next(book for book in manager.live_books.values() if book.book_id not in manager.open_borrows)
+        with mock.patch("builtins.print"):
+            borrow = manager.process_borrow(book.book_id, manager.user_table[0].user_id)
+            self.assert_queries(manager)
+            manager.process_return(borrow)
+        self.assert_queries(manager)
+
+        # 제목과 출판사 수정 (새 출판사)
+        isbn_data = manager.search_isbn_data(isbn)
+        authors = " & ".join(f"{manager.search_author_by_id(author_id).name} #{author_id}" for author_id in manager.search_author_ids_by_isbn(isbn))
+        self.assertTrue(self.answer(manager.update_book, f"{isbn:02d}", "왕과 도시", authors, "없는 출판사", str(isbn_data.published_year), "Y"))
+        self.assert_queries(manager)
+
+        # 삭제 날짜 경과, 오늘 삭제
+        manager.set_today(delete_dates[-1])
+        self.assert_queries(manager)
+        with mock.patch("builtins.input", return_value="Y"), mock.patch("builtins.print"):
+            self.assertTrue(manager.confirm_delete(book.book_id))
+        self.assert_queries(manager)
+
+
+
+""" ========== 비슷한 이름 검색 (편집 거리, BK-tree) ========== """
+class SimilarNameTest(unittest.TestCase):
+    def test_edit_distance(self):
+        for a, b, expected in (("", "", 0), ("", "abc", 3), ("kitten", "sitting", 3), ("flaw", "lawn", 2), ("김철수", "김철수", 0), ("김철수", "김찰수", 1), ("abc", "cab", 2)):
+            self.assertEqual(edit_distance(a, b), expected, (a, b))
+            self.assertEqual(edit_distance(b, a), expected, (b, a))
+
+    def test_bk_tree_matches_brute_force(self):
+        rng = random.Random(11)
+        words = {"".join(rng.choice("abcd") for _ in range(rng.randrange(1, 7))) for _ in range(300)}
+        tree = BKTree()
+        for word in words:
+            tree.add(word)
+        tree.add(next(iter(words)))
+        
+        for _ in range(50):
+            query = "".join(rng.choice("abcde") for _ in range(rng.randrange(0, 8)))
+            for max_distance in (0, 1, 2):
+                expected = sorted((edit_distance(query, word), word) for word in words if edit_distance(query, word) <= max_distance)
+                self.assertEqual(tree.search(query, max_distance), expected, (query, max_distance))
+
+    def test_empty_tree(self):
+        self.assertEqual(BKTree().search("abc", 2), [])
+
+    def test_similar_titles(self):
+        index = TitleNgramIndex(n=2)
+        for isbn, title in {1: "파이썬 프로그래밍", 2: "파이썬", 3: "자바 프로그래밍", 4: "데이터베이스"}.items():
+            index.add(isbn, title)
+        
+        # "파이선" (오타)의 n-gram {파이, 이선} 중 "파이"만 일치
+        self.assertEqual(index.similar("파이선", 0.5), [(0.5, 2), (0.5, 1)])
+        self.assertEqual(index.similar("파이선", 0.6), [])
+        self.assertEqual([isbn for _, isbn in index.similar("프로그래밍 책", 0.5)], [3, 1])
+        self.assertEqual(index.similar("파", 0.5), [])
+
+
+""" ========== 자동 완성 (정렬 배열) ========== """
+class PrefixIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = PrefixIndex(["파이썬", "파이썬 입문", "파도", "자바", "파이썬"])
+
+    def test_complete_in_sorted_order(self):
+        self.assertEqual(self.index.complete("파", 10), ["파도", "파이썬", "파이썬 입문"])
+        self.assertEqual(self.index.complete("파이", 1), ["파이썬"])
+        self.assertEqual(self.index.complete("", 2), ["자바", "파도"])
+        self.assertEqual(self.index.complete("하", 10), [])
+        self.assertEqual(self.index.complete("파이썬 입문서", 10), [])
+
+    def test_duplicates_are_counted(self):
+        self.assertEqual(self.index.counts["파이썬"], 2)
+        self.assertEqual(self.index.words.count("파이썬"), 1)
+        
+        # 같은 문자열이 남아있는 동안은 계속 완성됨
+        self.index.remove("파이썬")
+        self.assertEqual(self.index.complete("파이", 10), ["파이썬", "파이썬 입문"])
+        self.index.remove("파이썬")
+        self.assertEqual(self.index.complete("파이", 10), ["파이썬 입문"])
+        self.assertNotIn("파이썬", self.index.counts)
+
+    def test_add_keeps_order(self):
+        for word in ("파랑", "자바", "가나다"):
+            self.index.add(word)
+        
+        self.assertEqual(self.index.words, sorted(self.index.counts))
+        self.assertEqual(self.index.counts["자바"], 2)
+        self.assertEqual(self.index.complete("파", 2), ["파도", "파랑"])
+
+
+if __name__ == "__main__":
+    unittest.main()
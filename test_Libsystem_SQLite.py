@@ -0,0 +1,83 @@
+import os
+import shutil
+import unittest
+from unittest import mock
+from os.path import join as opj
+
+from Libsystem_Main import DataManager, DATA_FILE_NAMES
+from Libsystem_SQLite import SQLiteDataManager, SQLiteStorage, import_data_files, export_data_files, to_row, SQLITE_FILE_NAME
+from Libsystem_TestSupport import RepoDataTestCase, REPO_PATH
+
+
+# 테이블별 행 목록 (순서와 무관하게 비교)
+def table_rows(manager: DataManager) -> dict[str, list[tuple]]:
+    return {table_name: sorted(to_row(table_name, record) for record in getattr(manager, f"{table_name}_table")) for table_name in DATA_FILE_NAMES}
+
+
+""" ========== 데이터 파일 <-> 데이터베이스 ========== """
+class SQLiteRoundTripTest(RepoDataTestCase):
+    def open_manager(self) -> SQLiteDataManager:
+        manager = SQLiteDataManager(file_path=self.temp_dir.name)
+        self.addCleanup(manager.storage.close)
+        manager.load_configuration()
+        passed, message = manager.read_data_files(verbose=False)
+        self.assertTrue(passed, message)
+        return manager
+
+    def test_import_then_export_keeps_every_row(self):
+        expected = table_rows(self.read_files())
+
+        storage = SQLiteStorage(opj(self.temp_dir.name, "data", SQLITE_FILE_NAME))
+        self.addCleanup(storage.close)
+        self.assertEqual(import_data_files(self.temp_dir.name, storage), (True, ""))
+        self.assertFalse(storage.is_empty())
+
+        export_path = opj(self.temp_dir.name, "export")
+        os.makedirs(export_path)
+        shutil.copy(opj(REPO_PATH, "Libsystem_Config.json"), export_path)
+        self.assertTrue(export_data_files(export_path, storage))
+
+        self.assertEqual(table_rows(self.read_files(export_path)), expected)
+
+    def test_appended_and_changed_rows_are_saved(self):
+        manager = self.open_manager()
+        manager.set_today(max(borrow.borrow_date for borrow in manager.borrow_table) + 40)
+
+        # 대출 추가 -> 연체 반납 (대출 행 변경, 연체 패널티 추가)
+        book = next(book for book in manager.book_table if not book.deleted and book.book_id not in manager.open_borrows)
+        user = manager.user_table[0]
+        self.assertTrue(self.answer(manager.borrow_book, user.name, user.phone_number, str(book.book_id), "Y"))
+        borrow = manager.open_borrows[book.book_id]
+        manager.set_today(manager.today + 30)
+        self.assertTrue(self.answer(manager.return_book, str(book.book_id), "Y"))
+
+        # 도서 삭제 (도서 행 변경)
+        with mock.patch("builtins.input", return_value="Y"), mock.patch("builtins.print"):
+            self.assertTrue(manager.confirm_delete(book.book_id))
+        self.assertTrue(manager.fetch_data_file())
+
+        reloaded = self.open_manager()
+        self.assertEqual(table_rows(reloaded), table_rows(manager))
+        self.assertTrue(reloaded.search_book_by_id(book.book_id, include_deleted=True).deleted)
+        self.assertIsNotNone(reloaded.search_borrow_by_id(borrow.borrow_id).actual_return_date)
+        self.assertEqual(len(reloaded.overdue_penalty_table), len(manager.overdue_penalty_table))
+
+    def test_isbn_author_edit_rewrites_only_that_isbn(self):
+        manager = self.open_manager()
+        manager.set_today(max(borrow.borrow_date for borrow in manager.borrow_table))
+        isbn_author_table = manager.isbn_author_table
+        isbn_data = manager.search_isbn_data(isbn_author_table[0].isbn)
+        publisher = manager.search_publisher_by_id(isbn_data.publisher_id)
+        other_links = sorted(to_row("isbn_author", link) for link in isbn_author_table if link.isbn != isbn_data.isbn)
+
+        edited = self.answer(manager.update_book, f"{isbn_data.isbn:02d}", isbn_data.title, "생택쥐페리 #2 & 톨킨 #3", publisher.name, str(isbn_data.published_year), "Y")
+        self.assertTrue(edited)
+        self.assertIs(manager.isbn_author_table, isbn_author_table)
+
+        reloaded = self.open_manager()
+        self.assertEqual(sorted(reloaded.search_author_ids_by_isbn(isbn_data.isbn)), [2, 3])
+        self.assertEqual(sorted(to_row("isbn_author", link) for link in reloaded.isbn_author_table if link.isbn != isbn_data.isbn), other_links)
+
+
+if __name__ == "__main__":
+    unittest.main()